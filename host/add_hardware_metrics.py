@@ -1,7 +1,26 @@
 """
 Add hardware-specific metrics to existing test results
 Computes performance and efficiency metrics from existing data
+
+All metrics are computed with vectorized column operations (no per-row or
+per-group Python callbacks), so the script scales to millions of result rows.
+
+Processing is incremental: only rows appended to the results CSV since the
+last run are parsed (from the byte offset recorded in a sidecar state file),
+enhanced, and appended to the enhanced CSV. The state also keeps the per-case
+FP32 references, the per-precision best-conditioned baselines and the running
+Pareto maximum, so new rows are scored against the full history. If new rows
+would change values that were already written (a new best-conditioned case, a
+new Pareto maximum, or an FP32 reference arriving after its INT8/FP16 rows),
+or if the results file was rewritten, the enhanced CSV is rebuilt from scratch.
+
+Usage:
+    python add_hardware_metrics.py            # incremental update
+    python add_hardware_metrics.py --full     # force a full rebuild
 """
+import argparse
+import hashlib
+import json
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -10,215 +29,476 @@ ROOT = Path(__file__).parent.parent
 RESULTS_FILE = ROOT / "results" / "comprehensive_results.csv"
 OUTPUT_FILE = ROOT / "results" / "comprehensive_results_with_hw_metrics.csv"
 
-print("=" * 80)
-print("ADDING HARDWARE METRICS TO TEST RESULTS")
-print("=" * 80)
-
-# Load existing results
-df = pd.read_csv(RESULTS_FILE)
-print(f"\nLoaded {len(df)} test results")
+PRECISIONS = ['int8', 'fp16', 'fp32', 'fp16acc32']
+
+# Precisions scored against the FP32 row of the same case
+VS_FP32 = [p for p in PRECISIONS if p != 'fp32']
+
+# Columns produced by this script, in output order
+HW_COLUMNS = [
+    'total_operations', 'ops_per_second', 'gops', 'ops_per_elem_per_sec',
+    'effective_bits', 'snqr_db',
+    'int8_speedup_vs_fp32', 'int8_accuracy_vs_fp32',
+    'fp16_speedup_vs_fp32', 'fp16_accuracy_vs_fp32',
+    'fp16acc32_speedup_vs_fp32', 'fp16acc32_accuracy_vs_fp32',
+    'pareto_score', 'pareto_score_normalized',
+    'int8_range_utilization_pct',
+    'error_tail_concentration', 'error_outlier_ratio', 'bias_fraction',
+    'error_amplification',
+]
+
+# Bytes hashed just before the saved offset to detect a rewritten results file
+FINGERPRINT_BYTES = 4096
+
+
+def state_paths(output_file):
+    """Sidecar files holding the incremental state for an enhanced CSV."""
+    state_file = output_file.with_name(output_file.stem + '.state.json')
+    cases_file = output_file.with_name(output_file.stem + '.cases.csv')
+    return state_file, cases_file
+
+
+def empty_case_refs():
+    """Per-case table of seen precisions and the FP32 reference values."""
+    refs = pd.DataFrame({
+        'seen_int8': pd.Series(dtype=bool),
+        'seen_fp16': pd.Series(dtype=bool),
+        'seen_fp32': pd.Series(dtype=bool),
+        'seen_fp16acc32': pd.Series(dtype=bool),
+        'fp32_sim_time_sec': pd.Series(dtype=float),
+        'fp32_norm_rel_error': pd.Series(dtype=float),
+    })
+    refs.index.name = 'case_id'
+    return refs
+
+
+def empty_state():
+    return {
+        'source_columns': None,
+        'output_columns': None,
+        'offset': 0,
+        'fingerprint': None,
+        'pareto_max': None,
+        'baselines': {},
+    }
 
-# Filter only successful tests
-df_success = df[df['status'] == 'success'].copy()
-print(f"Processing {len(df_success)} successful tests")
 
 # ============================================================================
-# 1. PERFORMANCE METRICS
+# SOURCE FILE HANDLING
 # ============================================================================
 
-# Operations count: M×K×N multiply-adds = M×K×N×2 operations
-df_success['total_operations'] = df_success['M'] * df_success['K'] * df_success['N'] * 2
-
-# Operations per second
-df_success['ops_per_second'] = df_success['total_operations'] / df_success['sim_time_sec']
-
-# GOPS (Giga-operations per second)
-df_success['gops'] = df_success['ops_per_second'] / 1e9
+def file_fingerprint(path, offset):
+    """Hash of the header line and the bytes just before `offset`."""
+    h = hashlib.sha1()
+    with open(path, 'rb') as f:
+        h.update(f.readline())
+        start = max(0, offset - FINGERPRINT_BYTES)
+        f.seek(start)
+        h.update(f.read(offset - start))
+    return h.hexdigest()
+
+
+def complete_size(path):
+    """Size of the file up to and including its last newline.
+
+    The test runner appends and flushes one row at a time, so a concurrent
+    reader may see a partially written last line; it is left for next time.
+    """
+    size = path.stat().st_size
+    with open(path, 'rb') as f:
+        pos = size
+        while pos > 0:
+            step = min(65536, pos)
+            f.seek(pos - step)
+            chunk = f.read(step)
+            nl = chunk.rfind(b'\n')
+            if nl >= 0:
+                return pos - step + nl + 1
+            pos -= step
+    return 0
+
+
+def read_new_rows(path, state):
+    """Return (rows, end_offset); rows is None if a full rebuild is needed."""
+    end = complete_size(path)
+    offset = state['offset']
+    if state['source_columns'] is None or offset > end:
+        return None, end
+    if file_fingerprint(path, offset) != state['fingerprint']:
+        return None, end
+    with open(path, 'rb') as f:
+        header = f.readline().decode().strip().split(',')
+    if header != state['source_columns']:
+        return None, end
+    if end == offset:
+        return pd.DataFrame(columns=header), end
+
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        rows = pd.read_csv(f, header=None, names=header,
+                           dtype={'status': str, 'category': str, 'precision': str})
+    # Drop a trailing partial line (only possible if the file grew while reading)
+    rows = rows.iloc[:count_lines(path, offset, end)]
+    return rows, end
+
+
+def count_lines(path, start, end):
+    with open(path, 'rb') as f:
+        f.seek(start)
+        return f.read(end - start).count(b'\n')
+
+
+def read_all_rows(path):
+    end = complete_size(path)
+    with open(path, 'rb') as f:
+        df = pd.read_csv(f, dtype={'status': str, 'category': str, 'precision': str})
+    df = df.iloc[:max(0, count_lines(path, 0, end) - 1)]
+    return df, end
 
-# Operations per second per output element
-df_success['ops_per_elem_per_sec'] = df_success['ops_per_second'] / (df_success['M'] * df_success['N'])
-
-print("\n[OK] Computed performance metrics")
 
 # ============================================================================
-# 2. PRECISION QUALITY METRICS
+# 1-2. PERFORMANCE AND PRECISION QUALITY METRICS
 # ============================================================================
 
-# Effective Number of Bits (ENOB)
-# ENOB = -log2(norm_rel_error), capped at precision bits
-df_success['effective_bits'] = -np.log2(df_success['norm_rel_error'].replace(0, 1e-10))
-df_success.loc[df_success['effective_bits'] > 32, 'effective_bits'] = 32  # Cap at FP32
-
-# Signal-to-Quantization-Noise Ratio (SNQR) in dB
-# Similar to SNR but specifically for quantization noise
-df_success['snqr_db'] = df_success['snr_db']  # Alias for now
+def compute_performance_metrics(df):
+    # Operations count: M×K×N multiply-adds = M×K×N×2 operations
+    df['total_operations'] = df['M'] * df['K'] * df['N'] * 2
 
-print("[OK] Computed precision quality metrics")
-
-# ============================================================================
-# 3. CROSS-PRECISION COMPARISON
-# ============================================================================
+    # Operations per second
+    df['ops_per_second'] = df['total_operations'] / df['sim_time_sec']
 
-# For each case_id, compute speedup and accuracy ratios
-def compute_cross_precision_metrics(group):
-    """Compute metrics comparing precisions within same case_id"""
+    # GOPS (Giga-operations per second)
+    df['gops'] = df['ops_per_second'] / 1e9
 
-    # Reference precision: FP32
-    fp32 = group[group['precision'] == 'fp32']
-    fp16 = group[group['precision'] == 'fp16']
-    int8 = group[group['precision'] == 'int8']
+    # Operations per second per output element
+    df['ops_per_elem_per_sec'] = df['ops_per_second'] / (df['M'] * df['N'])
 
-    # Initialize new columns
-    for col in ['int8_speedup_vs_fp32', 'int8_accuracy_vs_fp32',
-                'fp16_speedup_vs_fp32', 'fp16_accuracy_vs_fp32']:
-        group[col] = np.nan
 
-    if len(fp32) > 0:
-        fp32_time = fp32.iloc[0]['sim_time_sec']
-        fp32_error = fp32.iloc[0]['norm_rel_error']
+def compute_quality_metrics(df):
+    # Effective Number of Bits (ENOB)
+    # ENOB = -log2(norm_rel_error), capped at precision bits
+    df['effective_bits'] = -np.log2(df['norm_rel_error'].replace(0, 1e-10))
+    df.loc[df['effective_bits'] > 32, 'effective_bits'] = 32  # Cap at FP32
 
-        # INT8 vs FP32
-        if len(int8) > 0:
-            int8_idx = int8.index[0]
-            group.loc[int8_idx, 'int8_speedup_vs_fp32'] = fp32_time / int8.iloc[0]['sim_time_sec']
-            group.loc[int8_idx, 'int8_accuracy_vs_fp32'] = int8.iloc[0]['norm_rel_error'] / fp32_error if fp32_error > 0 else np.nan
+    # Signal-to-Quantization-Noise Ratio (SNQR) in dB
+    # Similar to SNR but specifically for quantization noise
+    df['snqr_db'] = df['snr_db']  # Alias for now
 
-        # FP16 vs FP32
-        if len(fp16) > 0:
-            fp16_idx = fp16.index[0]
-            group.loc[fp16_idx, 'fp16_speedup_vs_fp32'] = fp32_time / fp16.iloc[0]['sim_time_sec']
-            group.loc[fp16_idx, 'fp16_accuracy_vs_fp32'] = fp16.iloc[0]['norm_rel_error'] / fp32_error if fp32_error > 0 else np.nan
 
-    return group
+# ============================================================================
+# 3. CROSS-PRECISION COMPARISON
+# ============================================================================
 
-df_success = df_success.groupby('case_id').apply(compute_cross_precision_metrics).reset_index(drop=True)
+def first_in_case(df, case_refs):
+    """Mask of rows that are the first of their precision within a case_id.
+
+    Earlier runs count: a row whose (case_id, precision) was already seen in
+    the enhanced store is not a first occurrence.
+    """
+    first = ~df.duplicated(['case_id', 'precision'])
+    for prec in PRECISIONS:
+        seen = df['case_id'].map(case_refs[f'seen_{prec}']).fillna(False).astype(bool)
+        first &= ~((df['precision'] == prec) & seen)
+    return first
+
+
+def update_case_refs(df, first, case_refs):
+    """Fold the first occurrences in `df` into the per-case reference table."""
+    first_rows = df[first]
+    if len(first_rows) == 0:
+        return case_refs
+    # (case_id, precision) is unique among first occurrences, so no aggregation
+    table = first_rows.pivot(index='case_id', columns='precision',
+                             values=['sim_time_sec', 'norm_rel_error'])
+
+    refs = case_refs.reindex(case_refs.index.union(table.index))
+    for prec in PRECISIONS:
+        col = f'seen_{prec}'
+        seen = table.index.isin(first_rows.loc[first_rows['precision'] == prec, 'case_id'])
+        refs[col] = refs[col].fillna(False).astype(bool) | \
+            pd.Series(seen, index=table.index).reindex(refs.index, fill_value=False)
+    for col in ['sim_time_sec', 'norm_rel_error']:
+        if (col, 'fp32') in table.columns:
+            refs[f'fp32_{col}'] = refs[f'fp32_{col}'].combine_first(
+                table[(col, 'fp32')].reindex(refs.index))
+    return refs
+
+
+def compute_cross_precision_metrics(df, first, case_refs):
+    """Speedup and accuracy of INT8/FP16/FP16ACC32 relative to FP32 of the same case_id.
+
+    Only the first non-FP32 row of each case is scored, against the first
+    FP32 row of that case. `case_refs` must already include `df`.
+    """
+    fp32_time = df['case_id'].map(case_refs['fp32_sim_time_sec'])
+    fp32_error = df['case_id'].map(case_refs['fp32_norm_rel_error'])
+
+    speedup = fp32_time / df['sim_time_sec']
+    accuracy = (df['norm_rel_error'] / fp32_error).where(fp32_error > 0)
+
+    for prec in VS_FP32:
+        mask = first & (df['precision'] == prec)
+        df[f'{prec}_speedup_vs_fp32'] = speedup.where(mask)
+        df[f'{prec}_accuracy_vs_fp32'] = accuracy.where(mask)
 
-print("[OK] Computed cross-precision comparisons")
 
 # ============================================================================
 # 4. EFFICIENCY METRICS
 # ============================================================================
 
-# Pareto score: Balance of speed and accuracy
-# Higher is better (fast AND accurate)
-df_success['pareto_score'] = (1.0 / df_success['norm_rel_error'].replace(0, 1e-10)) * df_success['gops']
+def compute_pareto_score(df):
+    # Pareto score: Balance of speed and accuracy
+    # Higher is better (fast AND accurate)
+    df['pareto_score'] = (1.0 / df['norm_rel_error'].replace(0, 1e-10)) * df['gops']
+
 
-# Normalize pareto score to 0-100 range for easier interpretation
-pareto_max = df_success['pareto_score'].max()
-df_success['pareto_score_normalized'] = 100 * df_success['pareto_score'] / pareto_max
+def normalize_pareto_score(df, pareto_max):
+    # Normalize pareto score to 0-100 range for easier interpretation
+    df['pareto_score_normalized'] = 100 * df['pareto_score'] / pareto_max
 
-print("[OK] Computed efficiency metrics")
 
 # ============================================================================
 # 5. RANGE UTILIZATION (INT8 only)
 # ============================================================================
 
-# For INT8, compute what percentage of -128 to 127 range is used
-def compute_int8_range_utilization(row):
-    if row['precision'] != 'int8':
-        return np.nan
-
+def compute_int8_range_utilization(df):
+    # For INT8, compute what percentage of -128 to 127 range is used
     # Output range
-    output_range = max(abs(row['C_out_mean'] - 3*row['C_out_std']),
-                      abs(row['C_out_mean'] + 3*row['C_out_std']))
+    output_range = np.maximum((df['C_out_mean'] - 3 * df['C_out_std']).abs(),
+                              (df['C_out_mean'] + 3 * df['C_out_std']).abs())
 
     # INT8 range is -128 to 127
     int8_max = 127
-    utilization = min(100.0, 100.0 * output_range / int8_max)
-
-    return utilization
+    utilization = np.fmin(100.0, 100.0 * output_range / int8_max)
 
-df_success['int8_range_utilization_pct'] = df_success.apply(compute_int8_range_utilization, axis=1)
+    df['int8_range_utilization_pct'] = utilization.where(df['precision'] == 'int8')
 
-print("[OK] Computed INT8 range utilization")
 
 # ============================================================================
 # 6. ERROR PATTERN ANALYSIS
 # ============================================================================
 
-# Error concentration: How much error is in the tail?
-# If p99/median is large, errors are concentrated in outliers
-df_success['error_tail_concentration'] = df_success['p99_error'] / df_success['p50_error'].replace(0, 1e-10)
+def compute_error_patterns(df):
+    # Error concentration: How much error is in the tail?
+    # If p99/median is large, errors are concentrated in outliers
+    df['error_tail_concentration'] = df['p99_error'] / df['p50_error'].replace(0, 1e-10)
 
-# Outlier ratio: RMSE/MAE (>1.4 means significant outliers)
-df_success['error_outlier_ratio'] = df_success['rmse'] / df_success['mae'].replace(0, 1e-10)
+    # Outlier ratio: RMSE/MAE (>1.4 means significant outliers)
+    df['error_outlier_ratio'] = df['rmse'] / df['mae'].replace(0, 1e-10)
 
-# Bias significance: How much of MAE is systematic bias?
-df_success['bias_fraction'] = abs(df_success['mean_bias']) / df_success['mae'].replace(0, 1e-10)
+    # Bias significance: How much of MAE is systematic bias?
+    df['bias_fraction'] = abs(df['mean_bias']) / df['mae'].replace(0, 1e-10)
 
-print("[OK] Computed error pattern metrics")
 
 # ============================================================================
 # 7. CONDITION NUMBER SENSITIVITY
 # ============================================================================
 
-# Error amplification: How much does conditioning affect error?
-# Compare error to best-case (lowest condition number) for same precision
-def compute_cond_sensitivity(group):
-    """Compute how error grows with condition number for each precision"""
+def batch_baselines(df):
+    """Per-precision row count and best-conditioned (cond, error) of `df`."""
+    baselines = {}
+    counts = df['precision'].value_counts()
+    valid = df.dropna(subset=['actual_cond_A'])
+    # Stable sort keeps the earliest row among equal condition numbers (idxmin)
+    best = valid.sort_values('actual_cond_A', kind='stable') \
+                .drop_duplicates('precision')
+    for prec, count in counts.items():
+        row = best[best['precision'] == prec]
+        baselines[prec] = {
+            'count': int(count),
+            'min_cond': float(row['actual_cond_A'].iloc[0]) if len(row) else None,
+            'baseline_error': float(row['norm_rel_error'].iloc[0]) if len(row) else None,
+        }
+    return baselines
+
+
+def compute_cond_sensitivity(df, baselines):
+    # Error amplification: How much does conditioning affect error?
+    # Compare error to best-case (lowest condition number) for same precision
+    count = df['precision'].map({p: b['count'] for p, b in baselines.items()})
+    baseline = df['precision'].map(
+        {p: b['baseline_error'] for p, b in baselines.items()}).astype(float)
+    amplification = df['norm_rel_error'] / baseline
+    df['error_amplification'] = amplification.where((count >= 2) & (baseline > 0))
 
-    group['error_amplification'] = np.nan
-
-    if len(group) < 2:
-        return group
-
-    # Find lowest condition number case
-    min_cond_idx = group['actual_cond_A'].idxmin()
-    baseline_error = group.loc[min_cond_idx, 'norm_rel_error']
-
-    if baseline_error > 0:
-        group['error_amplification'] = group['norm_rel_error'] / baseline_error
-
-    return group
-
-df_success = df_success.groupby('precision').apply(compute_cond_sensitivity).reset_index(drop=True)
-
-print("[OK] Computed condition number sensitivity")
 
 # ============================================================================
-# SAVE RESULTS
+# BATCH PROCESSING
 # ============================================================================
 
-# Merge back with original dataframe (including failed tests)
-df_all = df.copy()
-
-# Add new columns to failed tests as NaN
-new_cols = [col for col in df_success.columns if col not in df.columns]
-for col in new_cols:
-    df_all[col] = np.nan
-
-# Update successful test rows
-df_all.update(df_success)
-
-# Save enhanced results
-df_all.to_csv(OUTPUT_FILE, index=False)
-
-print("\n" + "=" * 80)
-print(f"Enhanced results saved to:")
-print(f"  {OUTPUT_FILE}")
-print("=" * 80)
-
-# Print summary statistics
-print("\n--- PERFORMANCE SUMMARY ---")
-print(f"Average GOPS by precision:")
-for prec in ['int8', 'fp16', 'fp32']:
-    gops_mean = df_success[df_success['precision'] == prec]['gops'].mean()
-    print(f"  {prec:5s}: {gops_mean:.4f} GOPS")
-
-print("\n--- QUALITY SUMMARY ---")
-print(f"Average Effective Bits by precision:")
-for prec in ['int8', 'fp16', 'fp32']:
-    enob_mean = df_success[df_success['precision'] == prec]['effective_bits'].mean()
-    print(f"  {prec:5s}: {enob_mean:.2f} bits")
-
-print("\n--- SPEEDUP SUMMARY ---")
-int8_speedup = df_success['int8_speedup_vs_fp32'].mean()
-fp16_speedup = df_success['fp16_speedup_vs_fp32'].mean()
-print(f"  INT8 vs FP32: {int8_speedup:.2f}× faster (avg)")
-print(f"  FP16 vs FP32: {fp16_speedup:.2f}× faster (avg)")
-
-print("\n--- NEW COLUMNS ADDED ---")
-for col in sorted(new_cols):
-    print(f"  - {col}")
-
-print("\n" + "=" * 80)
+def enhance(df, state, case_refs):
+    """Compute all hardware metrics for `df` against the prior state.
+
+    Returns (df_all, df_success, state, case_refs), or None if the new rows
+    invalidate previously written values and a full rebuild is required.
+    """
+    df_success = df[df['status'] == 'success'].copy()
+
+    compute_performance_metrics(df_success)
+    compute_quality_metrics(df_success)
+    print("[OK] Computed performance and precision quality metrics")
+
+    # Invalidation: an FP32 reference for a case whose non-FP32 rows were
+    # already written without one
+    first = first_in_case(df_success, case_refs)
+    late_fp32 = df_success.loc[first & (df_success['precision'] == 'fp32'), 'case_id']
+    prior = case_refs.reindex(late_fp32)
+    if any(prior[f'seen_{p}'].fillna(False).astype(bool).any() for p in VS_FP32):
+        return None
+
+    case_refs = update_case_refs(df_success, first, case_refs)
+    compute_cross_precision_metrics(df_success, first, case_refs)
+    print("[OK] Computed cross-precision comparisons")
+
+    compute_pareto_score(df_success)
+    batch_max = df_success['pareto_score'].max()
+    pareto_max = state['pareto_max']
+    if pareto_max is not None and not np.isnan(pareto_max):
+        if batch_max > pareto_max:
+            return None
+    elif not np.isnan(batch_max):
+        pareto_max = float(batch_max)
+    normalize_pareto_score(df_success, pareto_max if pareto_max is not None else np.nan)
+    print("[OK] Computed efficiency metrics")
+
+    compute_int8_range_utilization(df_success)
+    print("[OK] Computed INT8 range utilization")
+
+    compute_error_patterns(df_success)
+    print("[OK] Computed error pattern metrics")
+
+    baselines = dict(state['baselines'])
+    for prec, new in batch_baselines(df_success).items():
+        old = baselines.get(prec)
+        if old is None or old['count'] == 0:
+            baselines[prec] = new
+            continue
+        # Earlier rows were written with NaN (single row) or another baseline
+        if old['count'] == 1:
+            return None
+        if new['min_cond'] is not None and (old['min_cond'] is None or
+                                            new['min_cond'] < old['min_cond']):
+            return None
+        baselines[prec] = dict(old, count=old['count'] + new['count'])
+    compute_cond_sensitivity(df_success, baselines)
+    print("[OK] Computed condition number sensitivity")
+
+    # Merge back with the batch (failed tests keep NaN for the new columns)
+    df_all = df.copy()
+    new_cols = [col for col in HW_COLUMNS if col not in df.columns]
+    for col in new_cols:
+        df_all[col] = np.nan
+    df_all.loc[df_success.index, HW_COLUMNS] = df_success[HW_COLUMNS]
+
+    state = dict(state, pareto_max=None if pareto_max is None or np.isnan(pareto_max)
+                 else float(pareto_max), baselines=baselines)
+    return df_all, df_success, state, case_refs
+
+
+def load_state(output_file):
+    state_file, cases_file = state_paths(output_file)
+    if not (state_file.exists() and cases_file.exists() and output_file.exists()):
+        return empty_state(), empty_case_refs()
+    with open(state_file) as f:
+        state = json.load(f)
+    case_refs = pd.read_csv(cases_file, index_col='case_id')
+    # State written before a precision was added: rebuild
+    if list(case_refs.columns) != list(empty_case_refs().columns):
+        return empty_state(), empty_case_refs()
+    return state, case_refs
+
+
+def save_state(output_file, state, case_refs):
+    state_file, cases_file = state_paths(output_file)
+    case_refs.to_csv(cases_file)
+    with open(state_file, 'w') as f:
+        json.dump(state, f, indent=2)
+
+
+def full_rebuild(results_file, output_file):
+    print("Rebuilding enhanced results from scratch")
+    df, end = read_all_rows(results_file)
+    print(f"\nLoaded {len(df)} test results")
+    state = empty_state()
+    df_all, df_success, state, case_refs = enhance(df, state, empty_case_refs())
+    df_all.to_csv(output_file, index=False)
+    state.update(source_columns=list(df.columns), output_columns=list(df_all.columns),
+                 offset=end, fingerprint=file_fingerprint(results_file, end))
+    save_state(output_file, state, case_refs)
+    return df_success, list(df_all.columns)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--input', type=str, default=str(RESULTS_FILE),
+                        help='Input CSV file with test results')
+    parser.add_argument('--output', type=str, default=str(OUTPUT_FILE),
+                        help='Enhanced CSV file (appended to incrementally)')
+    parser.add_argument('--full', action='store_true',
+                        help='Ignore saved state and rebuild the enhanced CSV')
+    args = parser.parse_args()
+
+    results_file = Path(args.input)
+    output_file = Path(args.output)
+
+    print("=" * 80)
+    print("ADDING HARDWARE METRICS TO TEST RESULTS")
+    print("=" * 80)
+
+    state, case_refs = (empty_state(), empty_case_refs()) if args.full \
+        else load_state(output_file)
+    rows, end = read_new_rows(results_file, state)
+
+    if rows is None:
+        df_success, out_cols = full_rebuild(results_file, output_file)
+    elif len(rows) == 0:
+        print("\nNo new test results since last run; enhanced results are up to date")
+        return
+    else:
+        print(f"\nLoaded {len(rows)} new test results")
+        result = enhance(rows, state, case_refs)
+        if result is None:
+            print("New rows change previously written metrics")
+            df_success, out_cols = full_rebuild(results_file, output_file)
+        else:
+            df_all, df_success, state, case_refs = result
+            df_all = df_all[state['output_columns']]
+            df_all.to_csv(output_file, mode='a', header=False, index=False)
+            state.update(offset=end, fingerprint=file_fingerprint(results_file, end))
+            save_state(output_file, state, case_refs)
+            out_cols = state['output_columns']
+
+    print(f"Processed {len(df_success)} successful tests")
+
+    print("\n" + "=" * 80)
+    print(f"Enhanced results saved to:")
+    print(f"  {output_file}")
+    print("=" * 80)
+
+    # Print summary statistics for the rows processed in this run
+    print("\n--- PERFORMANCE SUMMARY ---")
+    print(f"Average GOPS by precision:")
+    gops_mean = df_success.groupby('precision')['gops'].mean()
+    for prec in PRECISIONS:
+        print(f"  {prec:5s}: {gops_mean.get(prec, np.nan):.4f} GOPS")
+
+    print("\n--- QUALITY SUMMARY ---")
+    print(f"Average Effective Bits by precision:")
+    enob_mean = df_success.groupby('precision')['effective_bits'].mean()
+    for prec in PRECISIONS:
+        print(f"  {prec:5s}: {enob_mean.get(prec, np.nan):.2f} bits")
+
+    print("\n--- SPEEDUP SUMMARY ---")
+    for prec in VS_FP32:
+        speedup = df_success[f'{prec}_speedup_vs_fp32'].mean()
+        print(f"  {prec.upper()} vs FP32: {speedup:.2f}× faster (avg)")
+
+    print("\n--- HARDWARE METRIC COLUMNS ---")
+    for col in sorted(c for c in HW_COLUMNS if c in out_cols):
+        print(f"  - {col}")
+
+    print("\n" + "=" * 80)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,173 @@
+"""
+Shared analysis dataset for the report and plot scripts.
+
+Loads comprehensive_results.csv once, filters successful runs and
+materializes the aggregate tables every consumer needs:
+
+    results       - all rows as read from the CSV
+    success       - rows with status == 'success'
+    by_precision  - aggregates grouped by precision
+    by_category   - aggregates grouped by (precision, category)
+    by_cond_bin   - aggregates grouped by (cond_bin, precision), where cond_bin
+                    is one of 5 equal-width bins of log10(actual_cond_A)
+
+Aggregate tables have MultiIndex columns (metric, stat) with stats
+count/mean/std/min/max/median/sum, plus ('rows', 'size') for the group size.
+
+Tables are cached under results/.analysis_cache, keyed by the source file's
+SHA-1 and mtime, so repeated script runs skip CSV parsing and aggregation
+until the results file actually changes.
+"""
+import hashlib
+import json
+import os
+import pandas as pd
+import numpy as np
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+RESULTS_FILE = ROOT / "results" / "comprehensive_results.csv"
+CACHE_DIR = ROOT / "results" / ".analysis_cache"
+
+# Bump when the table layout changes so stale caches are rebuilt
+CACHE_VERSION = 1
+
+TABLES = ['results', 'success', 'by_precision', 'by_category', 'by_cond_bin']
+STATS = ['count', 'mean', 'std', 'min', 'max', 'median', 'sum']
+COND_BIN_LABELS = ['Very Low', 'Low', 'Medium', 'High', 'Very High']
+
+# Non-metric numeric columns excluded from the aggregate tables
+ID_COLUMNS = ['case_id']
+
+
+def file_digest(path):
+    h = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def aggregate(df, keys):
+    """Aggregate every numeric metric column of `df` grouped by `keys`."""
+    metrics = [c for c in df.select_dtypes(include='number').columns
+               if c not in ID_COLUMNS and c not in keys]
+    grouped = df.groupby(keys, observed=True, sort=True)
+    sizes = grouped.size().to_frame(('rows', 'size'))
+    return pd.concat([sizes, grouped[metrics].agg(STATS)], axis=1)
+
+
+def add_cond_bins(df):
+    """Rows with a usable condition number, labelled with their cond_bin."""
+    binned = df[np.isfinite(df['actual_cond_A']) & (df['actual_cond_A'] > 0)].copy()
+    if len(binned) > 0:
+        binned['cond_bin'] = pd.cut(np.log10(binned['actual_cond_A']), bins=5,
+                                    labels=COND_BIN_LABELS)
+    else:
+        binned['cond_bin'] = pd.Categorical([], categories=COND_BIN_LABELS)
+    return binned
+
+
+def build_analysis_data(df):
+    """Materialize all shared tables from a raw results DataFrame."""
+    success = df[df['status'] == 'success'].copy()
+    return {
+        'results': df,
+        'success': success,
+        'by_precision': aggregate(success, ['precision']),
+        'by_category': aggregate(success, ['precision', 'category']),
+        'by_cond_bin': aggregate(add_cond_bins(success), ['cond_bin', 'precision']),
+    }
+
+
+def cache_dir_for(path):
+    """One cache directory per source file path."""
+    key = hashlib.sha1(str(Path(path).resolve()).encode()).hexdigest()[:16]
+    return CACHE_DIR / key
+
+
+def read_cache(cdir, path, st):
+    manifest_file = cdir / 'manifest.json'
+    if not manifest_file.exists():
+        return None, None
+    with open(manifest_file) as f:
+        manifest = json.load(f)
+    if manifest.get('version') != CACHE_VERSION:
+        return None, None
+
+    if manifest['size'] != st.st_size or manifest['mtime_ns'] != st.st_mtime_ns:
+        # Touched but possibly unchanged (e.g. copied back from an archive)
+        digest = file_digest(path)
+        if digest != manifest['sha1']:
+            return None, digest
+        manifest.update(size=st.st_size, mtime_ns=st.st_mtime_ns)
+        with open(manifest_file, 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+    try:
+        return {name: pd.read_pickle(cdir / f'{name}.pkl') for name in TABLES}, None
+    except (OSError, ValueError, EOFError):
+        return None, None
+
+
+def write_cache(cdir, data, st, digest):
+    cdir.mkdir(parents=True, exist_ok=True)
+    for name in TABLES:
+        tmp = cdir / f'{name}.pkl.tmp'
+        data[name].to_pickle(tmp)
+        os.replace(tmp, cdir / f'{name}.pkl')
+    manifest = {
+        'version': CACHE_VERSION,
+        'size': st.st_size,
+        'mtime_ns': st.st_mtime_ns,
+        'sha1': digest,
+    }
+    # Manifest last, so a half-written cache is never considered valid
+    tmp = cdir / 'manifest.json.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp, cdir / 'manifest.json')
+
+
+def load_analysis_data(path=RESULTS_FILE, use_cache=True):
+    """Return the dict of shared analysis tables for a results CSV."""
+    path = Path(path)
+    st = path.stat()
+    cdir = cache_dir_for(path)
+
+    digest = None
+    if use_cache:
+        data, digest = read_cache(cdir, path, st)
+        if data is not None:
+            return data
+
+    data = build_analysis_data(pd.read_csv(path))
+    if use_cache:
+        write_cache(cdir, data, st, digest or file_digest(path))
+    return data
+
+
+def split_by_precision(df):
+    """Dict of precision -> rows, built with a single groupby pass."""
+    return {prec: group for prec, group in df.groupby('precision', sort=False)}
+
+
+def stat_table(table, metric, stats):
+    """Select `stats` of one metric as a plain DataFrame (columns = stats)."""
+    return table[metric][stats]
+
+
+if __name__ == '__main__':
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description='Build or inspect the analysis cache')
+    parser.add_argument('--input', type=str, default=str(RESULTS_FILE))
+    parser.add_argument('--no-cache', action='store_true')
+    args = parser.parse_args()
+
+    t0 = time.time()
+    data = load_analysis_data(args.input, use_cache=not args.no_cache)
+    print(f"Loaded analysis data in {time.time() - t0:.3f}s")
+    for name in TABLES:
+        print(f"  {name:13s}: {data[name].shape[0]} rows x {data[name].shape[1]} columns")
@@ -22,7 +22,7 @@ def check_progress():
         print("Results file is empty. Tests are starting...")
         return
 
-    total_expected = 42 * 3  # 42 cases × 3 precisions
+    total_expected = 42 * 4  # 42 cases × 4 precisions
     completed = len(rows)
     success_count = sum(1 for r in rows if r.get('status') == 'success')
     failed_count = completed - success_count
@@ -57,7 +57,7 @@ def check_progress():
 
     # Success rate by precision
     print("\nSuccess Rate by Precision:")
-    for prec in ['int8', 'fp16', 'fp32']:
+    for prec in ['int8', 'fp16', 'fp32', 'fp16acc32']:
         prec_rows = [r for r in rows if r.get('precision') == prec]
         if prec_rows:
             prec_success = sum(1 for r in prec_rows if r.get('status') == 'success')
@@ -1,6 +1,17 @@
 """
 Create comprehensive Excel spreadsheet from test results.
 Generates multiple sheets with formatted data, summaries, and analysis.
+
+The workbook is written in a single pass with openpyxl's write-only mode:
+rows are streamed in chunks and header style, column widths and the frozen
+header are applied as each sheet is written, so no second load/format/save
+pass is needed.
+
+With --offload-raw (or automatically when the results exceed Excel's row
+limit) the full result table is written to a linked columnar file next to
+the workbook (Parquet when a Parquet engine is installed, gzipped CSV
+otherwise) and the 'Raw Data' / 'Successful Runs' sheets hold only a link
+and per-precision counts.
 """
 
 import pandas as pd
@@ -8,77 +19,101 @@ import numpy as np
 from pathlib import Path
 import argparse
 
+import analysis_data
+
 try:
-    from openpyxl import load_workbook
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill, Alignment
     from openpyxl.utils import get_column_letter
-    from openpyxl.chart import ScatterChart, Reference, Series, BarChart
     HAS_OPENPYXL = True
 except ImportError:
     HAS_OPENPYXL = False
-    print("Warning: openpyxl not available. Will create basic Excel file without formatting.")
-
-def create_summary_stats(df):
+    print("Warning: openpyxl not available. Cannot create Excel report.")
+
+PRECISIONS = ['int8', 'fp16', 'fp32', 'fp16acc32']
+
+# Excel's hard sheet limit (including the header row)
+EXCEL_MAX_ROWS = 1048576
+
+# Rows per chunk converted to Python values while streaming
+CHUNK_ROWS = 10000
+
+# Column widths are sized from the header and the first rows only
+WIDTH_SAMPLE_ROWS = 1000
+
+# (output column, metric, statistic) read from the shared aggregate tables
+SUMMARY_COLUMNS = [
+    ('mean_mae', 'mae', 'mean'),
+    ('std_mae', 'mae', 'std'),
+    ('mean_rmse', 'rmse', 'mean'),
+    ('std_rmse', 'rmse', 'std'),
+    ('mean_rel_rmse', 'rel_rmse', 'mean'),
+    ('std_rel_rmse', 'rel_rmse', 'std'),
+    ('mean_max_error', 'max_abs_error', 'mean'),
+    ('max_max_error', 'max_abs_error', 'max'),
+    ('mean_snr_db', 'snr_db', 'mean'),
+    ('min_snr_db', 'snr_db', 'min'),
+    ('mean_correlation', 'correlation', 'mean'),
+    ('min_correlation', 'correlation', 'min'),
+    ('mean_acc_1pct', 'acc_1pct', 'mean'),
+    ('mean_acc_5pct', 'acc_5pct', 'mean'),
+    ('mean_acc_10pct', 'acc_10pct', 'mean'),
+    ('mean_sim_time', 'sim_time_sec', 'mean'),
+    ('total_sim_time', 'sim_time_sec', 'sum'),
+]
+
+COMPARISON_COLUMNS = [
+    ('overall_mean_mae', 'mae', 'mean'),
+    ('overall_mean_rmse', 'rmse', 'mean'),
+    ('overall_mean_rel_rmse', 'rel_rmse', 'mean'),
+    ('overall_mean_snr_db', 'snr_db', 'mean'),
+    ('overall_mean_correlation', 'correlation', 'mean'),
+    ('overall_mean_acc_1pct', 'acc_1pct', 'mean'),
+    ('overall_mean_acc_5pct', 'acc_5pct', 'mean'),
+    ('best_snr_db', 'snr_db', 'max'),
+    ('worst_snr_db', 'snr_db', 'min'),
+    ('total_time_sec', 'sim_time_sec', 'sum'),
+    ('avg_time_per_case', 'sim_time_sec', 'mean'),
+]
+
+def create_summary_stats(by_category):
     """Create summary statistics grouped by precision and condition category."""
     summary_data = []
 
-    for prec in ['int8', 'fp16', 'fp32']:
+    for prec in PRECISIONS:
         for cat in ['low', 'medium', 'high']:
-            subset = df[(df['precision'] == prec) & (df['category'] == cat)]
-
-            if len(subset) == 0:
+            if (prec, cat) not in by_category.index:
                 continue
 
-            summary_data.append({
+            group = by_category.loc[(prec, cat)]
+            row = {
                 'precision': prec,
                 'category': cat,
-                'num_cases': len(subset),
-                'mean_mae': subset['mae'].mean(),
-                'std_mae': subset['mae'].std(),
-                'mean_rmse': subset['rmse'].mean(),
-                'std_rmse': subset['rmse'].std(),
-                'mean_rel_rmse': subset['rel_rmse'].mean(),
-                'std_rel_rmse': subset['rel_rmse'].std(),
-                'mean_max_error': subset['max_abs_error'].mean(),
-                'max_max_error': subset['max_abs_error'].max(),
-                'mean_snr_db': subset['snr_db'].mean(),
-                'min_snr_db': subset['snr_db'].min(),
-                'mean_correlation': subset['correlation'].mean(),
-                'min_correlation': subset['correlation'].min(),
-                'mean_acc_1pct': subset['acc_1pct'].mean(),
-                'mean_acc_5pct': subset['acc_5pct'].mean(),
-                'mean_acc_10pct': subset['acc_10pct'].mean(),
-                'mean_sim_time': subset['sim_time_sec'].mean(),
-                'total_sim_time': subset['sim_time_sec'].sum(),
-            })
+                'num_cases': int(group[('rows', 'size')]),
+            }
+            for name, metric, stat in SUMMARY_COLUMNS:
+                row[name] = group[(metric, stat)]
+            summary_data.append(row)
 
     return pd.DataFrame(summary_data)
 
-def create_precision_comparison(df):
+def create_precision_comparison(by_precision):
     """Create precision comparison table."""
     comp_data = []
 
-    for prec in ['int8', 'fp16', 'fp32']:
-        subset = df[df['precision'] == prec]
-
-        if len(subset) == 0:
+    for prec in PRECISIONS:
+        if prec not in by_precision.index:
             continue
 
-        comp_data.append({
+        group = by_precision.loc[prec]
+        row = {
             'precision': prec,
-            'total_cases': len(subset),
-            'overall_mean_mae': subset['mae'].mean(),
-            'overall_mean_rmse': subset['rmse'].mean(),
-            'overall_mean_rel_rmse': subset['rel_rmse'].mean(),
-            'overall_mean_snr_db': subset['snr_db'].mean(),
-            'overall_mean_correlation': subset['correlation'].mean(),
-            'overall_mean_acc_1pct': subset['acc_1pct'].mean(),
-            'overall_mean_acc_5pct': subset['acc_5pct'].mean(),
-            'best_snr_db': subset['snr_db'].max(),
-            'worst_snr_db': subset['snr_db'].min(),
-            'total_time_sec': subset['sim_time_sec'].sum(),
-            'avg_time_per_case': subset['sim_time_sec'].mean(),
-        })
+            'total_cases': int(group[('rows', 'size')]),
+        }
+        for name, metric, stat in COMPARISON_COLUMNS:
+            row[name] = group[(metric, stat)]
+        comp_data.append(row)
 
     return pd.DataFrame(comp_data)
 
@@ -86,8 +121,8 @@ def create_condition_analysis(df):
     """Analyze impact of condition number on accuracy."""
     analysis_data = []
 
-    for prec in ['int8', 'fp16', 'fp32']:
-        prec_data = df[df['precision'] == prec].copy()
+    for prec in PRECISIONS:
+        prec_data = df[df['precision'] == prec]
 
         if len(prec_data) == 0:
             continue
@@ -117,37 +152,89 @@ def create_condition_analysis(df):
 
     return pd.DataFrame(analysis_data)
 
-def format_worksheet(ws, df, title=""):
-    """Apply formatting to worksheet if openpyxl is available."""
-    if not HAS_OPENPYXL:
-        return
-
-    # Header formatting
-    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    header_font = Font(color="FFFFFF", bold=True)
+def header_cell(ws, value):
+    cell = WriteOnlyCell(ws, value=value)
+    cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    cell.font = Font(color="FFFFFF", bold=True)
+    cell.alignment = Alignment(horizontal='center', vertical='center')
+    return cell
+
+
+def column_widths(df):
+    """Widths from header and sampled values, capped at 50 like the old formatter."""
+    sample = df.head(WIDTH_SAMPLE_ROWS)
+    widths = []
+    for col in df.columns:
+        longest = len(str(col))
+        if len(sample) > 0:
+            longest = max(longest, sample[col].astype(str).str.len().max())
+        widths.append(min(longest + 2, 50))
+    return widths
+
+
+def write_sheet(wb, title, df, index=False):
+    """Stream a DataFrame into a new write-only sheet with the report formatting."""
+    if index:
+        df = df.reset_index()
+
+    ws = wb.create_sheet(title)
+    for idx, width in enumerate(column_widths(df), start=1):
+        ws.column_dimensions[get_column_letter(idx)].width = width
+    ws.freeze_panes = 'A2'
 
-    for cell in ws[1]:
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = Alignment(horizontal='center', vertical='center')
+    ws.append([header_cell(ws, str(col)) for col in df.columns])
+    for start in range(0, len(df), CHUNK_ROWS):
+        # Same cell values as DataFrame.to_excel: NaN -> empty, +/-inf -> 'inf'/'-inf'
+        chunk = df.iloc[start:start + CHUNK_ROWS].astype(object)
+        chunk = chunk.replace([np.inf, -np.inf], ['inf', '-inf'])
+        chunk = chunk.where(chunk.notna(), None)
+        for row in chunk.itertuples(index=False, name=None):
+            ws.append(row)
 
-    # Auto-adjust column widths
-    for column in ws.columns:
-        max_length = 0
-        column_letter = get_column_letter(column[0].column)
 
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
+def parquet_available():
+    for engine in ('pyarrow', 'fastparquet'):
+        try:
+            __import__(engine)
+            return True
+        except ImportError:
+            pass
+    return False
+
+
+def offload_raw_data(df, input_file, output_file):
+    """Columnar copy of the full result table next to the workbook.
+
+    Without a Parquet engine the source results CSV already is the raw table,
+    so the workbook links to it instead of writing another copy.
+    """
+    if not parquet_available():
+        return input_file.resolve()
+    raw_file = output_file.with_name(output_file.stem + '_raw.parquet')
+    df.to_parquet(raw_file, index=False)
+    return raw_file.resolve()
+
+
+def write_link_sheet(wb, title, raw_file, output_dir, df, note):
+    """Sheet pointing at an offloaded table, with per-precision row counts."""
+    ws = wb.create_sheet(title)
+    ws.column_dimensions['A'].width = 20
+    ws.column_dimensions['B'].width = 50
+    ws.freeze_panes = 'A2'
 
-        adjusted_width = min(max_length + 2, 50)
-        ws.column_dimensions[column_letter].width = adjusted_width
+    ws.append([header_cell(ws, 'field'), header_cell(ws, 'value')])
+    # Relative link when the file sits next to the workbook, absolute otherwise
+    target = raw_file.name if raw_file.parent == output_dir else raw_file.as_uri()
+    link = WriteOnlyCell(ws, value=str(raw_file))
+    link.hyperlink = target
+    link.font = Font(color="0563C1", underline='single')
+    ws.append(['data file', link])
+    ws.append(['note', note])
+    ws.append(['rows', len(df)])
+    ws.append(['columns', len(df.columns)])
+    for prec, count in df['precision'].value_counts().sort_index().items():
+        ws.append([f'rows ({prec})', int(count)])
 
-    # Freeze header row
-    ws.freeze_panes = 'A2'
 
 def main():
     parser = argparse.ArgumentParser()
@@ -155,8 +242,14 @@ def main():
                         help='Input CSV file with test results')
     parser.add_argument('--output', type=str, default='../results/comprehensive_analysis.xlsx',
                         help='Output Excel file')
+    parser.add_argument('--offload-raw', action='store_true',
+                        help='Link raw results from a separate file instead of copying them into the workbook')
     args = parser.parse_args()
 
+    if not HAS_OPENPYXL:
+        print("Error: openpyxl is required to write the Excel report")
+        return
+
     input_file = Path(args.input)
     output_file = Path(args.output)
 
@@ -165,108 +258,103 @@ def main():
         return
 
     print(f"Reading results from {input_file}...")
-    df = pd.read_csv(input_file)
+    data_tables = analysis_data.load_analysis_data(input_file)
+    df = data_tables['results']
 
     print(f"Loaded {len(df)} test results")
 
     # Filter out failed runs
-    df_success = df[df['status'] == 'success'].copy()
+    df_success = data_tables['success']
     df_failed = df[df['status'] != 'success'].copy()
 
     print(f"  Success: {len(df_success)}")
     print(f"  Failed: {len(df_failed)}")
 
-    # Create Excel writer
+    # Raw tables beyond Excel's row limit can only go to the linked file
+    offload = args.offload_raw or len(df) + 1 > EXCEL_MAX_ROWS
+
     print(f"\nCreating Excel file: {output_file}...")
+    wb = Workbook(write_only=True)
 
-    with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
+    if offload:
+        raw_file = offload_raw_data(df, input_file, output_file)
+        print(f"  Raw results linked from: {raw_file}")
+
+        # Sheet 1: Link to all raw data
+        print("  Creating sheet: Raw Data (linked)")
+        write_link_sheet(wb, 'Raw Data', raw_file, output_file.resolve().parent, df, 'All test results')
+
+        # Sheet 2: Link to successful runs only
+        print("  Creating sheet: Successful Runs (linked)")
+        write_link_sheet(wb, 'Successful Runs', raw_file, output_file.resolve().parent, df_success,
+                         "Rows of the data file with status == 'success'")
+    else:
         # Sheet 1: All raw data
         print("  Creating sheet: Raw Data")
-        df.to_excel(writer, sheet_name='Raw Data', index=False)
+        write_sheet(wb, 'Raw Data', df)
 
         # Sheet 2: Successful runs only
         print("  Creating sheet: Successful Runs")
-        df_success.to_excel(writer, sheet_name='Successful Runs', index=False)
-
-        # Sheet 3: Summary statistics
-        print("  Creating sheet: Summary Statistics")
-        summary = create_summary_stats(df_success)
-        summary.to_excel(writer, sheet_name='Summary Statistics', index=False)
-
-        # Sheet 4: Precision comparison
-        print("  Creating sheet: Precision Comparison")
-        precision_comp = create_precision_comparison(df_success)
-        precision_comp.to_excel(writer, sheet_name='Precision Comparison', index=False)
-
-        # Sheet 5: Condition number analysis
-        print("  Creating sheet: Condition Analysis")
-        cond_analysis = create_condition_analysis(df_success)
-        cond_analysis.to_excel(writer, sheet_name='Condition Analysis', index=False)
-
-        # Sheet 6: Error distribution by precision
-        print("  Creating sheet: Error Distribution")
-        error_dist = df_success.groupby('precision').agg({
-            'mae': ['min', 'max', 'mean', 'median', 'std'],
-            'rmse': ['min', 'max', 'mean', 'median', 'std'],
-            'rel_rmse': ['min', 'max', 'mean', 'median', 'std'],
-            'max_abs_error': ['min', 'max', 'mean', 'median', 'std'],
-        }).round(6)
-        error_dist.to_excel(writer, sheet_name='Error Distribution')
-
-        # Sheet 7: Best and worst cases
-        print("  Creating sheet: Best and Worst Cases")
-        best_worst_data = []
-
-        for prec in ['int8', 'fp16', 'fp32']:
-            subset = df_success[df_success['precision'] == prec]
-            if len(subset) == 0:
-                continue
-
-            best_idx = subset['rmse'].idxmin()
-            worst_idx = subset['rmse'].idxmax()
+        write_sheet(wb, 'Successful Runs', df_success)
+
+    # Sheet 3: Summary statistics
+    print("  Creating sheet: Summary Statistics")
+    summary = create_summary_stats(data_tables['by_category'])
+    write_sheet(wb, 'Summary Statistics', summary)
+
+    # Sheet 4: Precision comparison
+    print("  Creating sheet: Precision Comparison")
+    precision_comp = create_precision_comparison(data_tables['by_precision'])
+    write_sheet(wb, 'Precision Comparison', precision_comp)
+
+    # Sheet 5: Condition number analysis
+    print("  Creating sheet: Condition Analysis")
+    cond_analysis = create_condition_analysis(df_success)
+    write_sheet(wb, 'Condition Analysis', cond_analysis)
+
+    # Sheet 6: Error distribution by precision (one flat header row: metric_stat)
+    print("  Creating sheet: Error Distribution")
+    error_dist = data_tables['by_precision'][[
+        (metric, stat)
+        for metric in ['mae', 'rmse', 'rel_rmse', 'max_abs_error']
+        for stat in ['min', 'max', 'mean', 'median', 'std']
+    ]].round(6)
+    error_dist.columns = [f'{metric}_{stat}' for metric, stat in error_dist.columns]
+    write_sheet(wb, 'Error Distribution', error_dist, index=True)
+
+    # Sheet 7: Best and worst cases
+    print("  Creating sheet: Best and Worst Cases")
+    best_worst_data = []
+
+    for prec in PRECISIONS:
+        subset = df_success[df_success['precision'] == prec]
+        if len(subset) == 0:
+            continue
 
-            best_worst_data.append({
-                'type': 'BEST',
-                'precision': prec,
-                'case_id': subset.loc[best_idx, 'case_id'],
-                'category': subset.loc[best_idx, 'category'],
-                'mae': subset.loc[best_idx, 'mae'],
-                'rmse': subset.loc[best_idx, 'rmse'],
-                'rel_rmse': subset.loc[best_idx, 'rel_rmse'],
-                'snr_db': subset.loc[best_idx, 'snr_db'],
-                'correlation': subset.loc[best_idx, 'correlation'],
-            })
+        best_idx = subset['rmse'].idxmin()
+        worst_idx = subset['rmse'].idxmax()
 
+        for case_type, idx in [('BEST', best_idx), ('WORST', worst_idx)]:
             best_worst_data.append({
-                'type': 'WORST',
+                'type': case_type,
                 'precision': prec,
-                'case_id': subset.loc[worst_idx, 'case_id'],
-                'category': subset.loc[worst_idx, 'category'],
-                'mae': subset.loc[worst_idx, 'mae'],
-                'rmse': subset.loc[worst_idx, 'rmse'],
-                'rel_rmse': subset.loc[worst_idx, 'rel_rmse'],
-                'snr_db': subset.loc[worst_idx, 'snr_db'],
-                'correlation': subset.loc[worst_idx, 'correlation'],
+                'case_id': subset.loc[idx, 'case_id'],
+                'category': subset.loc[idx, 'category'],
+                'mae': subset.loc[idx, 'mae'],
+                'rmse': subset.loc[idx, 'rmse'],
+                'rel_rmse': subset.loc[idx, 'rel_rmse'],
+                'snr_db': subset.loc[idx, 'snr_db'],
+                'correlation': subset.loc[idx, 'correlation'],
             })
 
-        best_worst_df = pd.DataFrame(best_worst_data)
-        best_worst_df.to_excel(writer, sheet_name='Best and Worst Cases', index=False)
-
-        # Sheet 8: Failed runs (if any)
-        if len(df_failed) > 0:
-            print("  Creating sheet: Failed Runs")
-            df_failed.to_excel(writer, sheet_name='Failed Runs', index=False)
-
-    # Apply formatting if openpyxl is available
-    if HAS_OPENPYXL:
-        print("\nApplying formatting...")
-        wb = load_workbook(output_file)
+    write_sheet(wb, 'Best and Worst Cases', pd.DataFrame(best_worst_data))
 
-        for sheet_name in wb.sheetnames:
-            ws = wb[sheet_name]
-            format_worksheet(ws, None)
+    # Sheet 8: Failed runs (if any)
+    if len(df_failed) > 0:
+        print("  Creating sheet: Failed Runs")
+        write_sheet(wb, 'Failed Runs', df_failed)
 
-        wb.save(output_file)
+    wb.save(output_file)
 
     print(f"\n{'='*80}")
     print(f"Excel report created successfully!")
@@ -281,7 +369,7 @@ def main():
 
     if len(df_success) > 0:
         print("\nOverall Statistics:")
-        for prec in ['int8', 'fp16', 'fp32']:
+        for prec in PRECISIONS:
             subset = df_success[df_success['precision'] == prec]
             if len(subset) > 0:
                 print(f"\n{prec.upper()}:")
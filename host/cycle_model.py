@@ -0,0 +1,263 @@
+"""
+Cycle model for gemm_controller.
+
+Predicts the clock edges tb_top_gemm counts from the start pulse to done, for
+the controller modes:
+
+    sequential  S_LOAD/S_READ/S_MAC + S_WAIT for the PE result per k,
+                plus S_STORE/S_NEXT per output
+    pipelined   one A read and LANES B reads issued every cycle, LANES
+                outputs per group streamed to C; FP adds drain through
+                fp_mac_stream's partial-sum reduction tree
+    tiled       gemm_tile_controller (TILE > 0): one k step of a TILE x TILE
+                output tile per cycle, tiles at least TILE cycles apart, the
+                last tile drained one row per cycle
+
+K counts A/B words, so packed layouts (mem_codec.py) walk ceil(K/pack) steps
+per output: pack 4 for INT8 (int8_dot4), pack 2 for FP16 (fp16_dot2, whose
+pair add lengthens the product path by one adder).
+
+2:4 structured-sparse A (SPARSE=1, scalar controller) walks 2*ceil(K/4) A
+entries per output instead of K: the B row of each entry comes from the
+entry itself, which costs two gather states per k (sequential) or two
+pipeline stages (pipelined). MACs are counted as the dense M*K*N, so
+MAC/cycle is the effective rate and dense/sparse cycles the speedup.
+
+Batched runs (tb_top_gemm JOBS > 1) move A/B in and C out through top_gemm's
+host port, one word per cycle. Without DBUF every job waits for its load and
+for the previous drain; with DBUF (ping-pong banks) job n+1 loads and job
+n-1 drains while job n runs, so a job costs max(compute, load, drain).
+
+The constants mirror the RTL (pe_cell, fp_mac_stream and the *_ip latencies).
+parse_cycles() reads the "CYCLES ..." line the testbench prints, so measured
+and predicted counts can be compared.
+
+Usage:
+    python cycle_model.py --M 8 --K 8 --N 8
+    python cycle_model.py --M 8 --K 8 --N 8 --tile 4
+    python cycle_model.py --M 16 --K 16 --N 16 --lanes 1 2 4 8
+    python cycle_model.py --M 8 --K 8 --N 8 --int8-pack 4 --fp16-pack 2
+    python cycle_model.py --M 8 --K 8 --N 8 --jobs 8
+    python cycle_model.py --M 8 --K 8 --N 8 --sparse
+    python cycle_model.py --M 8 --K 8 --N 8 --log xsim.log
+"""
+import argparse
+import math
+import re
+from pathlib import Path
+
+from mem_codec import FP16_PACKS, INT8_PACKS, SPARSE_GROUP, SPARSE_KEEP, k_words, word_pack
+
+PRECISIONS = ['int8', 'fp16', 'fp32', 'fp16acc32']
+
+# FP IP latencies (behavioral *_ip models)
+MUL_LAT = 3
+ADD_LAT = 3
+
+# fp_mac_stream: partial sums cover ADD_LAT + 1, rounded up to a power of two
+PSUM_LEVELS = math.ceil(math.log2(ADD_LAT + 1))
+PSUMS = 1 << PSUM_LEVELS
+
+# Sequential FSM: 3 states + PE wait per k, 2 per output, S_DONE + done register
+SEQ_STATES_PER_K = 3
+SEQ_STATES_PER_OUTPUT = 2
+SEQ_OVERHEAD = 2
+
+# Pipelined: start -> issue -> BRAM read -> INT8 MAC -> C write -> done
+PIPE_OVERHEAD = 5
+
+# SPARSE: S_GATHER/S_BREAD per k (sequential), ga/gb stages (pipelined)
+SPARSE_STATES_PER_K = 2
+SPARSE_STAGES = 2
+
+CYCLES_RE = re.compile(r'CYCLES mode=(\w+) cycles=(\d+) macs=(\d+)')
+TILE_RE = re.compile(r'CYCLES .*\btile=(\d+)')
+LANES_RE = re.compile(r'CYCLES .*\blanes=(\d+)')
+PACK_RE = re.compile(r'CYCLES .*\bpack=(\d+)')
+JOBS_RE = re.compile(r'CYCLES .*\bjobs=(\d+) dbuf=(\d)')
+SPARSE_RE = re.compile(r'CYCLES .*\bsparse=(\d)')
+
+# Batched jobs (testbench host, stimulus on the falling edge): the next start
+# follows done, a load and a C drain (one read per cycle) by one edge each;
+# serial load + drain add one
+RESTART = 1
+LOAD_EDGES = 1
+DRAIN_EDGES = 1
+SERIAL_EDGES = 1
+
+
+def product_lat(prec, pack=1):
+    """Cycles from operands to one (summed) product: packed FP16 adds a pair add."""
+    return MUL_LAT + (ADD_LAT if prec in ('fp16', 'fp16acc32') and pack == 2 else 0)
+
+
+def pe_lat(prec, pack=1):
+    """Cycles from pe_cell valid until acc_valid (FP16 adds an output register)."""
+    if prec == 'int8':
+        return 1
+    return product_lat(prec, pack) + ADD_LAT + (prec == 'fp16')
+
+
+def pipe_drain(prec, pack=1):
+    """Extra cycles from the last MAC to its result, beyond the INT8 path."""
+    if prec == 'int8':
+        return 0
+    # product, accumulating add, then one add per reduction tree level
+    return product_lat(prec, pack) + ADD_LAT * (1 + PSUM_LEVELS)
+
+
+def a_words_per_row(K, pack=1, sparse=False):
+    """A words the k loop walks per output."""
+    if sparse:
+        return SPARSE_KEEP * math.ceil(K / SPARSE_GROUP)
+    return k_words(K, pack)
+
+
+def gemm_cycles(M, K, N, prec='int8', pipelined=False, tile=0, lanes=1, pack=1,
+                sparse=False):
+    """Predicted start-to-done cycles for one M x K x N job (pack = values per word)."""
+    K = a_words_per_row(K, pack, sparse)
+    if tile:
+        if sparse:
+            raise ValueError("SPARSE needs the scalar controller (tile = 0)")
+        tiles = math.ceil(M / tile) * math.ceil(N / tile)
+        last_rows = M - (math.ceil(M / tile) - 1) * tile
+        return ((tiles - 1) * max(K, tile) + K + PIPE_OVERHEAD + last_rows
+                + pipe_drain(prec, pack))
+    if not pipelined:
+        per_k = SEQ_STATES_PER_K + pe_lat(prec, pack) + sparse * SPARSE_STATES_PER_K
+        return M * N * (per_k * K + SEQ_STATES_PER_OUTPUT) + SEQ_OVERHEAD
+    return (M * math.ceil(N / lanes) * K + PIPE_OVERHEAD + pipe_drain(prec, pack)
+            + sparse * SPARSE_STAGES)
+
+
+def batch_cycles(M, K, N, prec='int8', pipelined=False, tile=0, lanes=1, pack=1,
+                 jobs=1, dbuf=False, sparse=False):
+    """Predicted first-start-to-last-done cycles for `jobs` back-to-back jobs."""
+    job = gemm_cycles(M, K, N, prec, pipelined, tile, lanes, pack, sparse)
+    load = M * a_words_per_row(K, pack, sparse) + k_words(K, pack) * N
+    drain = M * N
+    if not dbuf:
+        return job + (jobs - 1) * (job + load + drain + SERIAL_EDGES)
+    # Job n+1 starts once job n is done and its own operands are in; from
+    # the third job on, job n-1's C must also have drained
+    first = max(job + RESTART, load + LOAD_EDGES)
+    steady = max(first, drain + DRAIN_EDGES)
+    return job + min(jobs - 1, 1) * first + max(jobs - 2, 0) * steady
+
+
+def macs_per_cycle(M, K, N, prec='int8', pipelined=False, tile=0, lanes=1, pack=1,
+                   sparse=False):
+    return M * K * N / gemm_cycles(M, K, N, prec, pipelined, tile, lanes, pack, sparse)
+
+
+def parse_cycles(text):
+    """{'mode', 'cycles', 'macs', 'tile', 'lanes', 'pack', 'jobs', 'dbuf', 'sparse'}
+    from a simulation log, or None."""
+    m = CYCLES_RE.search(text)
+    if not m:
+        return None
+    t = TILE_RE.search(text)
+    l = LANES_RE.search(text)
+    k = PACK_RE.search(text)
+    b = JOBS_RE.search(text)
+    sp = SPARSE_RE.search(text)
+    return {'mode': m.group(1), 'cycles': int(m.group(2)), 'macs': int(m.group(3)),
+            'tile': int(t.group(1)) if t else 0,
+            'lanes': int(l.group(1)) if l else 1,
+            'pack': int(k.group(1)) if k else 1,
+            'jobs': int(b.group(1)) if b else 1,
+            'dbuf': b is not None and b.group(2) == '1',
+            'sparse': sp is not None and sp.group(1) == '1'}
+
+
+def main():
+    p = argparse.ArgumentParser(description='Predicted gemm_controller cycle counts')
+    p.add_argument('--M', type=int, default=8)
+    p.add_argument('--K', type=int, default=8)
+    p.add_argument('--N', type=int, default=8)
+    p.add_argument('--prec', choices=PRECISIONS, nargs='+', default=PRECISIONS)
+    p.add_argument('--log', type=str, default=None,
+                   help='Simulation log to compare against (CYCLES line from tb_top_gemm)')
+    p.add_argument('--tile', type=int, default=0,
+                   help='Also model the tiled systolic_array mode with this TILE')
+    p.add_argument('--lanes', type=int, nargs='+', default=[1],
+                   help='Pipelined output lanes (LANES) to sweep')
+    p.add_argument('--int8-pack', type=int, choices=INT8_PACKS, default=1,
+                   help='INT8 values per A/B word (INT8_PACK)')
+    p.add_argument('--fp16-pack', type=int, choices=FP16_PACKS, default=1,
+                   help='FP16 values per A/B word (FP16_PACK)')
+    p.add_argument('--jobs', type=int, default=1,
+                   help='Also model JOBS back-to-back jobs with and without DBUF')
+    p.add_argument('--sparse', action='store_true',
+                   help='Also model 2:4 sparse A (SPARSE=1) against dense')
+    args = p.parse_args()
+
+    M, K, N = args.M, args.K, args.N
+    print("=" * 80)
+    print(f"CYCLE MODEL: M={M} K={K} N={N} ({M*K*N} MACs)")
+    print("=" * 80)
+    header = (f"{'prec':10s} {'lanes':>5s} {'sequential':>12s} {'pipelined':>12s} "
+              f"{'speedup':>9s} {'MAC/cycle':>10s}")
+    if args.tile:
+        header += f" {'tiled':>10s} {'speedup':>9s} {'MAC/cycle':>10s}"
+    print(header)
+    for prec in args.prec:
+        pack = word_pack(prec, args.int8_pack, args.fp16_pack)
+        seq = gemm_cycles(M, K, N, prec, pipelined=False, pack=pack)
+        for lanes in args.lanes:
+            pipe = gemm_cycles(M, K, N, prec, pipelined=True, lanes=lanes, pack=pack)
+            row = (f"{prec:10s} {lanes:5d} {seq:12d} {pipe:12d} {seq / pipe:8.2f}x "
+                   f"{macs_per_cycle(M, K, N, prec, True, lanes=lanes, pack=pack):10.3f}")
+            if args.tile:
+                tiled = gemm_cycles(M, K, N, prec, tile=args.tile, pack=pack)
+                row += (f" {tiled:10d} {seq / tiled:8.2f}x "
+                        f"{macs_per_cycle(M, K, N, prec, tile=args.tile, pack=pack):10.3f}")
+            print(row)
+
+    if args.jobs > 1:
+        print(f"\nBATCH: {args.jobs} jobs, host port loads (M+N)*K and drains M*N words")
+        print(f"{'prec':10s} {'mode':>10s} {'serial':>10s} {'dbuf':>10s} {'speedup':>9s} "
+              f"{'MAC/cycle':>10s}")
+        modes = [('sequential', {}), ('pipelined', {'pipelined': True, 'lanes': args.lanes[0]})]
+        if args.tile:
+            modes.append(('tiled', {'tile': args.tile}))
+        for prec in args.prec:
+            pack = word_pack(prec, args.int8_pack, args.fp16_pack)
+            for mode, kw in modes:
+                serial = batch_cycles(M, K, N, prec, pack=pack, jobs=args.jobs, **kw)
+                dbuf = batch_cycles(M, K, N, prec, pack=pack, jobs=args.jobs, dbuf=True, **kw)
+                print(f"{prec:10s} {mode:>10s} {serial:10d} {dbuf:10d} {serial / dbuf:8.2f}x "
+                      f"{args.jobs * M * K * N / dbuf:10.3f}")
+
+    if args.sparse:
+        print(f"\nSPARSE 2:4: {a_words_per_row(K, sparse=True)} A entries per output "
+              f"instead of {K}; MAC/cycle counts the dense {M*K*N} MACs")
+        print(f"{'prec':10s} {'mode':>10s} {'dense':>10s} {'sparse':>10s} {'speedup':>9s} "
+              f"{'MAC/cycle':>10s}")
+        modes = [('sequential', {}), ('pipelined', {'pipelined': True, 'lanes': args.lanes[0]})]
+        for prec in args.prec:
+            if prec == 'fp32':
+                continue  # no room for positions in an FP32 A word
+            for mode, kw in modes:
+                dense = gemm_cycles(M, K, N, prec, **kw)
+                sparse = gemm_cycles(M, K, N, prec, sparse=True, **kw)
+                print(f"{prec:10s} {mode:>10s} {dense:10d} {sparse:10d} {dense / sparse:8.2f}x "
+                      f"{M * K * N / sparse:10.3f}")
+
+    if args.log:
+        measured = parse_cycles(Path(args.log).read_text(errors='replace'))
+        if measured is None:
+            print(f"\n[WARN] No CYCLES line in {args.log}")
+            return
+        print(f"\nMeasured ({measured['mode']}): {measured['cycles']} cycles, "
+              f"{measured['macs']} MACs")
+        if len(args.prec) == 1:
+            predicted = batch_cycles(M, K, N, args.prec[0], measured['mode'] == 'pipelined',
+                                     measured['tile'], measured['lanes'], measured['pack'],
+                                     measured['jobs'], measured['dbuf'], measured['sparse'])
+            print(f"Predicted: {predicted} cycles ({measured['cycles'] - predicted:+d})")
+
+
+if __name__ == '__main__':
+    main()
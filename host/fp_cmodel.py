@@ -0,0 +1,180 @@
+"""
+Bit-accurate model of the FP add/mul cores and test vectors for tb_fp_ieee.
+
+Mirrors src/fp_ieee.sv (the `define FP_BEHAV replacement for the
+floating_point IP): one exact operation rounded once, to nearest even or
+toward zero, with subnormal inputs read as zero and results below the normal
+range flushed to zero unless --no-flush. NaN results are the canonical quiet
+NaN. Values are exact fractions, so the model has no float rounding of its own.
+
+Writes mem/fp_vectors.mem, one vector per line (a, b, expected result, hex),
+for tb/tb_fp_ieee.sv. With --numpy the model is also checked against numpy
+(round to nearest even with gradual underflow only).
+
+Usage:
+    python fp_cmodel.py --fmt fp16 --op mul
+    python fp_cmodel.py --fmt fp32 --op add --count 50000 --rtz
+    python fp_cmodel.py --fmt fp16 --op add --no-flush --numpy
+"""
+import argparse
+import random
+from fractions import Fraction
+from pathlib import Path
+
+import numpy as np
+
+MEM = Path(__file__).resolve().parents[1] / "mem"
+
+# (exponent bits, fraction bits)
+FORMATS = {'fp16': (5, 10), 'fp32': (8, 23)}
+OPS = ('add', 'mul')
+
+
+class Fmt:
+    def __init__(self, name):
+        self.ew, self.mw = FORMATS[name]
+        self.width = 1 + self.ew + self.mw
+        self.emax = (1 << self.ew) - 1
+        self.bias = (1 << (self.ew - 1)) - 1
+        self.qnan = (self.emax << self.mw) | (1 << (self.mw - 1))
+        self.min_normal = Fraction(2) ** (1 - self.bias)
+
+    def fields(self, bits):
+        return bits >> (self.width - 1), (bits >> self.mw) & self.emax, bits & ((1 << self.mw) - 1)
+
+    def decode(self, bits, flush=True):
+        """(sign, value) with value a Fraction, 'inf' or 'nan'."""
+        s, e, f = self.fields(bits)
+        if e == self.emax:
+            return s, 'nan' if f else 'inf'
+        if e == 0:
+            return s, Fraction(0) if flush else Fraction(f, 1 << self.mw) * self.min_normal
+        return s, Fraction((1 << self.mw) | f, 1 << self.mw) * Fraction(2) ** (e - self.bias)
+
+    def encode(self, s, v, rtz=False, flush=True):
+        """Round the exact value v >= 0 with sign s to a bit pattern."""
+        sign = s << (self.width - 1)
+        if v == 0 or (flush and v < self.min_normal):
+            return sign
+        e = v.numerator.bit_length() - v.denominator.bit_length()
+        if Fraction(2) ** e > v:
+            e -= 1
+        e = max(e, 1 - self.bias)
+        n = v / Fraction(2) ** (e - self.mw)
+        q, r = divmod(n.numerator, n.denominator)
+        if not rtz and (2 * r > n.denominator or (2 * r == n.denominator and q & 1)):
+            q += 1
+        mag = ((e + self.bias) << self.mw) + q - (1 << self.mw) if q >> self.mw else q
+        if mag >= self.emax << self.mw:
+            mag = (self.emax << self.mw) - 1 if rtz else self.emax << self.mw
+        return sign | mag
+
+
+def fp_op(fmt, op, a, b, rtz=False, flush=True):
+    """Result bits of a <op> b."""
+    sa, va = fmt.decode(a, flush)
+    sb, vb = fmt.decode(b, flush)
+    if 'nan' in (va, vb):
+        return fmt.qnan
+    if op == 'mul':
+        s = sa ^ sb
+        if 'inf' in (va, vb):
+            return fmt.qnan if 0 in (va, vb) else (s << (fmt.width - 1)) | (fmt.emax << fmt.mw)
+        return fmt.encode(s, va * vb, rtz, flush)
+    if va == 'inf' or vb == 'inf':
+        if va == vb and sa != sb:
+            return fmt.qnan
+        return ((sa if va == 'inf' else sb) << (fmt.width - 1)) | (fmt.emax << fmt.mw)
+    v = (-va if sa else va) + (-vb if sb else vb)
+    if v == 0:
+        return fmt.encode(sa & sb, v)
+    return fmt.encode(int(v < 0), abs(v), rtz, flush)
+
+
+def numpy_op(fmt_name, op, a, b):
+    """numpy's result bits (gradual underflow, nearest even)."""
+    with np.errstate(all='ignore'):
+        if fmt_name == 'fp16':
+            x, y = (np.float64(np.uint16(v).view(np.float16)) for v in (a, b))
+            r = np.float16(x * y if op == 'mul' else x + y)   # float64 is exact here
+            return int(r.view(np.uint16)), bool(np.isnan(r))
+        x, y = (np.uint32(v).view(np.float32) for v in (a, b))
+        r = x * y if op == 'mul' else x + y
+    return int(np.float32(r).view(np.uint32)), bool(np.isnan(r))
+
+
+def gen_operands(fmt, op, count, rng):
+    """Special-value cross products followed by random operands."""
+    top = fmt.emax << fmt.mw
+    specials = [0, 1, (1 << fmt.mw) - 1, 1 << fmt.mw, fmt.bias << fmt.mw,
+                top - 1, top, fmt.qnan]
+    specials += [v | (1 << (fmt.width - 1)) for v in specials]
+    pairs = [(x, y) for x in specials for y in specials]
+    while len(pairs) < count:
+        a = rng.getrandbits(fmt.width)
+        kind = rng.random()
+        if kind < 0.3:
+            b = rng.getrandbits(fmt.width)
+        elif kind < 0.6 and op == 'add':
+            # Close exponents (cancellation), either sign
+            b = (a ^ rng.getrandbits(fmt.mw)) ^ (rng.getrandbits(1) << (fmt.width - 1))
+            b ^= rng.choice((0, 1, 2)) << fmt.mw
+        else:
+            # Exponents near the underflow / overflow edges of the result
+            s, e, _ = fmt.fields(a)
+            e = rng.choice((rng.randrange(0, 4), rng.randrange(fmt.emax - 4, fmt.emax),
+                            fmt.bias + rng.randrange(-3, 4)))
+            a = (s << (fmt.width - 1)) | (e << fmt.mw) | rng.getrandbits(fmt.mw)
+            b = rng.getrandbits(fmt.width)
+            if op == 'mul':
+                eb = max(1, min(fmt.emax - 1, 2 * fmt.bias - e + rng.randrange(-fmt.bias, fmt.bias)))
+                b = (b & ~(fmt.emax << fmt.mw)) | (eb << fmt.mw)
+        pairs.append((a, b & ((1 << fmt.width) - 1)))
+    return pairs[:max(count, len(specials) ** 2)]
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument('--fmt', choices=FORMATS, required=True)
+    p.add_argument('--op', choices=OPS, required=True)
+    p.add_argument('--count', type=int, default=20000, help='Vectors (specials included)')
+    p.add_argument('--seed', type=int, default=1)
+    p.add_argument('--rtz', action='store_true', help='Round toward zero (FP_BEHAV_RTZ=1)')
+    p.add_argument('--no-flush', action='store_true',
+                   help='Gradual underflow (FP_BEHAV_FLUSH=0)')
+    p.add_argument('--numpy', action='store_true',
+                   help='Also check the model against numpy (needs --no-flush, no --rtz)')
+    p.add_argument('--output', type=str, default=str(MEM / 'fp_vectors.mem'))
+    args = p.parse_args()
+    if args.numpy and (args.rtz or not args.no_flush):
+        p.error('--numpy checks round to nearest even with --no-flush only')
+
+    fmt = Fmt(args.fmt)
+    flush = not args.no_flush
+    pairs = gen_operands(fmt, args.op, args.count, random.Random(args.seed))
+    digits = fmt.width // 4
+
+    mismatches = 0
+    Path(args.output).parent.mkdir(exist_ok=True, parents=True)
+    with open(args.output, 'w') as f:
+        for a, b in pairs:
+            y = fp_op(fmt, args.op, a, b, args.rtz, flush)
+            if args.numpy:
+                ny, nan = numpy_op(args.fmt, args.op, a, b)
+                if (y != ny) and not (nan and y == fmt.qnan):
+                    mismatches += 1
+                    if mismatches <= 10:
+                        print(f"  numpy mismatch: {a:0{digits}x} {args.op} {b:0{digits}x} "
+                              f"model {y:0{digits}x} numpy {ny:0{digits}x}")
+            f.write(f"{a:0{digits}x} {b:0{digits}x} {y:0{digits}x}\n")
+
+    print(f"Wrote {len(pairs)} {args.fmt} {args.op} vectors to {args.output} "
+          f"(rounding={'rtz' if args.rtz else 'rne'}, flush={int(flush)})")
+    if args.numpy:
+        print(f"numpy cross-check: {mismatches} mismatches")
+        if mismatches:
+            raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -4,18 +4,14 @@ Creates 42 test cases with varying condition numbers (low, medium, high).
 """
 
 import argparse
-import struct
 import random
 import numpy as np
 import csv
 import json
 from pathlib import Path
 
-def f16_from_float(x: float) -> int:
-    return int(np.float16(x).view('H'))
-
-def f32_from_float(x: float) -> int:
-    return struct.unpack('<I', struct.pack('<f', x))[0]
+from mem_codec import (B_LAYOUTS, FP16_PACKS, INT8_PACKS, a_words, b_words, job_suffix,
+                       prune_24, sparse_a_words, word_pack, write_mem)
 
 def generate_matrix_with_condition(M, N, cond_number, seed=None):
     """
@@ -102,25 +98,18 @@ def generate_test_cases(M, K, N):
 
     return test_cases
 
-def main():
-    p = argparse.ArgumentParser()
-    p.add_argument('--M', type=int, required=True)
-    p.add_argument('--K', type=int, required=True)
-    p.add_argument('--N', type=int, required=True)
-    p.add_argument('--prec', choices=['int8','fp16','fp32'], required=True)
-    p.add_argument('--case-id', type=int, required=True, help='Test case ID (0-41)')
-    p.add_argument('--output-dir', type=str, default='../mem', help='Output directory for memory files')
-    args = p.parse_args()
-
-    M, K, N = args.M, args.K, args.N
-
+def build_case(M, K, N, prec, case_id, sparse24=False):
+    """
+    Matrices for one test case: (A, B, C_ref, metadata). A and B are scaled for
+    prec (and A pruned to 2:4 when sparse24); C_ref is their float64 product.
+    """
     # Generate all test cases
     test_cases = generate_test_cases(M, K, N)
 
-    if args.case_id < 0 or args.case_id >= len(test_cases):
+    if case_id < 0 or case_id >= len(test_cases):
         raise ValueError(f"case_id must be between 0 and {len(test_cases)-1}")
 
-    case = test_cases[args.case_id]
+    case = test_cases[case_id]
 
     # Generate matrices with specified condition numbers
     np.random.seed(case['seed'])
@@ -131,7 +120,7 @@ def main():
     B = generate_matrix_with_condition(K, N, case['cond_B'], seed=case['seed']+1)
 
     # Scale to appropriate range for precision
-    if args.prec == 'int8':
+    if prec == 'int8':
         # Scale to int8 range and round
         A = np.clip(A * 2, -5, 5).astype(np.int8)
         B = np.clip(B * 2, -5, 5).astype(np.int8)
@@ -141,6 +130,10 @@ def main():
         A = A * scale / np.max(np.abs(A))
         B = B * scale / np.max(np.abs(B))
 
+    # Keep the two largest magnitudes of every four k; C_ref uses the pruned A
+    if sparse24:
+        A = prune_24(A)
+
     # Compute actual condition numbers of final matrices
     try:
         actual_cond_A = np.linalg.cond(A)
@@ -149,44 +142,11 @@ def main():
         actual_cond_A = -1
         actual_cond_B = -1
 
-    # Write A.mem
-    output_dir = Path(args.output_dir)
-    output_dir.mkdir(exist_ok=True, parents=True)
-
-    with open(output_dir / 'A.mem', 'w') as fa:
-        for i in range(M):
-            for k in range(K):
-                if args.prec == 'int8':
-                    val = int(A[i,k]) & 0xff
-                elif args.prec == 'fp16':
-                    val = f16_from_float(float(A[i,k]))
-                else:
-                    val = f32_from_float(float(A[i,k]))
-                fa.write(f"{val:08x}\n")
-
-    # Write B.mem
-    with open(output_dir / 'B.mem', 'w') as fb:
-        for k in range(K):
-            for j in range(N):
-                if args.prec == 'int8':
-                    val = int(B[k,j]) & 0xff
-                elif args.prec == 'fp16':
-                    val = f16_from_float(float(B[k,j]))
-                else:
-                    val = f32_from_float(float(B[k,j]))
-                fb.write(f"{val:08x}\n")
-
     # Ground truth (float64 for maximum accuracy)
     C = A.astype(np.float64) @ B.astype(np.float64)
 
-    with open(output_dir / 'C_ref.csv', 'w', newline='') as fc:
-        w = csv.writer(fc)
-        for i in range(M):
-            w.writerow([float(C[i,j]) for j in range(N)])
-
-    # Save metadata about this test case
     metadata = {
-        'case_id': args.case_id,
+        'case_id': case_id,
         'category': case['category'],
         'requested_cond_A': case['cond_A'],
         'requested_cond_B': case['cond_B'],
@@ -196,7 +156,9 @@ def main():
         'M': M,
         'K': K,
         'N': N,
-        'precision': args.prec,
+        'precision': prec,
+        'a_sparsity': '2:4' if sparse24 else 'dense',
+        'A_zero_frac': float(np.mean(A == 0)),
         'A_min': float(np.min(A)),
         'A_max': float(np.max(A)),
         'A_mean': float(np.mean(A)),
@@ -211,14 +173,63 @@ def main():
         'C_ref_std': float(np.std(C)),
         'C_ref_norm': float(np.linalg.norm(C, 'fro'))
     }
+    return A, B, C, metadata
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument('--M', type=int, required=True)
+    p.add_argument('--K', type=int, required=True)
+    p.add_argument('--N', type=int, required=True)
+    p.add_argument('--prec', choices=['int8','fp16','fp32','fp16acc32'], required=True)
+    p.add_argument('--case-id', type=int, required=True, help='Test case ID (0-41)')
+    p.add_argument('--output-dir', type=str, default='../mem', help='Output directory for memory files')
+    p.add_argument('--int8-pack', type=int, choices=INT8_PACKS, default=1,
+                   help='INT8 values per 32-bit .mem word (4 = packed along K, needs INT8_PACK=4 in sim)')
+    p.add_argument('--fp16-pack', type=int, choices=FP16_PACKS, default=1,
+                   help='FP16 values per 32-bit .mem word (2 = packed along K, needs FP16_PACK=2 in sim)')
+    p.add_argument('--b-layout', choices=B_LAYOUTS, default='row',
+                   help="B word order ('col' = transposed, needs B_COLMAJOR=1 in sim)")
+    p.add_argument('--job', type=int, default=0,
+                   help='Batched job index: job n > 0 writes A_n.mem, B_n.mem, ... (tb JOBS > 1)')
+    p.add_argument('--sparse24', action='store_true',
+                   help='Prune A to 2:4 structured sparsity and write it compressed (needs SPARSE=1 in sim)')
+    args = p.parse_args()
+
+    M, K, N = args.M, args.K, args.N
+    pack = word_pack(args.prec, args.int8_pack, args.fp16_pack)
+    if args.sparse24 and (pack != 1 or args.prec == 'fp32'):
+        p.error('--sparse24 needs pack 1 and an int8/fp16/fp16acc32 precision')
+
+    A, B, C, metadata = build_case(M, K, N, args.prec, args.case_id, args.sparse24)
+
+    # Write A.mem
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(exist_ok=True, parents=True)
+    sfx = job_suffix(args.job)
+
+    if args.sparse24:
+        write_mem(output_dir / f'A{sfx}.mem', sparse_a_words(A, args.prec))
+    else:
+        write_mem(output_dir / f'A{sfx}.mem', a_words(A, args.prec, pack))
+
+    # Write B.mem
+    write_mem(output_dir / f'B{sfx}.mem', b_words(B, args.prec, pack, args.b_layout))
+
+    with open(output_dir / f'C_ref{sfx}.csv', 'w', newline='') as fc:
+        w = csv.writer(fc)
+        for i in range(M):
+            w.writerow([float(C[i,j]) for j in range(N)])
+
+    # Save metadata about this test case
+    metadata.update({'word_pack': pack, 'b_layout': args.b_layout, 'job': args.job})
 
-    with open(output_dir / 'test_metadata.json', 'w') as fm:
+    with open(output_dir / f'test_metadata{sfx}.json', 'w') as fm:
         json.dump(metadata, fm, indent=2)
 
-    print(f"Generated test case {args.case_id} ({case['category']} condition)")
-    print(f"  Requested cond(A)={case['cond_A']:.1f}, cond(B)={case['cond_B']:.1f}")
-    print(f"  Actual cond(A)={actual_cond_A:.2f}, cond(B)={actual_cond_B:.2f}")
-    print(f"  Wrote {output_dir}/A.mem, B.mem, C_ref.csv, test_metadata.json")
+    print(f"Generated test case {args.case_id} ({metadata['category']} condition)")
+    print(f"  Requested cond(A)={metadata['requested_cond_A']:.1f}, cond(B)={metadata['requested_cond_B']:.1f}")
+    print(f"  Actual cond(A)={metadata['actual_cond_A']:.2f}, cond(B)={metadata['actual_cond_B']:.2f}")
+    print(f"  Wrote {output_dir}/A{sfx}.mem, B{sfx}.mem, C_ref{sfx}.csv, test_metadata{sfx}.json")
 
 if __name__ == '__main__':
     main()
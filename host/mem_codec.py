@@ -0,0 +1,158 @@
+"""
+.mem word codec for the A/B input memories.
+
+One 32-bit hex word per line, row-major: A is M x K, B is K x N.
+B layout 'col' (B_COLMAJOR=1) stores B transposed instead, N x K, so a
+column's k words are contiguous like a row of A.
+
+Packed layouts put several k values in each word, lowest k in the low bits:
+slot b of A word (i, kw) is A[i, kw*pack + b], slot b of B word (kw, j) is
+B[kw*pack + b, j]. K is zero-padded to a multiple of pack, which leaves every
+dot product unchanged, and the memories become ceil(K/pack) words deep along
+K. The PE consumes a whole word per cycle:
+
+    int8  pack 4 (INT8_PACK=4)  four 8-bit lanes, int8_dot4
+    fp16  pack 2 (FP16_PACK=2)  two 16-bit halves, fp16_dot2
+                                (fp16acc32 stores its FP16 inputs the same way)
+
+Pack 1 (the default) keeps one value per word in the low bits.
+
+2:4 structured-sparse A (SPARSE=1) keeps two entries per group of four k:
+each word holds the value (int8/fp16 encoding, low 16 bits) and its position
+in the group at bit SPARSE_POS_SHIFT. Entry e of a row pairs with B row
+4*(e//2) + position, so an A row is 2*ceil(K/4) words and B stays dense.
+
+Batched runs (tb_top_gemm JOBS > 1) give job n > 0 its own files with a
+_<n> suffix: A_<n>.mem, B_<n>.mem, C_out_<n>.mem.
+"""
+import struct
+
+import numpy as np
+
+INT8_PACKS = (1, 4)
+FP16_PACKS = (1, 2)
+B_LAYOUTS = ('row', 'col')
+
+# 2:4 sparse A: entries kept per group of SPARSE_GROUP k values
+SPARSE_GROUP = 4
+SPARSE_KEEP = 2
+SPARSE_POS_SHIFT = 16
+
+# Bits per value when packed
+VALUE_BITS = {'int8': 8, 'fp16': 16, 'fp32': 32, 'fp16acc32': 16}
+
+
+def f16_from_float(x: float) -> int:
+    return int(np.float16(x).view('H'))
+
+
+def f32_from_float(x: float) -> int:
+    return struct.unpack('<I', struct.pack('<f', x))[0]
+
+
+def f16_to_float(u16: int) -> float:
+    return float(np.uint16(u16).view(np.float16))
+
+
+def f32_to_float(u32: int) -> float:
+    return struct.unpack('<f', struct.pack('<I', u32 & 0xffffffff))[0]
+
+
+def encode(x, prec):
+    """One matrix element as its .mem bit pattern."""
+    if prec == 'int8':
+        return int(x) & 0xff
+    if prec in ('fp16', 'fp16acc32'):
+        return f16_from_float(float(x))
+    return f32_from_float(float(x))
+
+
+def word_pack(prec, int8_pack=1, fp16_pack=1):
+    """Values per word for prec under the INT8_PACK / FP16_PACK settings."""
+    return {'int8': int8_pack, 'fp16': fp16_pack, 'fp16acc32': fp16_pack}.get(prec, 1)
+
+
+def k_words(K, pack=1):
+    """Words along K for one row of A / one column of B."""
+    return (K + pack - 1) // pack
+
+
+def pack_word(values, prec):
+    """Up to 32/VALUE_BITS values into one word, first value in the low bits."""
+    word = 0
+    for b, v in enumerate(values):
+        word |= encode(v, prec) << (VALUE_BITS[prec] * b)
+    return word
+
+
+def a_words(A, prec, pack=1):
+    """A (M x K) as .mem words, row-major over (i, k word)."""
+    M, K = A.shape
+    if pack == 1:
+        return [encode(A[i, k], prec) for i in range(M) for k in range(K)]
+    return [pack_word(A[i, kw*pack:(kw+1)*pack], prec)
+            for i in range(M) for kw in range(k_words(K, pack))]
+
+
+def b_words(B, prec, pack=1, layout='row'):
+    """B (K x N) as .mem words, row-major over (k word, j), or over (j, k word)
+    for layout 'col'."""
+    K, N = B.shape
+    kws = range(k_words(K, pack))
+    if layout == 'col':
+        order = [(kw, j) for j in range(N) for kw in kws]
+    else:
+        order = [(kw, j) for kw in kws for j in range(N)]
+    return [pack_word(B[kw*pack:(kw+1)*pack, j], prec) for kw, j in order]
+
+
+def prune_24(A):
+    """A with all but the SPARSE_KEEP largest magnitudes of each group of four k zeroed."""
+    A = np.array(A, copy=True)
+    for g in range(0, A.shape[1], SPARSE_GROUP):
+        blk = A[:, g:g + SPARSE_GROUP]
+        if blk.shape[1] > SPARSE_KEEP:
+            drop = np.argsort(np.abs(blk), axis=1, kind='stable')[:, :blk.shape[1] - SPARSE_KEEP]
+            np.put_along_axis(blk, drop, 0, axis=1)
+    return A
+
+
+def sparse_a_words(A, prec):
+    """2:4-sparse A (M x K) as .mem entries, SPARSE_KEEP per group of four k."""
+    if VALUE_BITS[prec] > SPARSE_POS_SHIFT:
+        raise ValueError(f"{prec} values leave no room for sparse positions")
+    M, K = A.shape
+    words = []
+    for i in range(M):
+        for g in range(0, K, SPARSE_GROUP):
+            width = min(SPARSE_GROUP, K - g)
+            nz = [p for p in range(width) if A[i, g + p] != 0]
+            if len(nz) > SPARSE_KEEP:
+                raise ValueError(f"A row {i}, k group {g // SPARSE_GROUP} is not 2:4 sparse")
+            # Zero entries point at real k, so no B row past K is read
+            fill = ([p for p in range(width) if p not in nz] + [0] * SPARSE_KEEP)
+            entries = ([(p, A[i, g + p]) for p in nz] +
+                       [(p, 0) for p in fill[:SPARSE_KEEP - len(nz)]])
+            words += [encode(v, prec) | (p << SPARSE_POS_SHIFT) for p, v in entries]
+    return words
+
+
+def decode_c(word, prec):
+    """One C word as a number. C is never packed: an INT8 accumulator, an FP16
+    result in the low half, or FP32 (fp32, and fp16acc32's FP32 accumulator)."""
+    if prec == 'int8':
+        return int(word) - (1 << 32) if word & 0x80000000 else int(word)
+    if prec == 'fp16':
+        return f16_to_float(word & 0xffff)
+    return f32_to_float(word)
+
+
+def job_suffix(job=0):
+    """File name suffix for batched job `job` (job 0 keeps the plain names)."""
+    return '' if job == 0 else f'_{job}'
+
+
+def write_mem(path, words):
+    with open(path, 'w') as f:
+        for w in words:
+            f.write(f"{w:08x}\n")
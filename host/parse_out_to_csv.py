@@ -1,23 +1,23 @@
 
-import argparse, struct, csv, numpy as np
+import argparse, csv
 
-def f16_to_float(u16: int) -> float:
-    return float(np.float16(np.uint16(u16)))
-
-def f32_to_float(u32: int) -> float:
-    import struct
-    return struct.unpack('<f', struct.pack('<I', u32 & 0xffffffff))[0]
+# C is never packed: one INT8 accumulator / FP16 / FP32 result per word,
+# whatever INT8_PACK / FP16_PACK the A/B memories used
+from mem_codec import decode_c, job_suffix
 
 def main():
     p = argparse.ArgumentParser()
     p.add_argument('--M', type=int, required=True)
     p.add_argument('--N', type=int, required=True)
-    p.add_argument('--prec', choices=['int8','fp16','fp32'], required=True)
+    p.add_argument('--prec', choices=['int8','fp16','fp32','fp16acc32'], required=True)
+    p.add_argument('--job', type=int, default=0,
+                   help='Batched job index: job n > 0 reads C_out_n.mem (tb JOBS > 1)')
     args = p.parse_args()
+    sfx = job_suffix(args.job)
 
     vals = []
     undefined_count = 0
-    with open('../mem/C_out.mem','r') as f:
+    with open(f'../mem/C_out{sfx}.mem','r') as f:
         for line_num, line in enumerate(f, 1):
             t = line.strip()
             if not t: continue
@@ -33,24 +33,14 @@ def main():
         print(f"Warning: Found {undefined_count} undefined value(s) in output")
 
     M,N = args.M, args.N
-    assert len(vals) >= M*N, "C_out.mem smaller than expected"
+    assert len(vals) >= M*N, f"C_out{sfx}.mem smaller than expected"
 
-    with open('../mem/C_out.csv','w', newline='') as fc:
+    with open(f'../mem/C_out{sfx}.csv','w', newline='') as fc:
         w = csv.writer(fc)
         for i in range(M):
-            row = []
-            for j in range(N):
-                u = vals[i*N + j]
-                if args.prec=='int8':
-                    if u & 0x80000000: u = -((~u + 1) & 0xffffffff)
-                    row.append(int(u))
-                elif args.prec=='fp16':
-                    row.append(f16_to_float(u & 0xffff))
-                else:
-                    row.append(f32_to_float(u))
-            w.writerow(row)
-
-    print("Wrote mem/C_out.csv")
+            w.writerow([decode_c(vals[i*N + j], args.prec) for j in range(N)])
+
+    print(f"Wrote mem/C_out{sfx}.csv")
 
 if __name__=='__main__':
     main()
@@ -0,0 +1,178 @@
+"""
+Row-count independent drawing helpers for the visualization scripts.
+
+Series with up to MAX_SCATTER_POINTS rows are drawn as plain scatter plots,
+exactly as before. Larger series are first reduced with vectorized NumPy
+binning, so the artists handed to matplotlib are bounded by the bin count
+rather than the number of result rows:
+
+    scatter_or_band()         - median line plus 10-90% quantile band per x bin
+    scatter_or_hist2d()       - 2D histogram (point density)
+    scatter_or_binned_mean()  - per-cell mean of a color value
+    binned_mean_points()      - one (x, y, mean z) point per cell, for 3D plots
+
+Axes flagged as log are binned in log10 space, matching the log-scaled axes
+of the condition-number plots.
+"""
+import numpy as np
+
+MAX_SCATTER_POINTS = 5000
+X_BINS = 50
+GRID_BINS = 60
+QUANTILES = (0.1, 0.5, 0.9)
+
+# Sequential colormap matching each precision's scatter color
+DENSITY_CMAPS = {'red': 'Reds', 'green': 'Greens', 'blue': 'Blues'}
+
+
+def is_large(x):
+    return len(x) > MAX_SCATTER_POINTS
+
+
+def finite_mask(values, log):
+    values = np.asarray(values, dtype=float)
+    mask = np.isfinite(values)
+    if log:
+        mask &= values > 0
+    return mask
+
+
+def bin_edges(values, bins, log):
+    """`bins` equal-width edges over the data range (in log10 space if `log`)."""
+    v = np.log10(values) if log else values
+    lo, hi = v.min(), v.max()
+    if hi <= lo:
+        lo, hi = lo - 0.5, hi + 0.5
+    edges = np.linspace(lo, hi, bins + 1)
+    return 10.0 ** edges if log else edges
+
+
+def bin_centers(edges, log):
+    if log:
+        return np.sqrt(edges[:-1] * edges[1:])
+    return 0.5 * (edges[:-1] + edges[1:])
+
+
+def bin_index(values, edges):
+    return np.clip(np.searchsorted(edges, values, side='right') - 1, 0, len(edges) - 2)
+
+
+def binned_quantiles(x, y, edges, quantiles=QUANTILES):
+    """Per-bin quantiles of y, shape (len(quantiles), bins), plus bin counts.
+
+    One lexsort by (bin, y) replaces a per-bin loop: each bin's values are a
+    contiguous sorted run, so quantiles are direct (interpolated) lookups.
+    """
+    nbins = len(edges) - 1
+    idx = bin_index(x, edges)
+    ys = y[np.lexsort((y, idx))]
+    counts = np.bincount(idx, minlength=nbins)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    out = np.full((len(quantiles), nbins), np.nan)
+    filled = counts > 0
+    for k, q in enumerate(quantiles):
+        pos = starts[filled] + q * (counts[filled] - 1)
+        lo = np.floor(pos).astype(np.int64)
+        hi = np.ceil(pos).astype(np.int64)
+        frac = pos - lo
+        out[k, filled] = ys[lo] * (1 - frac) + ys[hi] * frac
+    return out, counts
+
+
+def binned_mean_2d(x, y, c, x_edges, y_edges):
+    """Mean of c and point count per (x, y) cell; empty cells are NaN."""
+    counts, _, _ = np.histogram2d(x, y, bins=[x_edges, y_edges])
+    sums, _, _ = np.histogram2d(x, y, bins=[x_edges, y_edges], weights=c)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = sums / counts
+    return np.where(counts > 0, means, np.nan), counts
+
+
+def binned_mean_points(x, y, z, bins=GRID_BINS):
+    """Collapse (x, y, z) points to one point per non-empty (x, y) cell at mean z."""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    z = np.asarray(z, dtype=float)
+    mask = np.isfinite(x) & np.isfinite(y) & np.isfinite(z)
+    x, y, z = x[mask], y[mask], z[mask]
+    if len(x) == 0:
+        return x, y, z
+
+    x_edges = bin_edges(x, bins, False)
+    y_edges = bin_edges(y, bins, False)
+    means, counts = binned_mean_2d(x, y, z, x_edges, y_edges)
+    ix, iy = np.nonzero(counts)
+    return (bin_centers(x_edges, False)[ix], bin_centers(y_edges, False)[iy],
+            means[ix, iy])
+
+
+def scatter_or_band(ax, x, y, color, label=None, marker='o', logx=False, logy=False,
+                    bins=X_BINS, **scatter_kwargs):
+    """Scatter small series; draw a median line and 10-90% band for large ones."""
+    if not is_large(x):
+        ax.scatter(x, y, label=label, color=color, marker=marker, **scatter_kwargs)
+        return
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    mask = finite_mask(x, logx) & finite_mask(y, logy)
+    x, y = x[mask], y[mask]
+    if len(x) == 0:
+        return
+
+    edges = bin_edges(x, bins, logx)
+    (q_lo, q_mid, q_hi), counts = binned_quantiles(x, y, edges)
+    centers = bin_centers(edges, logx)
+    filled = counts > 0
+
+    # Empty bins stay NaN so the band and median line break across gaps
+    ax.fill_between(centers, q_lo, q_hi, where=filled,
+                    color=color, alpha=0.2, linewidth=0)
+    ax.plot(centers, q_mid, '-', color=color, marker=marker,
+            markersize=4, linewidth=1.5,
+            label=f'{label} median, 10-90% (n={len(x):,})' if label else None)
+
+
+def scatter_or_hist2d(ax, x, y, color, label=None, marker='o', logx=False, logy=False,
+                      bins=GRID_BINS, **scatter_kwargs):
+    """Scatter small series; draw a 2D point-density histogram for large ones."""
+    if not is_large(x):
+        ax.scatter(x, y, label=label, color=color, marker=marker, **scatter_kwargs)
+        return None
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    mask = finite_mask(x, logx) & finite_mask(y, logy)
+    x, y = x[mask], y[mask]
+    if len(x) == 0:
+        return None
+
+    x_edges = bin_edges(x, bins, logx)
+    y_edges = bin_edges(y, bins, logy)
+    counts, _, _ = np.histogram2d(x, y, bins=[x_edges, y_edges])
+    return ax.pcolormesh(x_edges, y_edges, np.ma.masked_equal(counts.T, 0),
+                         cmap=DENSITY_CMAPS.get(color, 'viridis'))
+
+
+def scatter_or_binned_mean(ax, x, y, c, logx=False, logy=False, bins=GRID_BINS,
+                           cmap='viridis', **scatter_kwargs):
+    """Scatter colored by c for small series; per-cell mean of c for large ones.
+
+    Returns the mappable for a colorbar.
+    """
+    if not is_large(x):
+        return ax.scatter(x, y, c=c, cmap=cmap, **scatter_kwargs)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    c = np.asarray(c, dtype=float)
+    mask = finite_mask(x, logx) & finite_mask(y, logy) & np.isfinite(c)
+    x, y, c = x[mask], y[mask], c[mask]
+    if len(x) == 0:
+        return ax.scatter([], [], c=[], cmap=cmap)
+
+    x_edges = bin_edges(x, bins, logx)
+    y_edges = bin_edges(y, bins, logy)
+    means, _ = binned_mean_2d(x, y, c, x_edges, y_edges)
+    return ax.pcolormesh(x_edges, y_edges, np.ma.masked_invalid(means.T), cmap=cmap)
@@ -0,0 +1,222 @@
+"""
+Shared plot rendering driver for the visualization scripts.
+
+Each plot is a plain function `plot_fn(ctx, out_path, dpi)` registered in a
+PLOTS list of (filename, title, plot_fn, columns) entries, where `columns`
+are the result columns the plot reads. `ctx` is the dict returned by
+load_context(): the analysis_data tables plus per-precision row splits.
+
+render_plots() renders the selected plots in a process pool and skips any
+plot whose output exists and whose digest is unchanged. The digest covers
+the plot's data slice (its columns of the successful rows, index included),
+the source of the plot function and the helpers/constants it references,
+and the dpi. Digests are kept in <plots dir>/.plot_state.json.
+
+A plot function returns None when it saved its figure, or a short reason
+string when it had nothing to draw.
+"""
+import hashlib
+import inspect
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import matplotlib
+matplotlib.use('Agg')
+import pandas as pd
+
+import analysis_data
+
+STATE_FILE = '.plot_state.json'
+DEFAULT_DPI = 300
+PREVIEW_DPI = 72
+
+# Worker-side context, loaded once per process by init_worker()
+_CTX = None
+
+
+def load_context(path):
+    """Analysis tables plus {precision: rows} for the plot functions."""
+    ctx = dict(analysis_data.load_analysis_data(path))
+    ctx['prec_rows'] = analysis_data.split_by_precision(ctx['success'])
+    ctx['no_rows'] = ctx['success'].iloc[:0]
+    return ctx
+
+
+def add_plot_args(parser, results_file):
+    parser.add_argument('--input', type=str, default=str(results_file),
+                        help='Results CSV (default: results/comprehensive_results.csv)')
+    parser.add_argument('--only', nargs='+', metavar='PLOT',
+                        help='Render only these plots (number, e.g. 3, or part of the file name)')
+    parser.add_argument('--dpi', type=int, default=None,
+                        help=f'Output resolution (default: {DEFAULT_DPI}, {PREVIEW_DPI} with --preview)')
+    parser.add_argument('--preview', action='store_true',
+                        help='Fast low-DPI render into plots/preview/')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Worker processes (default: CPU count, 1 = render in-process)')
+    parser.add_argument('--force', action='store_true',
+                        help='Re-render even if data and code are unchanged')
+    parser.add_argument('--list', action='store_true',
+                        help='List available plots and exit')
+
+
+def select_plots(plots, only):
+    if not only:
+        return list(plots)
+    selected = []
+    for idx, entry in enumerate(plots, start=1):
+        filename = entry[0]
+        for key in only:
+            if (key.isdigit() and int(key) == idx) or key.lower() in filename.lower():
+                selected.append(entry)
+                break
+    return selected
+
+
+def output_settings(args, plots_dir):
+    """(output directory, dpi) for the parsed CLI arguments."""
+    if args.preview:
+        return plots_dir / 'preview', args.dpi or PREVIEW_DPI
+    return plots_dir, args.dpi or DEFAULT_DPI
+
+
+def code_digest(func):
+    """Hash a plot function plus the helpers and constants it uses.
+
+    Covers same-module functions and constants, and the full source of any
+    host/ helper module (e.g. plot_agg) the function references.
+    """
+    module = sys.modules[func.__module__]
+    host_dir = Path(__file__).resolve().parent
+    h = hashlib.sha1(inspect.getsource(func).encode())
+    for name in sorted(func.__code__.co_names):
+        obj = getattr(module, name, None)
+        if inspect.isfunction(obj) and obj.__module__ == func.__module__:
+            h.update(inspect.getsource(obj).encode())
+        elif inspect.ismodule(obj) and getattr(obj, '__file__', None) and \
+                Path(obj.__file__).resolve().parent == host_dir:
+            h.update(inspect.getsource(obj).encode())
+        elif isinstance(obj, (dict, list, tuple, str, int, float)):
+            h.update(f'{name}={obj!r}'.encode())
+    return h.hexdigest()
+
+
+def data_digest(df, columns):
+    cols = ['precision'] + [c for c in columns if c in df.columns and c != 'precision']
+    h = hashlib.sha1(','.join(cols).encode())
+    h.update(pd.util.hash_pandas_object(df[cols], index=True).values.tobytes())
+    return h.hexdigest()
+
+
+def load_state(out_dir):
+    try:
+        with open(out_dir / STATE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(out_dir, state):
+    tmp = out_dir / (STATE_FILE + '.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp, out_dir / STATE_FILE)
+
+
+def init_worker(results_file):
+    global _CTX
+    _CTX = load_context(results_file)
+
+
+def render_one(func, out_path, dpi):
+    t0 = time.time()
+    reason = func(_CTX, Path(out_path), dpi)
+    return reason, time.time() - t0
+
+
+def render_plots(plots, ctx, results_file, out_dir, dpi, jobs=None, force=False):
+    """Render `plots` into out_dir, skipping unchanged ones. Returns counts."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    state = load_state(out_dir)
+    success = ctx['success']
+
+    todo = []
+    counts = {'rendered': 0, 'unchanged': 0, 'skipped': 0, 'failed': 0}
+    for filename, title, func, columns in plots:
+        digest = hashlib.sha1(
+            f'{code_digest(func)}:{data_digest(success, columns)}:{dpi}'.encode()
+        ).hexdigest()
+        if not force and state.get(filename) == digest and (out_dir / filename).exists():
+            print(f"    Unchanged: {filename}")
+            counts['unchanged'] += 1
+            continue
+        todo.append((filename, title, func, digest))
+
+    if not todo:
+        return counts
+
+    jobs = min(jobs or os.cpu_count() or 1, len(todo))
+
+    def finish(filename, digest, reason, elapsed):
+        if reason:
+            print(f"    Skipped: {filename} ({reason})")
+            state.pop(filename, None)
+            counts['skipped'] += 1
+        else:
+            print(f"    Saved: {filename} ({elapsed:.1f}s)")
+            state[filename] = digest
+            counts['rendered'] += 1
+
+    if jobs == 1:
+        global _CTX
+        _CTX = ctx
+        for filename, title, func, digest in todo:
+            print(f"    Rendering {title}...")
+            reason, elapsed = render_one(func, out_dir / filename, dpi)
+            finish(filename, digest, reason, elapsed)
+    else:
+        print(f"    Rendering {len(todo)} plot(s) with {jobs} workers...")
+        with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker,
+                                 initargs=(str(results_file),)) as pool:
+            futures = {pool.submit(render_one, func, str(out_dir / filename), dpi): (filename, digest)
+                       for filename, title, func, digest in todo}
+            for future in as_completed(futures):
+                filename, digest = futures[future]
+                try:
+                    reason, elapsed = future.result()
+                except Exception as e:
+                    print(f"    [ERROR] {filename}: {e}")
+                    state.pop(filename, None)
+                    counts['failed'] += 1
+                    continue
+                finish(filename, digest, reason, elapsed)
+
+    save_state(out_dir, state)
+    return counts
+
+
+def run(plots, ctx, args, plots_dir):
+    """Render the plots selected by the CLI. Returns the output dir, None on bad selection."""
+    out_dir, dpi = output_settings(args, plots_dir)
+    selected = select_plots(plots, args.only)
+    if not selected:
+        print(f"[ERROR] No plots match: {' '.join(args.only)}")
+        return None
+
+    print(f"\nGenerating {len(selected)} plot(s) in: {out_dir} (dpi={dpi})")
+    print("=" * 80)
+    t0 = time.time()
+    counts = render_plots(selected, ctx, args.input, out_dir, dpi,
+                          jobs=args.jobs, force=args.force)
+    print(f"\n{counts['rendered']} rendered, {counts['unchanged']} unchanged, "
+          f"{counts['skipped']} skipped, {counts['failed']} failed "
+          f"in {time.time() - t0:.1f}s")
+    return out_dir
+
+
+def list_plots(plots):
+    for idx, (filename, title, func, columns) in enumerate(plots, start=1):
+        print(f"  {idx:2d}. {filename:38s} {title}")
@@ -0,0 +1,88 @@
+"""
+Comprehensive sweep through the cocotb testbench (tb/cocotb/test_top_gemm.py).
+
+Builds top_gemm once per precision with cocotb's runner and runs every case in
+one simulator process: matrices go into the BRAMs and C comes back through the
+c_dbg port in memory, so there are no .mem files and no simulator launch per
+case. Rows use the run_comprehensive_test.py schema.
+
+The structural knobs are the run_xsim_simple.bat variables (PIPELINED, LANES,
+TILE, INT8_PACK, FP16_PACK, DBUF, B_COLMAJOR, SPARSE); JOBS does not apply,
+each case is one job. SIM picks the cocotb simulator (default: verilator, which
+must be on PATH as 'verilator'); FP cores come from src/fp_ieee.sv (FP_BEHAV).
+
+Usage:
+    python run_cocotb.py
+    python run_cocotb.py --precs int8,fp16 --cases 10 --M 16 --K 16 --N 16
+    SIM=icarus LANES=2 PIPELINED=1 python run_cocotb.py
+"""
+import argparse
+import csv
+import os
+from datetime import datetime
+
+from cocotb_tools.runner import get_runner
+
+from run_comprehensive_test import HEADER
+from sim_backend import ROOT, SRC, rtl_sources, sim_defines
+
+PRECS = ['int8', 'fp16', 'fp32', 'fp16acc32']
+PREC_SEL = {'int8': 0, 'fp16': 1, 'fp32': 2, 'fp16acc32': 3}
+# top_gemm parameters taken from the run_xsim_simple.bat variables
+PARAMS = ['PIPELINED', 'LANES', 'TILE', 'INT8_PACK', 'FP16_PACK', 'DBUF', 'B_COLMAJOR', 'SPARSE']
+TOP = 'top_gemm'
+
+
+def build_params(prec, defs):
+    """top_gemm parameters for one precision; the BRAMs start empty (no $readmemh)."""
+    params = {k: defs[k] for k in PARAMS}
+    params.update(PREC=PREC_SEL[prec], A_INIT='""', B_INIT='""')
+    return params
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument('--precs', type=str, default=','.join(PRECS))
+    p.add_argument('--cases', type=int, default=42, help='Cases per precision (ids 0..n-1)')
+    p.add_argument('--M', type=int, default=8)
+    p.add_argument('--K', type=int, default=8)
+    p.add_argument('--N', type=int, default=8)
+    p.add_argument('--sim', type=str, default=os.environ.get('SIM', 'verilator'))
+    p.add_argument('--output', type=str, default=str(ROOT / 'results' / 'cocotb_results.csv'))
+    args = p.parse_args()
+
+    defs = sim_defines(os.environ)
+    out = os.path.abspath(args.output)
+    os.makedirs(os.path.dirname(out), exist_ok=True)
+    with open(out, 'w', newline='') as f:
+        csv.writer(f).writerow(HEADER)
+
+    runner = get_runner(args.sim)
+    for prec in args.precs.split(','):
+        build_dir = ROOT / 'build' / 'cocotb' / args.sim / prec
+        runner.build(
+            sources=rtl_sources(),
+            includes=[SRC],
+            defines={'FP_BEHAV': 1},
+            parameters=build_params(prec, defs),
+            hdl_toplevel=TOP,
+            build_dir=build_dir,
+            build_args=['-Wno-fatal', '-Wno-lint', '-Wno-style'] if args.sim == 'verilator' else [],
+        )
+        env = {k: defs[k] for k in PARAMS}
+        env.update(GEMM_PREC=prec, GEMM_M=str(args.M), GEMM_K=str(args.K), GEMM_N=str(args.N),
+                   GEMM_CASES=','.join(str(c) for c in range(args.cases)), GEMM_RESULTS=out)
+        runner.test(
+            test_module='test_top_gemm',
+            hdl_toplevel=TOP,
+            test_dir=ROOT / 'tb' / 'cocotb',
+            build_dir=build_dir,
+            extra_env=env,
+            results_xml=str(build_dir / 'results.xml'),
+        )
+
+    print(f"\n{datetime.now().isoformat(timespec='seconds')}: results in {out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,9 @@
 """
 Comprehensive test runner for mixed-precision matrix multiplication.
-Runs 42 test cases across 3 precisions (126 total simulations).
+Runs 42 test cases across 4 precision modes (168 total simulations);
+TEST_PRECISIONS=int8,fp16,... restricts the modes.
 Collects extensive metrics for analysis.
+SIM_BACKEND=xsim|verilator selects the simulator (see sim_backend.py).
 """
 
 import os
@@ -13,6 +15,9 @@ import json
 import numpy as np
 from datetime import datetime
 
+from cycle_model import parse_cycles
+from sim_backend import get_backend
+
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 HOST = ROOT / "host"
 MEM = ROOT / "mem"
@@ -151,7 +156,7 @@ def compute_comprehensive_metrics(C_ref, C_out, prec='fp32', sim_time=0, M=8, K=
     inf_nan_count = np.sum(~np.isfinite(C_out))
 
     # ULP (Units in Last Place) error for floating point
-    if prec in ['fp16', 'fp32']:
+    if prec in ['fp16', 'fp32', 'fp16acc32']:
         # Approximate ULP error
         ulp_errors = np.abs(diff) / (np.abs(C_ref) + np.finfo(np.float32).eps)
         ulp_error_mean = float(np.mean(ulp_errors))
@@ -237,58 +242,137 @@ def compute_comprehensive_metrics(C_ref, C_out, prec='fp32', sim_time=0, M=8, K=
         'q4_error': q4_error,
     }
 
-PRECODES = {"int8": 0, "fp16": 1, "fp32": 2}
-
-def main():
-    # Configuration
-    M, K, N = 8, 8, 8  # Matrix dimensions
-    precs = ["int8", "fp16", "fp32"]
-    num_cases = 42
-
-    # Prepare results file
-    results_file = RES / "comprehensive_results.csv"
-    all_results = []
-
-    # CSV header
-    header = [
-        'timestamp', 'case_id', 'category', 'precision',
-        'M', 'K', 'N',
-        'requested_cond_A', 'requested_cond_B',
-        'actual_cond_A', 'actual_cond_B',
-        'A_min', 'A_max', 'A_mean', 'A_std',
-        'B_min', 'B_max', 'B_mean', 'B_std',
-        'C_ref_min', 'C_ref_max', 'C_ref_mean', 'C_ref_std',
-        'mae', 'rmse', 'max_abs_error',
-        'rel_mae', 'rel_rmse', 'max_rel_error',
-        'norm_rel_error',
-        'C_out_mean', 'C_out_std', 'mean_bias',
-        'p50_error', 'p90_error', 'p95_error', 'p99_error',
-        'snr_db', 'correlation',
-        'acc_1pct', 'acc_5pct', 'acc_10pct',
-        'norm_C_ref', 'norm_diff',
+# Results CSV columns (one row per case and precision)
+HEADER = [
+    'timestamp', 'case_id', 'category', 'precision',
+    'M', 'K', 'N',
+    'requested_cond_A', 'requested_cond_B',
+    'actual_cond_A', 'actual_cond_B',
+    'A_min', 'A_max', 'A_mean', 'A_std',
+    'B_min', 'B_max', 'B_mean', 'B_std',
+    'C_ref_min', 'C_ref_max', 'C_ref_mean', 'C_ref_std',
+    'mae', 'rmse', 'max_abs_error',
+    'rel_mae', 'rel_rmse', 'max_rel_error',
+    'norm_rel_error',
+    'C_out_mean', 'C_out_std', 'mean_bias',
+    'p50_error', 'p90_error', 'p95_error', 'p99_error',
+    'snr_db', 'correlation',
+    'acc_1pct', 'acc_5pct', 'acc_10pct',
+    'norm_C_ref', 'norm_diff',
+    # Hardware performance
+    'total_operations', 'ops_per_second', 'gops',
+    'sim_cycles', 'macs_per_cycle', 'lanes',
+    # Precision quality
+    'effective_bits',
+    # Error patterns
+    'error_tail_concentration', 'error_outlier_ratio', 'bias_fraction',
+    # Range utilization
+    'int8_range_utilization_pct',
+    # Bit-level errors
+    'sign_error_count', 'sign_error_pct',
+    # Spatial error patterns
+    'max_row_error', 'max_col_error', 'error_spatial_variance',
+    # Error distribution
+    'error_skewness', 'error_kurtosis', 'p25_error', 'p75_error',
+    # Underflow/overflow detection
+    'unexpected_zeros_count', 'zero_error_pct', 'inf_nan_count',
+    # Floating-point specific
+    'ulp_error_mean', 'ulp_error_max',
+    # Error accumulation
+    'quadrant_error_variance', 'q1_error', 'q2_error', 'q3_error', 'q4_error',
+    'sim_time_sec', 'status'
+]
+
+def result_row(case_id, prec, M, K, N, metadata, metrics, cycles, lanes, sim_time, status):
+    """One HEADER row; cycles is parse_cycles() output (or None)."""
+    return [
+        datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        case_id,
+        metadata['category'],
+        prec,
+        M, K, N,
+        metadata['requested_cond_A'],
+        metadata['requested_cond_B'],
+        metadata['actual_cond_A'],
+        metadata['actual_cond_B'],
+        metadata['A_min'], metadata['A_max'],
+        metadata['A_mean'], metadata['A_std'],
+        metadata['B_min'], metadata['B_max'],
+        metadata['B_mean'], metadata['B_std'],
+        metadata['C_ref_min'], metadata['C_ref_max'],
+        metadata['C_ref_mean'], metadata['C_ref_std'],
+        metrics['mae'], metrics['rmse'], metrics['max_abs_error'],
+        metrics['rel_mae'], metrics['rel_rmse'], metrics['max_rel_error'],
+        metrics['norm_rel_error'],
+        metrics['C_out_mean'], metrics['C_out_std'], metrics['mean_bias'],
+        metrics['p50_error'], metrics['p90_error'],
+        metrics['p95_error'], metrics['p99_error'],
+        metrics['snr_db'], metrics['correlation'],
+        metrics['acc_1pct'], metrics['acc_5pct'], metrics['acc_10pct'],
+        metrics['norm_C_ref'], metrics['norm_diff'],
         # Hardware performance
-        'total_operations', 'ops_per_second', 'gops',
+        metrics['total_operations'], metrics['ops_per_second'], metrics['gops'],
+        cycles['cycles'] if cycles else np.nan,
+        cycles['macs'] / cycles['cycles'] if cycles else np.nan,
+        cycles['lanes'] if cycles else lanes,
         # Precision quality
-        'effective_bits',
+        metrics['effective_bits'],
         # Error patterns
-        'error_tail_concentration', 'error_outlier_ratio', 'bias_fraction',
+        metrics['error_tail_concentration'], metrics['error_outlier_ratio'], metrics['bias_fraction'],
         # Range utilization
-        'int8_range_utilization_pct',
+        metrics['int8_range_utilization_pct'],
         # Bit-level errors
-        'sign_error_count', 'sign_error_pct',
+        metrics['sign_error_count'], metrics['sign_error_pct'],
         # Spatial error patterns
-        'max_row_error', 'max_col_error', 'error_spatial_variance',
+        metrics['max_row_error'], metrics['max_col_error'], metrics['error_spatial_variance'],
         # Error distribution
-        'error_skewness', 'error_kurtosis', 'p25_error', 'p75_error',
+        metrics['error_skewness'], metrics['error_kurtosis'], metrics['p25_error'], metrics['p75_error'],
         # Underflow/overflow detection
-        'unexpected_zeros_count', 'zero_error_pct', 'inf_nan_count',
+        metrics['unexpected_zeros_count'], metrics['zero_error_pct'], metrics['inf_nan_count'],
         # Floating-point specific
-        'ulp_error_mean', 'ulp_error_max',
+        metrics['ulp_error_mean'], metrics['ulp_error_max'],
         # Error accumulation
-        'quadrant_error_variance', 'q1_error', 'q2_error', 'q3_error', 'q4_error',
-        'sim_time_sec', 'status'
+        metrics['quadrant_error_variance'], metrics['q1_error'], metrics['q2_error'],
+        metrics['q3_error'], metrics['q4_error'],
+        sim_time,
+        status
     ]
 
+def error_row(case_id, prec, M, K, N, sim_time, status):
+    """HEADER row for a failed case: metrics are NaN."""
+    return [
+        datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        case_id,
+        'unknown',
+        prec,
+        M, K, N,
+    ] + [np.nan] * (len(HEADER) - 8) + [sim_time, status]
+
+PRECODES = {"int8": 0, "fp16": 1, "fp32": 2, "fp16acc32": 3}
+
+def main():
+    # Configuration
+    M, K, N = 8, 8, 8  # Matrix dimensions
+    # fp16acc32: FP16 inputs, FP32 products and accumulation (PREC_SEL=3)
+    precs = os.environ.get('TEST_PRECISIONS', 'int8,fp16,fp32,fp16acc32').split(',')
+    num_cases = 42
+    # Output lanes of the pipelined controller (LANES > 1 implies PIPELINED=1)
+    lanes = int(os.environ.get('LANES', '1'))
+    # INT8 values per A/B word (4 = packed .mem words, int8_dot4 PEs)
+    int8_pack = int(os.environ.get('INT8_PACK', '1'))
+    # FP16 values per A/B word (2 = packed halves, fp16_dot2 PEs)
+    fp16_pack = int(os.environ.get('FP16_PACK', '1'))
+    # B stored transposed for contiguous reads along K
+    b_colmajor = os.environ.get('B_COLMAJOR', '0') == '1'
+    # 2:4 structured-sparse A (FP32 A words have no room for positions, so it stays dense)
+    sparse = os.environ.get('SPARSE', '0') == '1'
+
+    backend = get_backend()
+
+    # Prepare results file
+    results_file = RES / "comprehensive_results.csv"
+    all_results = []
+
     # Check for quick test mode
     max_cases = num_cases
     if os.environ.get('QUICK_TEST') == 'true':
@@ -298,7 +382,7 @@ def main():
 
     with open(results_file, 'w', newline='') as fc:
         w = csv.writer(fc)
-        w.writerow(header)
+        w.writerow(HEADER)
 
         total_runs = max_cases * len(precs)
         run_count = 0
@@ -313,6 +397,7 @@ def main():
                 start_time = time.time()
                 status = "success"
 
+                sparse_prec = sparse and prec != 'fp32'
                 try:
                     # Step 1: Generate test matrices with controlled condition numbers
                     print(f"\n[1/4] Generating matrices...")
@@ -320,8 +405,11 @@ def main():
                         "python", "gen_cond_mems.py",
                         "--M", str(M), "--K", str(K), "--N", str(N),
                         "--prec", prec,
-                        "--case-id", str(case_id)
-                    ], cwd=HOST)
+                        "--case-id", str(case_id),
+                        "--int8-pack", str(int8_pack),
+                        "--fp16-pack", str(fp16_pack),
+                        "--b-layout", "col" if b_colmajor else "row"
+                    ] + (["--sparse24"] if sparse_prec else []), cwd=HOST)
 
                     if result is None:
                         status = "gen_failed"
@@ -332,20 +420,27 @@ def main():
                         metadata = json.load(f)
 
                     # Step 2: Run simulation
-                    print(f"\n[2/4] Running xsim simulation...")
+                    print(f"\n[2/4] Running {backend.name} simulation...")
                     env = os.environ.copy()
                     env["PREC_SEL"] = str(PRECODES[prec])
                     env["M"], env["K"], env["N"] = str(M), str(K), str(N)
+                    env["LANES"] = str(lanes)
+                    env["INT8_PACK"] = str(int8_pack)
+                    env["FP16_PACK"] = str(fp16_pack)
+                    env["B_COLMAJOR"] = "1" if b_colmajor else "0"
+                    env["SPARSE"] = "1" if sparse_prec else "0"
+                    if lanes > 1:
+                        env.setdefault("PIPELINED", "1")
 
-                    # Run xsim directly (simplified version without TCL batch)
-                    result = run([
-                        str(ROOT / "scripts" / "run_xsim_simple.bat")
-                    ], env=env)
+                    sim_log = backend.run(env)
 
-                    if result is None:
+                    if sim_log is None:
                         status = "sim_failed"
                         raise Exception("Simulation failed")
 
+                    # Cycle count from the testbench CYCLES line
+                    cycles = parse_cycles(sim_log)
+
                     # Step 3: Parse output
                     print(f"\n[3/4] Parsing output...")
                     result = run([
@@ -366,56 +461,8 @@ def main():
                     sim_time = time.time() - start_time
                     metrics = compute_comprehensive_metrics(C_ref, C_out, prec=prec, sim_time=sim_time, M=M, K=K, N=N)
 
-                    # Prepare row
-                    row = [
-                        datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                        case_id,
-                        metadata['category'],
-                        prec,
-                        M, K, N,
-                        metadata['requested_cond_A'],
-                        metadata['requested_cond_B'],
-                        metadata['actual_cond_A'],
-                        metadata['actual_cond_B'],
-                        metadata['A_min'], metadata['A_max'],
-                        metadata['A_mean'], metadata['A_std'],
-                        metadata['B_min'], metadata['B_max'],
-                        metadata['B_mean'], metadata['B_std'],
-                        metadata['C_ref_min'], metadata['C_ref_max'],
-                        metadata['C_ref_mean'], metadata['C_ref_std'],
-                        metrics['mae'], metrics['rmse'], metrics['max_abs_error'],
-                        metrics['rel_mae'], metrics['rel_rmse'], metrics['max_rel_error'],
-                        metrics['norm_rel_error'],
-                        metrics['C_out_mean'], metrics['C_out_std'], metrics['mean_bias'],
-                        metrics['p50_error'], metrics['p90_error'],
-                        metrics['p95_error'], metrics['p99_error'],
-                        metrics['snr_db'], metrics['correlation'],
-                        metrics['acc_1pct'], metrics['acc_5pct'], metrics['acc_10pct'],
-                        metrics['norm_C_ref'], metrics['norm_diff'],
-                        # Hardware performance
-                        metrics['total_operations'], metrics['ops_per_second'], metrics['gops'],
-                        # Precision quality
-                        metrics['effective_bits'],
-                        # Error patterns
-                        metrics['error_tail_concentration'], metrics['error_outlier_ratio'], metrics['bias_fraction'],
-                        # Range utilization
-                        metrics['int8_range_utilization_pct'],
-                        # Bit-level errors
-                        metrics['sign_error_count'], metrics['sign_error_pct'],
-                        # Spatial error patterns
-                        metrics['max_row_error'], metrics['max_col_error'], metrics['error_spatial_variance'],
-                        # Error distribution
-                        metrics['error_skewness'], metrics['error_kurtosis'], metrics['p25_error'], metrics['p75_error'],
-                        # Underflow/overflow detection
-                        metrics['unexpected_zeros_count'], metrics['zero_error_pct'], metrics['inf_nan_count'],
-                        # Floating-point specific
-                        metrics['ulp_error_mean'], metrics['ulp_error_max'],
-                        # Error accumulation
-                        metrics['quadrant_error_variance'], metrics['q1_error'], metrics['q2_error'],
-                        metrics['q3_error'], metrics['q4_error'],
-                        sim_time,
-                        status
-                    ]
+                    row = result_row(case_id, prec, M, K, N, metadata, metrics,
+                                     cycles, lanes, sim_time, status)
 
                     print(f"\n[RESULTS]")
                     print(f"  MAE: {metrics['mae']:.6f}")
@@ -425,6 +472,8 @@ def main():
                     print(f"  SNR: {metrics['snr_db']:.2f} dB")
                     print(f"  Correlation: {metrics['correlation']:.6f}")
                     print(f"  GOPS: {metrics['gops']:.6f}")
+                    if cycles:
+                        print(f"  Cycles: {cycles['cycles']} ({cycles['mode']}, lanes={cycles['lanes']})")
                     print(f"  Effective Bits: {metrics['effective_bits']:.2f}")
                     print(f"  Sim Time: {sim_time:.2f}s")
 
@@ -433,13 +482,7 @@ def main():
                     sim_time = time.time() - start_time
 
                     # Write error row with NaN for metrics
-                    row = [
-                        datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                        case_id,
-                        'unknown',
-                        prec,
-                        M, K, N,
-                    ] + [np.nan] * (len(header) - 8) + [sim_time, status]
+                    row = error_row(case_id, prec, M, K, N, sim_time, status)
 
                 # Write row to CSV
                 w.writerow(row)
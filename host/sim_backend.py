@@ -0,0 +1,174 @@
+"""
+Simulation backends for the host runners.
+
+A backend simulates tb_top_gemm for one configuration, taken from the same
+environment variables run_xsim_simple.bat reads (PREC_SEL, M, K, N,
+PIPELINED, LANES, ...). It leaves C_out*.mem in mem/ and returns the
+simulator log, which carries the testbench CYCLES line.
+
+    xsim       scripts/run_xsim_simple.bat (Windows, Vivado)
+    verilator  a native model built with Verilator (Linux); FP cores come from
+               src/fp_ieee.sv (FP_BEHAV), since the *_ip models need Vivado
+
+The Verilator model is built once per configuration and cached under
+build/verilator/<key>, where the key hashes the defines, the sources, the
+flags and the Verilator version; later cases with the same configuration
+just run the executable. SIM_BACKEND picks the backend (default: xsim on
+Windows, verilator elsewhere). Verilator knobs:
+
+    VERILATOR          executable (default: verilator, then verilator-cli)
+    VERILATOR_THREADS  model threads (default: CPU count, at most 4)
+    VERILATOR_FLAGS    extra verilator arguments
+"""
+import hashlib
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+MEM = ROOT / "mem"
+BUILD = ROOT / "build" / "verilator"
+
+# tb_top_gemm defines and their run_xsim_simple.bat defaults
+SIM_DEFINES = {
+    'PREC_SEL': '0', 'M': '8', 'K': '8', 'N': '8',
+    'PIPELINED': '0', 'LANES': '1', 'TILE': '0',
+    'INT8_PACK': '1', 'FP16_PACK': '1',
+    'DBUF': '0', 'JOBS': '1', 'B_COLMAJOR': '0', 'SPARSE': '0',
+}
+
+TOP = 'tb_top_gemm'
+
+
+def sim_defines(env):
+    """Define values for one run, defaults filled in."""
+    return {k: str(env.get(k, v)) for k, v in SIM_DEFINES.items()}
+
+
+def rtl_sources():
+    """RTL in compile order (mp_types first) without the Vivado *_ip models."""
+    rtl = sorted(p for p in SRC.glob('*.sv')
+                 if p.name != 'mp_types.sv' and not p.name.endswith('_ip.sv'))
+    return [SRC / 'mp_types.sv'] + rtl
+
+
+def collect_outputs():
+    """Move C_out*.mem written in the project root into mem/."""
+    for f in ROOT.glob('C_out*.mem'):
+        shutil.move(str(f), MEM / f.name)
+
+
+class SimBackend:
+    """Runs tb_top_gemm; subclasses implement run()."""
+    name = None
+
+    def run(self, env):
+        """Simulate the configuration in env; returns the log text, or None on failure."""
+        raise NotImplementedError
+
+
+class XsimBackend(SimBackend):
+    name = 'xsim'
+
+    def run(self, env):
+        cmd = [str(ROOT / "scripts" / "run_xsim_simple.bat")]
+        print("$", " ".join(cmd))
+        r = subprocess.run(cmd, env=env, cwd=ROOT)
+        if r.returncode != 0:
+            print(f"WARNING: xsim failed with return code {r.returncode}")
+            return None
+        log = ROOT / "xsim.log"
+        return log.read_text(errors='replace') if log.exists() else ''
+
+
+class VerilatorBackend(SimBackend):
+    name = 'verilator'
+
+    def __init__(self, verilator=None, threads=None, flags=None):
+        self.verilator = (verilator or os.environ.get('VERILATOR')
+                          or shutil.which('verilator') or shutil.which('verilator-cli') or 'verilator')
+        self.threads = int(threads or os.environ.get('VERILATOR_THREADS', min(4, os.cpu_count() or 1)))
+        self.flags = flags if flags is not None else os.environ.get('VERILATOR_FLAGS', '').split()
+        self._version = None
+
+    def sources(self):
+        return rtl_sources() + [ROOT / 'tb' / f'{TOP}.sv']
+
+    def version(self):
+        if self._version is None:
+            r = subprocess.run([self.verilator, '--version'], capture_output=True, text=True)
+            self._version = r.stdout.strip()
+        return self._version
+
+    def defines_text(self, defs):
+        lines = ["// Auto-generated defines (verilator backend)"]
+        lines += [f"`define {k} {v}" for k, v in defs.items()]
+        lines += ["`define FP_BEHAV"]
+        return "\n".join(lines) + "\n"
+
+    def args(self):
+        return ['--binary', '--timing', '--threads', str(self.threads),
+                '-Wno-fatal', '-Wno-lint', '-Wno-style', '-I' + str(SRC)] + self.flags
+
+    def cache_key(self, defines_text):
+        h = hashlib.sha256()
+        for part in (defines_text, self.version(), ' '.join(self.args())):
+            h.update(part.encode())
+        for src in self.sources():
+            h.update(src.name.encode())
+            h.update(src.read_bytes())
+        return h.hexdigest()[:16]
+
+    def model(self, env):
+        """Path of the compiled model for env's configuration, building it if needed."""
+        text = self.defines_text(sim_defines(env))
+        # mp_types.sv and the testbench include src/sim_defines.vh
+        (SRC / "sim_defines.vh").write_text(text)
+        out = BUILD / self.cache_key(text)
+        exe = out / f"V{TOP}"
+        if exe.exists():
+            print(f"Using cached Verilator model {exe.relative_to(ROOT)}")
+            return exe
+
+        cmd = [self.verilator] + self.args() + [str(s) for s in self.sources()] + [
+            '--top-module', TOP, '-Mdir', str(out / 'obj'), '-o', exe.name]
+        print("$", " ".join(cmd))
+        out.mkdir(parents=True, exist_ok=True)
+        with open(out / 'build.log', 'w') as log:
+            r = subprocess.run(cmd, cwd=ROOT, stdout=log, stderr=subprocess.STDOUT)
+        if r.returncode != 0 or not (out / 'obj' / exe.name).exists():
+            print(f"WARNING: Verilator build failed, see {out / 'build.log'}")
+            return None
+        shutil.move(str(out / 'obj' / exe.name), exe)
+        shutil.rmtree(out / 'obj', ignore_errors=True)
+        return exe
+
+    def run(self, env):
+        exe = self.model(env)
+        if exe is None:
+            return None
+        for f in MEM.glob('C_out*.mem'):
+            f.unlink()
+        print("$", exe.relative_to(ROOT))
+        r = subprocess.run([str(exe)], env=env, cwd=ROOT, capture_output=True, text=True)
+        log = r.stdout + r.stderr
+        (ROOT / "verilator.log").write_text(log)
+        collect_outputs()
+        if r.returncode != 0 or not (MEM / "C_out.mem").exists():
+            print(f"WARNING: simulation failed with return code {r.returncode}")
+            print(log[-2000:])
+            return None
+        return log
+
+
+BACKENDS = {b.name: b for b in (XsimBackend, VerilatorBackend)}
+
+
+def get_backend(name=None):
+    """Backend by name, SIM_BACKEND, or the platform default."""
+    name = name or os.environ.get('SIM_BACKEND') or ('xsim' if os.name == 'nt' else 'verilator')
+    if name not in BACKENDS:
+        raise ValueError(f"unknown SIM_BACKEND {name!r} (choose from {', '.join(BACKENDS)})")
+    return BACKENDS[name]()
@@ -27,13 +27,21 @@ exec xvlog -sv -work xil_defaultlib \
     -d $defines \
     src/mp_types.sv \
     src/dp_bram.sv \
+    src/dbuf_bram.sv \
     src/int8_mac.sv \
+    src/int8_dot4.sv \
     src/fp16_mul.sv \
     src/fp16_add.sv \
+    src/fp16_dot2.sv \
     src/fp32_mul.sv \
     src/fp32_add.sv \
+    src/fp_ieee.sv \
+    src/fp_add.sv \
+    src/fp_mul.sv \
     src/pe_cell.sv \
+    src/fp_mac_stream.sv \
     src/systolic_array.sv \
+    src/gemm_tile_controller.sv \
     src/gemm_controller.sv \
     src/top_gemm.sv \
     tb/tb_top_gemm.sv
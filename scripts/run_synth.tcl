@@ -1,5 +1,5 @@
 # scripts/run_synth.tcl
-# Usage: PREC_SEL={0|1|2} vivado -mode batch -source scripts/run_synth.tcl
+# Usage: PREC_SEL={0|1|2|3} vivado -mode batch -source scripts/run_synth.tcl
 if {![info exists ::env(PREC_SEL)]} { set ::env(PREC_SEL) 0 }
 create_project mp_syn ./mp_syn_$::env(PREC_SEL) -part xc7a200tsbg484-1
 set_property target_language Verilog [current_project]
@@ -39,14 +39,22 @@ echo sv xil_defaultlib src\fp16_mul_ip.sv >> compile.prj
 echo sv xil_defaultlib src\fp16_add_ip.sv >> compile.prj
 echo sv xil_defaultlib src\fp32_mul_ip.sv >> compile.prj
 echo sv xil_defaultlib src\fp32_add_ip.sv >> compile.prj
+echo sv xil_defaultlib src\fp_ieee.sv >> compile.prj
 echo sv xil_defaultlib src\dp_bram.sv >> compile.prj
+echo sv xil_defaultlib src\dbuf_bram.sv >> compile.prj
 echo sv xil_defaultlib src\int8_mac.sv >> compile.prj
+echo sv xil_defaultlib src\int8_dot4.sv >> compile.prj
 echo sv xil_defaultlib src\fp16_mul.sv >> compile.prj
 echo sv xil_defaultlib src\fp16_add.sv >> compile.prj
+echo sv xil_defaultlib src\fp16_dot2.sv >> compile.prj
 echo sv xil_defaultlib src\fp32_mul.sv >> compile.prj
 echo sv xil_defaultlib src\fp32_add.sv >> compile.prj
+echo sv xil_defaultlib src\fp_add.sv >> compile.prj
+echo sv xil_defaultlib src\fp_mul.sv >> compile.prj
 echo sv xil_defaultlib src\pe_cell.sv >> compile.prj
+echo sv xil_defaultlib src\fp_mac_stream.sv >> compile.prj
 echo sv xil_defaultlib src\systolic_array.sv >> compile.prj
+echo sv xil_defaultlib src\gemm_tile_controller.sv >> compile.prj
 echo sv xil_defaultlib src\gemm_controller.sv >> compile.prj
 echo sv xil_defaultlib src\top_gemm.sv >> compile.prj
 echo sv xil_defaultlib tb\tb_top_gemm.sv >> compile.prj
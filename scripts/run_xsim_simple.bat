@@ -12,10 +12,20 @@ if not defined PREC_SEL set PREC_SEL=0
 if not defined M set M=8
 if not defined K set K=8
 if not defined N set N=8
+if not defined PIPELINED set PIPELINED=0
+if not defined LANES set LANES=1
+if not defined TILE set TILE=0
+if not defined INT8_PACK set INT8_PACK=1
+if not defined FP16_PACK set FP16_PACK=1
+if not defined DBUF set DBUF=0
+if not defined JOBS set JOBS=1
+if not defined B_COLMAJOR set B_COLMAJOR=0
+if not defined SPARSE set SPARSE=0
+if not defined FP_BEHAV set FP_BEHAV=0
 
 echo ================================================================================
 echo Running xsim simulation (SIMPLE MODE)
-echo PREC_SEL=%PREC_SEL% M=%M% K=%K% N=%N%
+echo PREC_SEL=%PREC_SEL% M=%M% K=%K% N=%N% PIPELINED=%PIPELINED% LANES=%LANES% TILE=%TILE% INT8_PACK=%INT8_PACK% FP16_PACK=%FP16_PACK% DBUF=%DBUF% JOBS=%JOBS% B_COLMAJOR=%B_COLMAJOR% SPARSE=%SPARSE% FP_BEHAV=%FP_BEHAV%
 echo ================================================================================
 
 REM Clean up old simulation files
@@ -31,6 +41,17 @@ echo `define PREC_SEL %PREC_SEL% >> src\sim_defines.vh
 echo `define M %M% >> src\sim_defines.vh
 echo `define K %K% >> src\sim_defines.vh
 echo `define N %N% >> src\sim_defines.vh
+echo `define PIPELINED %PIPELINED% >> src\sim_defines.vh
+echo `define LANES %LANES% >> src\sim_defines.vh
+echo `define TILE %TILE% >> src\sim_defines.vh
+echo `define INT8_PACK %INT8_PACK% >> src\sim_defines.vh
+echo `define FP16_PACK %FP16_PACK% >> src\sim_defines.vh
+echo `define DBUF %DBUF% >> src\sim_defines.vh
+echo `define JOBS %JOBS% >> src\sim_defines.vh
+echo `define B_COLMAJOR %B_COLMAJOR% >> src\sim_defines.vh
+echo `define SPARSE %SPARSE% >> src\sim_defines.vh
+REM FP_BEHAV=1: behavioral FP cores (fp_ieee.sv) instead of the *_ip models
+if "%FP_BEHAV%"=="1" echo `define FP_BEHAV >> src\sim_defines.vh
 
 REM Create project file
 echo sv xil_defaultlib src\mp_types.sv > compile.prj
@@ -38,14 +59,22 @@ echo sv xil_defaultlib src\fp16_mul_ip.sv >> compile.prj
 echo sv xil_defaultlib src\fp16_add_ip.sv >> compile.prj
 echo sv xil_defaultlib src\fp32_mul_ip.sv >> compile.prj
 echo sv xil_defaultlib src\fp32_add_ip.sv >> compile.prj
+echo sv xil_defaultlib src\fp_ieee.sv >> compile.prj
 echo sv xil_defaultlib src\dp_bram.sv >> compile.prj
+echo sv xil_defaultlib src\dbuf_bram.sv >> compile.prj
 echo sv xil_defaultlib src\int8_mac.sv >> compile.prj
+echo sv xil_defaultlib src\int8_dot4.sv >> compile.prj
 echo sv xil_defaultlib src\fp16_mul.sv >> compile.prj
 echo sv xil_defaultlib src\fp16_add.sv >> compile.prj
+echo sv xil_defaultlib src\fp16_dot2.sv >> compile.prj
 echo sv xil_defaultlib src\fp32_mul.sv >> compile.prj
 echo sv xil_defaultlib src\fp32_add.sv >> compile.prj
+echo sv xil_defaultlib src\fp_add.sv >> compile.prj
+echo sv xil_defaultlib src\fp_mul.sv >> compile.prj
 echo sv xil_defaultlib src\pe_cell.sv >> compile.prj
+echo sv xil_defaultlib src\fp_mac_stream.sv >> compile.prj
 echo sv xil_defaultlib src\systolic_array.sv >> compile.prj
+echo sv xil_defaultlib src\gemm_tile_controller.sv >> compile.prj
 echo sv xil_defaultlib src\gemm_controller.sv >> compile.prj
 echo sv xil_defaultlib src\top_gemm.sv >> compile.prj
 echo sv xil_defaultlib tb\tb_top_gemm.sv >> compile.prj
@@ -0,0 +1,53 @@
+// top_gemm operand/result buffer. BANKS=1 is a plain dp_bram. BANKS=2 is a
+// ping-pong pair: port A (controller) uses bank sel_a, port B (host) uses
+// bank sel_b, so the host can fill or drain one bank while a job runs on
+// the other. INIT_FILE loads bank 0.
+module dbuf_bram #(
+  parameter WIDTH = 32,
+  parameter DEPTH = 16384,
+  parameter INIT_FILE = "",
+  parameter BANKS = 1
+)(
+  input  logic               clk,
+  input  logic               sel_a, sel_b,
+
+  input  logic               ena, wea,
+  input  logic [$clog2(DEPTH)-1:0] addra,
+  input  logic [WIDTH-1:0]   dina,
+  output logic [WIDTH-1:0]   douta,
+
+  input  logic               enb, web,
+  input  logic [$clog2(DEPTH)-1:0] addrb,
+  input  logic [WIDTH-1:0]   dinb,
+  output logic [WIDTH-1:0]   doutb
+);
+  generate if (BANKS == 1) begin : g_single
+    dp_bram #(.WIDTH(WIDTH), .DEPTH(DEPTH), .INIT_FILE(INIT_FILE), .DBG_READ_PORT(0)) u_bank (
+      .clka(clk), .ena(ena), .wea(wea), .addra(addra), .dina(dina), .douta(douta),
+      .clkb(clk), .enb(enb), .web(web), .addrb(addrb), .dinb(dinb), .doutb(doutb),
+      .dbg_en(1'b0), .dbg_addr('0), .dbg_dout()
+    );
+  end else begin : g_pingpong
+    logic [WIDTH-1:0] douta_bank[2], doutb_bank[2];
+    logic             sel_a_q, sel_b_q;
+
+    for (genvar b = 0; b < 2; b++) begin : g_bank
+      dp_bram #(.WIDTH(WIDTH), .DEPTH(DEPTH), .INIT_FILE(b == 0 ? INIT_FILE : ""),
+                .DBG_READ_PORT(0)) u_bank (
+        .clka(clk), .ena(ena && sel_a == b), .wea(wea), .addra(addra), .dina(dina),
+        .douta(douta_bank[b]),
+        .clkb(clk), .enb(enb && sel_b == b), .web(web), .addrb(addrb), .dinb(dinb),
+        .doutb(doutb_bank[b]),
+        .dbg_en(1'b0), .dbg_addr('0), .dbg_dout()
+      );
+    end
+
+    // Read data follows the bank of the registered read
+    always_ff @(posedge clk) begin
+      if (ena) sel_a_q <= sel_a;
+      if (enb) sel_b_q <= sel_b;
+    end
+    assign douta = douta_bank[sel_a_q];
+    assign doutb = doutb_bank[sel_b_q];
+  end endgenerate
+endmodule
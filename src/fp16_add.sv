@@ -10,6 +10,13 @@ module fp16_add(
   output logic [15:0] y,
   output logic        ready
 );
+`ifdef FP_BEHAV
+  // Behavioral IEEE core (fp_ieee.sv), no IP needed
+  fp_ieee_add #(.EW(5), .MW(10), .LATENCY(mp_types::FP_BEHAV_LATENCY),
+               .ROUND_RTZ(mp_types::FP_BEHAV_RTZ), .FLUSH_SUBNORMAL(mp_types::FP_BEHAV_FLUSH)) u_add (
+    .clk(clk), .rstn(rstn), .valid(valid), .a(a), .b(b), .y(y), .ready(ready)
+  );
+`else
   logic        s_axis_a_tvalid, s_axis_b_tvalid;
   logic [31:0] s_axis_a_tdata,  s_axis_b_tdata;
   logic        m_axis_result_tvalid;
@@ -51,4 +58,5 @@ module fp16_add(
 
   assign y     = m_axis_result_tdata[15:0];
   assign ready = m_axis_result_tvalid;
+`endif
 endmodule
@@ -0,0 +1,19 @@
+// Packed FP16 product: two halves per 32-bit word.
+// y = a[15:0]*b[15:0] + a[31:16]*b[31:16]; both multipliers run in parallel
+// and the pair add follows, so latency is one multiply plus one add.
+module fp16_dot2 (
+  input  logic        clk,
+  input  logic        rstn,
+  input  logic        valid,
+  input  logic [31:0] a,
+  input  logic [31:0] b,
+  output logic [15:0] y,
+  output logic        ready
+);
+  logic [15:0] p_lo, p_hi;
+  logic        r_lo, r_hi;
+
+  fp16_mul u_mul_lo (.clk(clk), .rstn(rstn), .valid(valid), .a(a[15:0]),  .b(b[15:0]),  .y(p_lo), .ready(r_lo));
+  fp16_mul u_mul_hi (.clk(clk), .rstn(rstn), .valid(valid), .a(a[31:16]), .b(b[31:16]), .y(p_hi), .ready(r_hi));
+  fp16_add u_pair   (.clk(clk), .rstn(rstn), .valid(r_lo), .a(p_lo), .b(p_hi), .y(y), .ready(ready));
+endmodule
@@ -7,6 +7,13 @@ module fp32_mul(
   output logic [31:0] y,
   output logic        ready
 );
+`ifdef FP_BEHAV
+  // Behavioral IEEE core (fp_ieee.sv), no IP needed
+  fp_ieee_mul #(.EW(8), .MW(23), .LATENCY(mp_types::FP_BEHAV_LATENCY),
+               .ROUND_RTZ(mp_types::FP_BEHAV_RTZ), .FLUSH_SUBNORMAL(mp_types::FP_BEHAV_FLUSH)) u_mul (
+    .clk(clk), .rstn(rstn), .valid(valid), .a(a), .b(b), .y(y), .ready(ready)
+  );
+`else
   // Xilinx Floating-Point Multiplier IP with AXIS interfaces
   // IP core name assumed: fp32_mul_ip
   logic        s_axis_a_tvalid, s_axis_b_tvalid;
@@ -32,4 +39,5 @@ module fp32_mul(
 
   assign y     = m_axis_result_tdata;
   assign ready = m_axis_result_tvalid;
+`endif
 endmodule
@@ -0,0 +1,26 @@
+import mp_types::*;
+
+// fp_add.sv (precision-selected adder, 32-bit ports)
+// FP16 uses bits [15:0] and returns the sum zero-extended; FP32 and FP16ACC32
+// (FP32 accumulation of FP16 inputs) use all 32.
+module fp_add #(
+  parameter prec_e PREC = PREC_FP32
+)(
+  input  logic        clk,
+  input  logic        rstn,
+  input  logic        valid,
+  input  logic [31:0] a,
+  input  logic [31:0] b,
+  output logic [31:0] y,
+  output logic        ready
+);
+  generate
+    if (PREC == PREC_FP16) begin : g_fp16
+      logic [15:0] sum;
+      fp16_add u_add (.clk(clk), .rstn(rstn), .valid(valid), .a(a[15:0]), .b(b[15:0]), .y(sum), .ready(ready));
+      assign y = {16'b0, sum};
+    end else begin : g_fp32
+      fp32_add u_add (.clk(clk), .rstn(rstn), .valid(valid), .a(a), .b(b), .y(y), .ready(ready));
+    end
+  endgenerate
+endmodule
@@ -0,0 +1,228 @@
+// fp_ieee.sv: behavioral IEEE-754 add/mul, a drop-in for the floating_point
+// IP behind `define FP_BEHAV (see fp16_add.sv etc.). EW/MW are the exponent
+// and fraction widths (FP16 5/10, FP32 8/23). Synthesizable: one
+// combinational round/pack followed by a LATENCY-deep result pipeline.
+//
+//   ROUND_RTZ        0 = round to nearest even (the IP), 1 = toward zero
+//   FLUSH_SUBNORMAL  1 = subnormal inputs read as zero and results below the
+//                    normal range flush to zero (the IP), 0 = gradual underflow
+//
+// NaN results are the canonical quiet NaN {0, all ones, 1, 0...}.
+
+// Normalize, round and pack sign * mant * 2^(exp - BIAS - (WI-1)) where exp is
+// the biased exponent the value would have if mant's MSB were set.
+module fp_ieee_round #(
+  parameter int EW = 8,
+  parameter int MW = 23,
+  parameter int WI = 2*MW + 5,
+  parameter bit ROUND_RTZ = 0,
+  parameter bit FLUSH_SUBNORMAL = 1
+)(
+  input  logic                sign,
+  input  logic signed [EW+2:0] exp,
+  input  logic [WI-1:0]       mant,
+  output logic [EW+MW:0]      y
+);
+  localparam int EMAX = (1 << EW) - 1;
+
+  logic [WI-1:0]       norm;
+  logic signed [EW+2:0] e;
+  logic [MW+2:0]       sig;    // {hidden, fraction, guard, sticky}
+  logic [EW+MW-1:0]    mag;
+  logic                inc;
+  int                  lz, sh;
+
+  always_comb begin
+    lz = WI;
+    for (int b = 0; b < WI; b++) if (mant[b]) lz = WI - 1 - b;
+    norm = mant << lz;
+    e    = exp - (EW+3)'(lz);
+    sig  = {norm[WI-1 -: MW+2], |norm[WI-MW-3:0]};
+
+    // Below the normal range: subnormal (exponent field 0) or flushed
+    if (e <= 0) begin
+      sh = 1 - int'(e);
+      if (sh > MW + 3) sh = MW + 3;
+      sig = (sig >> sh) | (MW+3)'(|(sig & ~({(MW+3){1'b1}} << sh)));
+      e   = 0;
+    end
+
+    inc = !ROUND_RTZ && sig[1] && (sig[0] || sig[2]);
+    mag = {e[EW-1:0], sig[MW+1:2]} + (EW+MW)'(inc);
+
+    if (mant == '0 || (FLUSH_SUBNORMAL && e == 0))
+      y = {sign, (EW+MW)'(0)};
+    else if (e >= EMAX)
+      y = ROUND_RTZ ? {sign, EW'(EMAX - 1), {MW{1'b1}}} : {sign, EW'(EMAX), MW'(0)};
+    else
+      y = {sign, mag};
+  end
+endmodule
+
+// Result pipeline shared by add and mul: LATENCY registers after the datapath
+module fp_ieee_pipe #(
+  parameter int W = 32,
+  parameter int LATENCY = 3
+)(
+  input  logic         clk,
+  input  logic         rstn,
+  input  logic         valid,
+  input  logic [W-1:0] d,
+  output logic [W-1:0] y,
+  output logic         ready
+);
+  logic [W-1:0] q [LATENCY];
+  logic         v [LATENCY];
+
+  always_ff @(posedge clk or negedge rstn) begin
+    if (!rstn) begin
+      for (int s = 0; s < LATENCY; s++) begin
+        v[s] <= 1'b0;
+        q[s] <= '0;
+      end
+    end else begin
+      v[0] <= valid;
+      q[0] <= d;
+      for (int s = 1; s < LATENCY; s++) begin
+        v[s] <= v[s-1];
+        q[s] <= q[s-1];
+      end
+    end
+  end
+
+  assign y     = q[LATENCY-1];
+  assign ready = v[LATENCY-1];
+endmodule
+
+module fp_ieee_mul #(
+  parameter int EW = 8,
+  parameter int MW = 23,
+  parameter int LATENCY = 3,
+  parameter bit ROUND_RTZ = 0,
+  parameter bit FLUSH_SUBNORMAL = 1
+)(
+  input  logic            clk,
+  input  logic            rstn,
+  input  logic            valid,
+  input  logic [EW+MW:0]  a,
+  input  logic [EW+MW:0]  b,
+  output logic [EW+MW:0]  y,
+  output logic            ready
+);
+  localparam int EMAX = (1 << EW) - 1;
+  localparam int BIAS = (1 << (EW - 1)) - 1;
+  localparam logic [EW+MW:0] QNAN = {1'b0, {EW{1'b1}}, 1'b1, (MW-1)'(0)};
+
+  logic                 sa, sb, za, zb, ia, ib, na, nb;
+  logic [MW:0]          ma, mb;
+  logic signed [EW+2:0] ep;
+  logic [EW+MW:0]       rounded, res;
+
+  always_comb begin
+    sa = a[EW+MW];
+    sb = b[EW+MW];
+    ia = a[EW+MW-1 -: EW] == EW'(EMAX);
+    ib = b[EW+MW-1 -: EW] == EW'(EMAX);
+    na = ia && a[MW-1:0] != '0;
+    nb = ib && b[MW-1:0] != '0;
+    za = a[EW+MW-1 -: EW] == '0 && (FLUSH_SUBNORMAL || a[MW-1:0] == '0);
+    zb = b[EW+MW-1 -: EW] == '0 && (FLUSH_SUBNORMAL || b[MW-1:0] == '0);
+    ma = {a[EW+MW-1 -: EW] != '0, a[MW-1:0]};
+    mb = {b[EW+MW-1 -: EW] != '0, b[MW-1:0]};
+    // Subnormals use exponent 1 with no hidden bit; the product MSB is 2^1
+    ep = (EW+3)'(a[EW+MW-1 -: EW] == '0 ? 1 : a[EW+MW-1 -: EW]) +
+         (EW+3)'(b[EW+MW-1 -: EW] == '0 ? 1 : b[EW+MW-1 -: EW]) - (EW+3)'(BIAS) + 1;
+  end
+
+  fp_ieee_round #(.EW(EW), .MW(MW), .WI(2*MW + 2), .ROUND_RTZ(ROUND_RTZ),
+                  .FLUSH_SUBNORMAL(FLUSH_SUBNORMAL)) u_round (
+    .sign(sa ^ sb), .exp(ep), .mant((za || zb) ? '0 : ma * mb), .y(rounded)
+  );
+
+  always_comb begin
+    if (na || nb || (ia && zb) || (ib && za)) res = QNAN;
+    else if (ia || ib)                        res = {sa ^ sb, EW'(EMAX), MW'(0)};
+    else                                      res = rounded;
+  end
+
+  fp_ieee_pipe #(.W(EW + MW + 1), .LATENCY(LATENCY)) u_pipe (
+    .clk(clk), .rstn(rstn), .valid(valid), .d(res), .y(y), .ready(ready)
+  );
+endmodule
+
+module fp_ieee_add #(
+  parameter int EW = 8,
+  parameter int MW = 23,
+  parameter int LATENCY = 3,
+  parameter bit ROUND_RTZ = 0,
+  parameter bit FLUSH_SUBNORMAL = 1
+)(
+  input  logic            clk,
+  input  logic            rstn,
+  input  logic            valid,
+  input  logic [EW+MW:0]  a,
+  input  logic [EW+MW:0]  b,
+  output logic [EW+MW:0]  y,
+  output logic            ready
+);
+  localparam int EMAX = (1 << EW) - 1;
+  localparam int XW   = 2*MW + 4;   // aligned significand: MW+3 bits below the operand LSB
+  localparam logic [EW+MW:0] QNAN = {1'b0, {EW{1'b1}}, 1'b1, (MW-1)'(0)};
+
+  logic [EW+MW:0]       fa, fb, x, z, rounded, res;  // x = larger magnitude operand
+  logic                 ix, iz, nx, nz;
+  logic [EW-1:0]        ex, ez;
+  logic [XW-1:0]        mx, mz, shifted;
+  logic [XW:0]          sum;
+  logic signed [EW+2:0] es;
+  logic                 ssum;
+  int                   d;
+
+  // Flushed subnormals read as zero of the same sign
+  function automatic logic [EW+MW:0] flush(input logic [EW+MW:0] v);
+    if (FLUSH_SUBNORMAL && v[EW+MW-1 -: EW] == '0) return {v[EW+MW], (EW+MW)'(0)};
+    return v;
+  endfunction
+
+  always_comb begin
+    fa = flush(a);
+    fb = flush(b);
+    if (fa[EW+MW-1:0] >= fb[EW+MW-1:0]) begin
+      x = fa; z = fb;
+    end else begin
+      x = fb; z = fa;
+    end
+    ex = x[EW+MW-1 -: EW];
+    ez = z[EW+MW-1 -: EW];
+    ix = ex == EW'(EMAX);
+    iz = ez == EW'(EMAX);
+    nx = ix && x[MW-1:0] != '0;
+    nz = iz && z[MW-1:0] != '0;
+
+    mx = {ex != '0, x[MW-1:0], (MW+3)'(0)};
+    mz = {ez != '0, z[MW-1:0], (MW+3)'(0)};
+    d  = int'(ex == '0 ? 1 : ex) - int'(ez == '0 ? 1 : ez);
+    if (d > XW) d = XW;
+    // Alignment keeps a sticky bit for everything shifted out
+    shifted = (mz >> d) | XW'(|(mz & ~({XW{1'b1}} << d)));
+    sum  = (x[EW+MW] == z[EW+MW]) ? {1'b0, mx} + {1'b0, shifted} : {1'b0, mx} - {1'b0, shifted};
+    es   = (EW+3)'(ex == '0 ? 1 : ex) + 1;
+    // Exact cancellation is +0 (both rounding modes); -0 + -0 stays -0
+    ssum = sum == '0 ? (x[EW+MW] && z[EW+MW]) : x[EW+MW];
+  end
+
+  fp_ieee_round #(.EW(EW), .MW(MW), .WI(XW + 1), .ROUND_RTZ(ROUND_RTZ),
+                  .FLUSH_SUBNORMAL(FLUSH_SUBNORMAL)) u_round (
+    .sign(ssum), .exp(es), .mant(sum), .y(rounded)
+  );
+
+  always_comb begin
+    if (nx || nz || (ix && iz && x[EW+MW] != z[EW+MW])) res = QNAN;
+    else if (ix)                                         res = x;
+    else                                                 res = rounded;
+  end
+
+  fp_ieee_pipe #(.W(EW + MW + 1), .LATENCY(LATENCY)) u_pipe (
+    .clk(clk), .rstn(rstn), .valid(valid), .d(res), .y(y), .ready(ready)
+  );
+endmodule
@@ -0,0 +1,155 @@
+import mp_types::*;
+
+// Streaming FP dot-product unit for the pipelined gemm_controller.
+//
+// Takes one (a, b) pair per cycle; the pairs of one output are tagged
+// first/last. Products rotate over L independent partial sums, so a partial
+// sum only re-enters the adder after its previous add has come back and the
+// adder never waits on its own result. When the last add of an output
+// returns, the L partial sums go through a pipelined adder tree and the dot
+// product leaves on out_valid. Tags ride in FIFOs popped on the IP valid
+// outputs, so results follow the IP handshakes instead of fixed delays.
+module fp_mac_stream #(
+  parameter prec_e PREC = PREC_FP32,
+  parameter int ADD_LAT = 3,           // adder IP latency in cycles
+  parameter int FP16_PACK = 1          // FP16 values per a/b word
+)(
+  input  logic        clk,
+  input  logic        rstn,
+  input  logic        in_valid,
+  input  logic        in_first,        // first k of an output
+  input  logic        in_last,         // last k of an output
+  input  logic [31:0] a_in,
+  input  logic [31:0] b_in,
+  output logic        out_valid,
+  output logic [31:0] out_sum
+);
+  // Partial sums: enough to cover the adder latency plus the psum write-back,
+  // rounded up to a power of two for the reduction tree
+  localparam int LEVELS = $clog2(ADD_LAT + 1);
+  localparam int L      = 1 << LEVELS;
+  localparam int TAG_DEPTH = 16;
+  localparam int TW = $clog2(TAG_DEPTH);
+
+  // ---------------- Multiply ----------------
+  logic [31:0] prod;
+  logic        prod_valid;
+  fp_mul #(.PREC(PREC), .FP16_PACK(FP16_PACK)) u_mul (
+    .clk(clk), .rstn(rstn), .valid(in_valid), .a(a_in), .b(b_in),
+    .y(prod), .ready(prod_valid)
+  );
+
+  // first/last of the products inside the multiplier
+  logic [1:0]    mtag [TAG_DEPTH];
+  logic [TW-1:0] mtag_wr, mtag_rd;
+  logic          p_first, p_last;
+  assign {p_first, p_last} = mtag[mtag_rd];
+
+  // ---------------- Accumulate ----------------
+  logic [31:0]        psum [L];
+  logic [LEVELS-1:0]  slot_q, slot;     // partial sum of the previous / current product
+  logic [L-1:0]       used_q, used;     // partial sums touched by the current output
+  logic [L-1:0]       pending;          // partial sums with an add in flight
+  logic [31:0]        acc_a;
+  logic [31:0]        sum;
+  logic               sum_valid;
+
+  // Keep rotating across outputs so every slot is reused exactly L products later
+  assign slot  = slot_q + 1'b1;
+  assign used  = (p_first ? '0 : used_q) | (L'(1) << slot);
+  assign acc_a = (!p_first && used_q[slot]) ? psum[slot] : 32'b0;
+
+  fp_add #(.PREC(PREC)) u_acc (
+    .clk(clk), .rstn(rstn), .valid(prod_valid), .a(acc_a), .b(prod),
+    .y(sum), .ready(sum_valid)
+  );
+
+  // slot / last / used of the adds inside the adder
+  logic [LEVELS-1:0] atag_slot [TAG_DEPTH];
+  logic              atag_last [TAG_DEPTH];
+  logic [L-1:0]      atag_used [TAG_DEPTH];
+  logic [TW-1:0]     atag_wr, atag_rd;
+  logic [LEVELS-1:0] s_slot;
+  logic              s_last;
+  logic [L-1:0]      s_used;
+  assign s_slot = atag_slot[atag_rd];
+  assign s_last = atag_last[atag_rd];
+  assign s_used = atag_used[atag_rd];
+
+  // ---------------- Reduce ----------------
+  logic [31:0] red_in [L];
+  logic        red_valid;
+  logic [31:0] tv     [LEVELS+1][L];
+  logic        tvalid [LEVELS+1];
+
+  always_ff @(posedge clk) begin
+    if (!rstn) begin
+      mtag_wr <= '0; mtag_rd <= '0;
+      atag_wr <= '0; atag_rd <= '0;
+      slot_q  <= '0; used_q  <= '0; pending <= '0;
+      red_valid <= 1'b0;
+    end else begin
+      if (in_valid) begin
+        mtag[mtag_wr] <= {in_first, in_last};
+        mtag_wr <= mtag_wr + 1'b1;
+      end
+
+      red_valid <= 1'b0;
+      if (prod_valid) begin
+        mtag_rd <= mtag_rd + 1'b1;
+        slot_q  <= slot;
+        used_q  <= used;
+        atag_slot[atag_wr] <= slot;
+        atag_last[atag_wr] <= p_last;
+        atag_used[atag_wr] <= used;
+        atag_wr <= atag_wr + 1'b1;
+      end
+
+      if (sum_valid) begin
+        atag_rd <= atag_rd + 1'b1;
+        psum[s_slot] <= sum;
+        // In-order adder: the output's last add returning means all of its
+        // partial sums are final. Untouched partial sums enter the tree as 0.
+        if (s_last) begin
+          for (int s=0; s<L; s++)
+            red_in[s] <= !s_used[s] ? 32'b0 : (s == s_slot) ? sum : psum[s];
+          red_valid <= 1'b1;
+        end
+      end
+
+      pending <= (pending & ~((sum_valid ? L'(1) : L'(0)) << s_slot))
+                         |  ((prod_valid ? L'(1) : L'(0)) << slot);
+    end
+  end
+
+  // synthesis translate_off
+  always_ff @(posedge clk) begin
+    if (rstn && prod_valid && pending[slot])
+      $error("fp_mac_stream: partial sum %0d reused before its add returned (ADD_LAT=%0d too small)",
+             slot, ADD_LAT);
+  end
+  // synthesis translate_on
+
+  genvar lvl, n;
+  generate
+    for (n = 0; n < L; n++) begin : g_red_in
+      assign tv[0][n] = red_in[n];
+    end
+    assign tvalid[0] = red_valid;
+
+    for (lvl = 0; lvl < LEVELS; lvl++) begin : g_level
+      logic [L-1:0] lv_ready;
+      for (n = 0; n < (L >> (lvl+1)); n++) begin : g_add
+        fp_add #(.PREC(PREC)) u_add (
+          .clk(clk), .rstn(rstn), .valid(tvalid[lvl]),
+          .a(tv[lvl][2*n]), .b(tv[lvl][2*n+1]),
+          .y(tv[lvl+1][n]), .ready(lv_ready[n])
+        );
+      end
+      assign tvalid[lvl+1] = lv_ready[0];
+    end
+  endgenerate
+
+  assign out_valid = tvalid[LEVELS];
+  assign out_sum   = tv[LEVELS][0];
+endmodule
@@ -0,0 +1,45 @@
+import mp_types::*;
+
+// fp_mul.sv (precision-selected multiplier, 32-bit ports)
+// FP16 uses bits [15:0] and returns the product zero-extended; FP32 uses all 32.
+// With FP16_PACK = 2 each word holds two FP16 values and y is the sum of the
+// two lane products (fp16_dot2).
+// FP16ACC32 widens the FP16 inputs and multiplies in FP32, so the product is
+// exact (11 x 11 significand bits fit in 24) and y is FP32.
+module fp_mul #(
+  parameter prec_e PREC = PREC_FP32,
+  parameter int FP16_PACK = 1
+)(
+  input  logic        clk,
+  input  logic        rstn,
+  input  logic        valid,
+  input  logic [31:0] a,
+  input  logic [31:0] b,
+  output logic [31:0] y,
+  output logic        ready
+);
+  generate
+    if (PREC == PREC_FP16 && FP16_PACK == 2) begin : g_fp16x2
+      logic [15:0] prod;
+      fp16_dot2 u_dot (.clk(clk), .rstn(rstn), .valid(valid), .a(a), .b(b), .y(prod), .ready(ready));
+      assign y = {16'b0, prod};
+    end else if (PREC == PREC_FP16ACC32 && FP16_PACK == 2) begin : g_fp16w_x2
+      logic [31:0] p_lo, p_hi;
+      logic        r_lo, r_hi;
+      fp32_mul u_mul_lo (.clk(clk), .rstn(rstn), .valid(valid),
+                         .a(fp16_to_fp32(a[15:0])), .b(fp16_to_fp32(b[15:0])), .y(p_lo), .ready(r_lo));
+      fp32_mul u_mul_hi (.clk(clk), .rstn(rstn), .valid(valid),
+                         .a(fp16_to_fp32(a[31:16])), .b(fp16_to_fp32(b[31:16])), .y(p_hi), .ready(r_hi));
+      fp32_add u_pair (.clk(clk), .rstn(rstn), .valid(r_lo), .a(p_lo), .b(p_hi), .y(y), .ready(ready));
+    end else if (PREC == PREC_FP16ACC32) begin : g_fp16w
+      fp32_mul u_mul (.clk(clk), .rstn(rstn), .valid(valid),
+                      .a(fp16_to_fp32(a[15:0])), .b(fp16_to_fp32(b[15:0])), .y(y), .ready(ready));
+    end else if (PREC == PREC_FP16) begin : g_fp16
+      logic [15:0] prod;
+      fp16_mul u_mul (.clk(clk), .rstn(rstn), .valid(valid), .a(a[15:0]), .b(b[15:0]), .y(prod), .ready(ready));
+      assign y = {16'b0, prod};
+    end else begin : g_fp32
+      fp32_mul u_mul (.clk(clk), .rstn(rstn), .valid(valid), .a(a), .b(b), .y(y), .ready(ready));
+    end
+  endgenerate
+endmodule
@@ -2,7 +2,24 @@ import mp_types::*;
 
 module gemm_controller #(
   parameter int MAX_ELEMS = 16384,
-  parameter prec_e PREC = PREC_INT8
+  parameter prec_e PREC = PREC_INT8,
+  // 0: sequential LOAD/READ/MAC FSM (3 cycles per k + 2 per output)
+  // 1: pipelined issue, one A/B read per cycle, results streamed to C
+  parameter bit PIPELINED = 1'b0,
+  // Output columns computed side by side (pipelined only): one A read and
+  // LANES B reads per cycle, one MAC unit and one B/C bank per lane
+  parameter int LANES = 1,
+  // INT8 values per A/B word (4: packed along K, see host/mem_codec.py)
+  parameter int INT8_PACK = 1,
+  // FP16 values per A/B word (2: packed along K)
+  parameter int FP16_PACK = 1,
+  // B words stored column-major (B^T, N x K words): contiguous reads along k
+  parameter bit B_COLMAJOR = 1'b0,
+  // 2:4 structured-sparse A: two entries per group of four k, only the
+  // nonzero half of the MACs is issued (see host/mem_codec.py)
+  parameter bit SPARSE = 1'b0,
+  localparam int AW  = $clog2(MAX_ELEMS),
+  localparam int CAW = $clog2((MAX_ELEMS + LANES - 1) / LANES)
 )(
   input  logic        clk,
   input  logic        rstn,
@@ -10,81 +27,245 @@ module gemm_controller #(
   input  logic [15:0] M, K, Ncols,   // A(MxK) * B(KxN) = C(MxN)
   output logic        done,
 
-  // BRAM ports (one read port each for A and B; one write for C)
-  output logic [$clog2(MAX_ELEMS)-1:0] addr_A,
-  input  logic [31:0]                  data_A,
-  output logic [$clog2(MAX_ELEMS)-1:0] addr_B,
-  input  logic [31:0]                  data_B,
-  output logic [$clog2(MAX_ELEMS)-1:0] addr_C,
-  output logic [31:0]                  data_C,
-  output logic                         we_C
+  // BRAM ports: one A read port, one read port per B bank and one write
+  // port per C bank (a single B/C port when LANES == 1)
+  output logic [AW-1:0]        addr_A,
+  input  logic [31:0]          data_A,
+  output logic [LANES*AW-1:0]  addr_B,
+  input  logic [LANES*32-1:0]  data_B,
+  output logic [LANES*CAW-1:0] addr_C,
+  output logic [LANES*32-1:0]  data_C,
+  output logic [LANES-1:0]     we_C
 );
-  typedef enum logic [2:0] {S_IDLE, S_LOAD, S_READ, S_MAC, S_STORE, S_NEXT, S_DONE} state_e;
-  state_e s;
-
-  logic [31:0] acc;
   logic [15:0] i,j,k;
-  logic [31:0] a_reg, b_reg;
-  logic [31:0] acc_next;
 
-  // Row-major A(MxK), B(KxN), C(MxN)
-  function automatic [$clog2(MAX_ELEMS)-1:0] idx_A(input int r, input int c);
-    return r*K + c;
+  // K in A/B words; k below counts A words. A SPARSE row holds 2 entries
+  // per group of four k: value in [15:0], position in the group in [17:16].
+  localparam int PACK = (PREC == PREC_INT8) ? INT8_PACK :
+                        is_fp16_input(PREC) ? FP16_PACK : 1;
+  logic [15:0] KW, KB;              // A words per row, B words along K
+  assign KB = (K + PACK - 1) / PACK;
+  assign KW = SPARSE ? 2 * ((K + 3) / 4) : KB;
+
+  // Row-major A(MxKW), B(KBxN), C(MxN); B_COLMAJOR stores B transposed
+  // (NxKB) so the k walk reads B contiguously like A
+  function automatic [AW-1:0] idx_A(input int r, input int c);
+    return r*KW + c;
   endfunction
-  function automatic [$clog2(MAX_ELEMS)-1:0] idx_B(input int r, input int c);
-    return r*Ncols + c;
+  function automatic [AW-1:0] idx_B(input int r, input int c);
+    return B_COLMAJOR ? c*KB + r : r*Ncols + c;
   endfunction
-  function automatic [$clog2(MAX_ELEMS)-1:0] idx_C(input int r, input int c);
+  function automatic [AW-1:0] idx_C(input int r, input int c);
     return r*Ncols + c;
   endfunction
 
-  pe_cell #(.PREC(PREC)) u_pe (
-    .clk(clk), .rstn(rstn), .valid(s==S_MAC),
-    .acc_in(acc), .a_in(a_reg), .b_in(b_reg), .acc_out(acc_next)
-  );
-
-  always_ff @(posedge clk) begin
-    if (!rstn) begin
-      s    <= S_IDLE; done <= 1'b0; we_C <= 1'b0;
-      i<='0; j<='0; k<='0; acc<='0; a_reg<='0; b_reg<='0;
-    end else begin
-      we_C <= 1'b0; done <= 1'b0;
-      unique case (s)
-        S_IDLE: if (start) begin i<=0; j<=0; k<=0; acc<='0; s<=S_LOAD; end
-        S_LOAD: begin
-          addr_A <= idx_A(i,k);
-          addr_B <= idx_B(k,j);
-          s <= S_READ;
+  // SPARSE: B row of A entry e, and the entry's value
+  function automatic [15:0] b_row(input logic [15:0] e, input logic [31:0] a_word);
+    return {e[15:1], 2'b00} + a_word[17:16];
+  endfunction
+  function automatic [31:0] a_val(input logic [31:0] a_word);
+    return SPARSE ? {16'b0, a_word[15:0]} : a_word;
+  endfunction
+
+  generate
+    if (!PIPELINED && LANES > 1) begin : g_bad_lanes
+      $error("gemm_controller: LANES > 1 needs PIPELINED = 1");
+    end
+    if (SPARSE && (PACK != 1 || PREC == PREC_FP32)) begin : g_bad_sparse
+      $error("gemm_controller: SPARSE needs unpacked INT8/FP16 A words");
+    end
+
+    if (!PIPELINED) begin : g_seq
+      typedef enum logic [3:0] {S_IDLE, S_LOAD, S_READ, S_GATHER, S_BREAD, S_MAC, S_WAIT, S_STORE,
+                                S_NEXT, S_DONE} state_e;
+      state_e s;
+
+      logic [31:0] acc;
+      logic [31:0] acc_next;
+      logic        acc_valid;
+
+      pe_cell #(.PREC(PREC), .INT8_PACK(INT8_PACK), .FP16_PACK(FP16_PACK)) u_pe (
+        .clk(clk), .rstn(rstn), .valid(s==S_MAC),
+        .acc_in(acc), .a_in(a_val(data_A)), .b_in(data_B), .acc_out(acc_next),
+        .acc_valid(acc_valid)
+      );
+
+      always_ff @(posedge clk) begin
+        if (!rstn) begin
+          s    <= S_IDLE; done <= 1'b0; we_C <= 1'b0;
+          i<='0; j<='0; k<='0; acc<='0;
+        end else begin
+          we_C <= 1'b0; done <= 1'b0;
+          unique case (s)
+            S_IDLE: if (start) begin i<=0; j<=0; k<=0; acc<='0; s<=S_LOAD; end
+            S_LOAD: begin
+              addr_A <= idx_A(i,k);
+              if (!SPARSE) addr_B <= idx_B(k,j);
+              s <= S_READ;
+            end
+            // BRAMs register the address this cycle (1-cycle sync read);
+            // data_A/data_B are valid during S_MAC and feed the PE directly
+            S_READ: s <= SPARSE ? S_GATHER : S_MAC;
+            // SPARSE: the A entry names its B row, read in S_BREAD
+            S_GATHER: begin
+              addr_B <= idx_B(b_row(k, data_A), j);
+              s <= S_BREAD;
+            end
+            S_BREAD: s <= S_MAC;
+            S_MAC: s <= S_WAIT;
+            S_WAIT: if (acc_valid) begin
+              // PE result is back (1 cycle INT8, IP latency for FP)
+              acc <= acc_next;
+              if (k+1 < KW) begin
+                k <= k+1;
+                s <= S_LOAD;
+              end else begin
+                s <= S_STORE;
+              end
+            end
+            S_STORE: begin
+              addr_C <= idx_C(i,j);
+              data_C <= acc_next;
+              we_C   <= 1'b1;
+              s <= S_NEXT;
+            end
+            S_NEXT: begin
+              acc <= '0; k <= 0;
+              if (j+1 < Ncols) begin j <= j+1; s <= S_LOAD; end
+              else if (i+1 < M) begin j <= 0; i <= i+1; s <= S_LOAD; end
+              else begin s <= S_DONE; end
+            end
+            S_DONE: begin done <= 1'b1; s <= S_IDLE; end
+          endcase
         end
-        S_READ: begin
-          // capture outputs from BRAMs (1-cycle sync read)
-          a_reg <= data_A;
-          b_reg <= data_B;
-          s <= S_MAC;
+      end
+    end else begin : g_pipe
+      // Issue -> BRAM read (1 cycle) -> MAC units -> C write, all overlapped.
+      // Every cycle the issue stage sends A(i,k) and B(k, j..j+LANES-1) out;
+      // lane p accumulates C(i, j+p). INT8 accumulates in pe_cell directly; FP
+      // goes through fp_mac_stream, whose interleaved partial sums hide the
+      // adder latency. Finished groups come back in (i,j) order. C is
+      // interleaved across the LANES banks by flat address (bank = addr %
+      // LANES), so the LANES consecutive outputs of a group hit different banks.
+      // SPARSE adds two gather stages: the A entry is read (ga), then B is
+      // addressed from it (gb), and the A value is delayed to meet the B data.
+      logic        busy;
+      logic        iss_v, iss_first, iss_last;
+      logic [15:0] iss_k, iss_j, ga_k, ga_j;
+      logic        ga_v, ga_first, ga_last;
+      logic        gb_v, gb_first, gb_last;
+      logic [31:0] a_gb, a_rd, a_in;
+      logic        rd_v, rd_first, rd_last;
+      logic [LANES-1:0] res_v;
+      logic [31:0] res_sum[LANES];
+      logic [15:0] wr_row, wr_col;      // (row, first column) of the next group
+      logic [31:0] wr_base;             // flat C address of lane 0
+      logic [31:0] wr_left;             // groups still to be written
+      logic        wr_end;
+
+      for (genvar p = 0; p < LANES; p++) begin : g_lane
+        if (PREC == PREC_INT8) begin : g_int8
+          logic [31:0] acc_next;
+          pe_cell #(.PREC(PREC), .INT8_PACK(INT8_PACK), .FP16_PACK(FP16_PACK)) u_pe (
+            .clk(clk), .rstn(rstn), .valid(rd_v),
+            .acc_in(rd_first ? 32'b0 : acc_next),
+            .a_in(a_in), .b_in(data_B[p*32 +: 32]), .acc_out(acc_next), .acc_valid()
+          );
+          always_ff @(posedge clk) begin
+            if (!rstn) res_v[p] <= 1'b0;
+            else       res_v[p] <= rd_v && rd_last;
+          end
+          assign res_sum[p] = acc_next;
+        end else begin : g_fp
+          fp_mac_stream #(.PREC(PREC), .FP16_PACK(FP16_PACK)) u_mac (
+            .clk(clk), .rstn(rstn), .in_valid(rd_v),
+            .in_first(rd_first), .in_last(rd_last),
+            .a_in(a_in), .b_in(data_B[p*32 +: 32]),
+            .out_valid(res_v[p]), .out_sum(res_sum[p])
+          );
         end
-        S_MAC: begin
-          acc <= acc_next;
-          if (k+1 < K) begin
-            k <= k+1;
-            s <= S_LOAD;
+      end
+
+      assign a_in = SPARSE ? a_rd : data_A;
+
+      always_ff @(posedge clk) begin
+        if (!rstn) begin
+          busy <= 1'b0; done <= 1'b0; we_C <= '0;
+          i<='0; j<='0; k<='0;
+          iss_v <= 1'b0; ga_v <= 1'b0; gb_v <= 1'b0; rd_v <= 1'b0; wr_end <= 1'b0;
+        end else begin
+          // Issue stage: walk (i, j, k) with k innermost, j in steps of LANES
+          iss_v <= 1'b0;
+          if (!busy) begin
+            if (start) begin
+              busy <= 1'b1; i<=0; j<=0; k<=0;
+              wr_row <= 0; wr_col <= 0; wr_base <= 0;
+              wr_left <= M * ((Ncols + LANES - 1) / LANES);
+            end
           end else begin
-            s <= S_STORE;
+            addr_A <= idx_A(i,k);
+            if (!SPARSE)
+              for (int p = 0; p < LANES; p++)
+                addr_B[p*AW +: AW] <= idx_B(k, j+p);
+            iss_v     <= 1'b1;
+            iss_first <= (k == 0);
+            iss_last  <= (k+1 == KW);
+            iss_k     <= k;
+            iss_j     <= j;
+            if (k+1 < KW) k <= k+1;
+            else begin
+              k <= 0;
+              if (j+LANES < Ncols) j <= j+LANES;
+              else if (i+1 < M) begin j <= 0; i <= i+1; end
+              else busy <= 1'b0;
+            end
           end
+
+          // Gather stages (SPARSE): the A entry is on data_A during ga; it
+          // addresses its B rows for gb
+          ga_v     <= iss_v;
+          ga_first <= iss_first;
+          ga_last  <= iss_last;
+          ga_k     <= iss_k;
+          ga_j     <= iss_j;
+          gb_v     <= ga_v;
+          gb_first <= ga_first;
+          gb_last  <= ga_last;
+          if (SPARSE)
+            for (int p = 0; p < LANES; p++)
+              addr_B[p*AW +: AW] <= idx_B(b_row(ga_k, data_A), ga_j + p);
+          a_gb <= a_val(data_A);
+          a_rd <= a_gb;
+
+          // Read stage: BRAM data for the issued addresses is on data_A/data_B
+          rd_v     <= SPARSE ? gb_v : iss_v;
+          rd_first <= SPARSE ? gb_first : iss_first;
+          rd_last  <= SPARSE ? gb_last : iss_last;
+
+          // Writeback: one finished group of LANES outputs per res_v; lanes
+          // past the last column are dropped
+          for (int p = 0; p < LANES; p++) begin
+            automatic int addr = wr_base + p;
+            automatic int bank = addr % LANES;
+            addr_C[bank*CAW +: CAW] <= addr / LANES;
+            data_C[bank*32 +: 32]   <= res_sum[p];
+            we_C[bank]              <= res_v[0] && (wr_col + p < Ncols);
+          end
+          wr_end <= res_v[0] && (wr_left == 1);
+          if (res_v[0]) begin
+            wr_left <= wr_left - 1;
+            if (wr_col + LANES < Ncols) begin
+              wr_col  <= wr_col + LANES;
+              wr_base <= wr_base + LANES;
+            end else begin
+              wr_col  <= 0;
+              wr_row  <= wr_row + 1;
+              wr_base <= (wr_row + 1) * Ncols;
+            end
+          end
+          done <= wr_end;
         end
-        S_STORE: begin
-          addr_C <= idx_C(i,j);
-          data_C <= acc_next;
-          we_C   <= 1'b1;
-          s <= S_NEXT;
-        end
-        S_NEXT: begin
-          acc <= '0; k <= 0;
-          if (j+1 < Ncols) begin j <= j+1; s <= S_LOAD; end
-          else if (i+1 < M) begin j <= 0; i <= i+1; s <= S_LOAD; end
-          else begin s <= S_DONE; end
-        end
-        S_DONE: begin done <= 1'b1; s <= S_IDLE; end
-      endcase
+      end
     end
-  end
+  endgenerate
 endmodule
@@ -0,0 +1,165 @@
+import mp_types::*;
+
+// Tiled GEMM controller around systolic_array.
+//
+// C is computed in TILE x TILE output tiles, row-major over tiles. For each
+// tile the issue stage streams k = 0..K-1; every cycle lane t reads
+// A(r0+t, k) from A bank t and B(k, c0+t) from B bank t, so the array does
+// TILE*TILE MACs per cycle. Lanes past M or N (edge tiles) are fed zeros and
+// their results are not written.
+//
+// A finished tile is copied into a drain buffer and written out one tile
+// row per cycle while the next tile computes. C is interleaved across TILE
+// banks by flat address (bank = addr % TILE), so the TILE consecutive
+// addresses of a tile row always land in different banks. Tiles are issued
+// at least TILE cycles apart so the drain keeps up when K < TILE.
+module gemm_tile_controller #(
+  parameter int MAX_ELEMS = 65536,
+  parameter prec_e PREC = PREC_INT8,
+  parameter int TILE = 4,
+  parameter int INT8_PACK = 1,        // INT8 values per A/B word
+  parameter int FP16_PACK = 1,        // FP16 values per A/B word
+  parameter bit B_COLMAJOR = 1'b0,    // B words stored column-major (B^T)
+  localparam int AW  = $clog2(MAX_ELEMS),
+  localparam int CAW = $clog2((MAX_ELEMS + TILE - 1) / TILE)
+)(
+  input  logic        clk,
+  input  logic        rstn,
+  input  logic        start,
+  input  logic [15:0] M, K, Ncols,   // A(MxK) * B(KxN) = C(MxN)
+  output logic        done,
+
+  // One read port per A/B bank, one write port per C bank
+  output logic [TILE*AW-1:0]  addr_A,
+  input  logic [TILE*32-1:0]  data_A,
+  output logic [TILE*AW-1:0]  addr_B,
+  input  logic [TILE*32-1:0]  data_B,
+  output logic [TILE*CAW-1:0] addr_C,
+  output logic [TILE*32-1:0]  data_C,
+  output logic [TILE-1:0]     we_C
+);
+  // K in A/B words; k below counts words
+  localparam int PACK = (PREC == PREC_INT8) ? INT8_PACK :
+                        is_fp16_input(PREC) ? FP16_PACK : 1;
+  logic [15:0] KW;
+  assign KW = (K + PACK - 1) / PACK;
+
+  // Row-major A(MxKW), B(KWxN), C(MxN); B_COLMAJOR stores B transposed
+  // (NxKW) so the k walk reads B contiguously like A
+  function automatic [AW-1:0] idx_A(input int r, input int c);
+    return r*KW + c;
+  endfunction
+  function automatic [AW-1:0] idx_B(input int r, input int c);
+    return B_COLMAJOR ? c*KW + r : r*Ncols + c;
+  endfunction
+  function automatic int idx_C(input int r, input int c);
+    return r*Ncols + c;
+  endfunction
+
+  // ---------------- Issue ----------------
+  logic        busy;
+  logic [15:0] ti, tj, k;           // tile origin (row, col) and k
+  logic [15:0] gap;                 // idle slots before the next tile
+  logic        iss_v, iss_first, iss_last;
+  logic [TILE-1:0] iss_row_ok, iss_col_ok;
+
+  // ---------------- Read / array ----------------
+  logic        rd_v, rd_first, rd_last;
+  logic [TILE-1:0] rd_row_ok, rd_col_ok;
+  logic [TILE*32-1:0] a_row, b_col;
+  logic        tile_valid;
+  logic [TILE*32-1:0] tile_sum[TILE];
+
+  for (genvar t = 0; t < TILE; t++) begin : g_lane
+    assign a_row[(t+1)*32-1 -: 32] = rd_row_ok[t] ? data_A[(t+1)*32-1 -: 32] : 32'b0;
+    assign b_col[(t+1)*32-1 -: 32] = rd_col_ok[t] ? data_B[(t+1)*32-1 -: 32] : 32'b0;
+  end
+
+  systolic_array #(.N(TILE), .PREC(PREC), .INT8_PACK(INT8_PACK),
+                   .FP16_PACK(FP16_PACK)) u_array (
+    .clk(clk), .rstn(rstn), .valid(rd_v), .first(rd_first), .last(rd_last),
+    .a_row(a_row), .b_col(b_col),
+    .out_valid(tile_valid), .acc_out(tile_sum)
+  );
+
+  // ---------------- Drain ----------------
+  logic [TILE*32-1:0] drain_buf[TILE];
+  logic        draining;
+  logic [15:0] dr_row, di, dj;       // tile row being written, tile origin
+  logic        last_tile_drain, wr_end;
+
+  always_ff @(posedge clk) begin
+    if (!rstn) begin
+      busy <= 1'b0; done <= 1'b0; we_C <= '0;
+      ti <= '0; tj <= '0; k <= '0; gap <= '0;
+      iss_v <= 1'b0; rd_v <= 1'b0;
+      draining <= 1'b0; wr_end <= 1'b0;
+    end else begin
+      // Issue stage: tiles row-major, k innermost
+      iss_v <= 1'b0;
+      if (!busy) begin
+        if (start) begin
+          busy <= 1'b1; ti <= 0; tj <= 0; k <= 0; gap <= 0;
+          di <= 0; dj <= 0;
+        end
+      end else if (gap != 0) begin
+        gap <= gap - 1;
+      end else begin
+        for (int t = 0; t < TILE; t++) begin
+          addr_A[t*AW +: AW] <= idx_A(ti + t, k);
+          addr_B[t*AW +: AW] <= idx_B(k, tj + t);
+          iss_row_ok[t] <= (ti + t < M);
+          iss_col_ok[t] <= (tj + t < Ncols);
+        end
+        iss_v     <= 1'b1;
+        iss_first <= (k == 0);
+        iss_last  <= (k+1 == KW);
+        if (k+1 < KW) k <= k+1;
+        else begin
+          k <= 0;
+          gap <= (KW < TILE) ? TILE - KW : 0;
+          if (tj + TILE < Ncols) tj <= tj + TILE;
+          else if (ti + TILE < M) begin tj <= 0; ti <= ti + TILE; end
+          else busy <= 1'b0;
+        end
+      end
+
+      // Read stage: bank outputs for the issued addresses are on data_A/data_B
+      rd_v      <= iss_v;
+      rd_first  <= iss_first;
+      rd_last   <= iss_last;
+      rd_row_ok <= iss_row_ok;
+      rd_col_ok <= iss_col_ok;
+
+      // Drain: capture a finished tile, then write one tile row per cycle
+      we_C   <= '0;
+      wr_end <= 1'b0;
+      if (tile_valid) begin
+        drain_buf <= tile_sum;
+        draining  <= 1'b1;
+        dr_row    <= 0;
+      end
+      if (draining) begin
+        for (int t = 0; t < TILE; t++) begin
+          // Lane t holds column dj+t; its flat address picks the bank
+          automatic int c    = dj + t;
+          automatic int addr = idx_C(di + dr_row, c);
+          automatic int bank = addr % TILE;
+          addr_C[bank*CAW +: CAW] <= addr / TILE;
+          data_C[bank*32 +: 32]   <= drain_buf[dr_row][(t+1)*32-1 -: 32];
+          we_C[bank]              <= (di + dr_row < M) && (c < Ncols);
+        end
+        if (dr_row + 1 == TILE || di + dr_row + 1 >= M) begin
+          // Tile done: step the drain origin in issue order
+          if (!tile_valid) draining <= 1'b0;
+          wr_end <= (dj + TILE >= Ncols) && (di + TILE >= M);
+          if (dj + TILE < Ncols) dj <= dj + TILE;
+          else begin dj <= 0; di <= di + TILE; end
+        end else begin
+          dr_row <= dr_row + 1;
+        end
+      end
+      done <= wr_end;
+    end
+  end
+endmodule
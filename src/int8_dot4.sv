@@ -0,0 +1,27 @@
+// Packed INT8 MAC: four signed 8-bit lanes per 32-bit word, one word per
+// cycle. acc_out = acc_in + sum(a[b] * b[b]) over the four bytes.
+module int8_dot4 (
+  input  logic         clk,
+  input  logic         rstn,
+  input  logic         valid,
+  input  logic  [31:0] a,
+  input  logic  [31:0] b,
+  input  logic  [31:0] acc_in,
+  output logic  [31:0] acc_out
+);
+  logic signed [15:0] prod[4];
+  logic signed [17:0] dot;
+
+  always_comb begin
+    dot = '0;
+    for (int l = 0; l < 4; l++) begin
+      prod[l] = $signed(a[8*l +: 8]) * $signed(b[8*l +: 8]);
+      dot += prod[l];
+    end
+  end
+
+  always_ff @(posedge clk) begin
+    if (!rstn) acc_out <= '0;
+    else if (valid) acc_out <= $signed(acc_in) + dot;
+  end
+endmodule
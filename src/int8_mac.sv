@@ -12,6 +12,6 @@ module int8_mac (
 
   always_ff @(posedge clk) begin
     if (!rstn) acc_out <= '0;
-    else if (valid) acc_out <= acc_in + $signed(prod);
+    else if (valid) acc_out <= $signed(acc_in) + prod;
   end
 endmodule
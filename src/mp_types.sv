@@ -2,8 +2,8 @@
 `include "sim_defines.vh"
 
 package mp_types;
-  // Optional external override for default precision via +define+PREC_SEL={0,1,2}
-  // 0=INT8, 1=FP16, 2=FP32
+  // Optional external override for default precision via +define+PREC_SEL={0,1,2,3}
+  // 0=INT8, 1=FP16, 2=FP32, 3=FP16 inputs with FP32 products and accumulation
   `ifndef PREC_SEL
     `define PREC_SEL 0
   `endif
@@ -11,7 +11,8 @@ package mp_types;
   typedef enum logic [1:0] {
     PREC_INT8  = 2'b00,
     PREC_FP16  = 2'b01,
-    PREC_FP32  = 2'b10
+    PREC_FP32  = 2'b10,
+    PREC_FP16ACC32 = 2'b11
   } prec_e;
 
   // Map define to enum for easy parameter defaulting
@@ -19,10 +20,26 @@ package mp_types;
     case (`PREC_SEL)
       0: return PREC_INT8;
       1: return PREC_FP16;
+      3: return PREC_FP16ACC32;
       default: return PREC_FP32;
     endcase
   endfunction
 
+  // Behavioral FP cores (`define FP_BEHAV, fp_ieee.sv) in place of the
+  // floating_point IP; the defaults mirror the IP as configured here
+  `ifndef FP_BEHAV_LATENCY
+    `define FP_BEHAV_LATENCY 3
+  `endif
+  `ifndef FP_BEHAV_RTZ
+    `define FP_BEHAV_RTZ 0
+  `endif
+  `ifndef FP_BEHAV_FLUSH
+    `define FP_BEHAV_FLUSH 1
+  `endif
+  localparam int FP_BEHAV_LATENCY = `FP_BEHAV_LATENCY; // cycles valid -> ready
+  localparam bit FP_BEHAV_RTZ     = `FP_BEHAV_RTZ;     // 0 = nearest even, 1 = toward zero
+  localparam bit FP_BEHAV_FLUSH   = `FP_BEHAV_FLUSH;   // subnormals flushed to zero
+
   // Data widths per precision mode
   localparam int W_INT8 = 8;
   localparam int W_FP16 = 16; // IEEE 754 half
@@ -30,4 +47,20 @@ package mp_types;
 
   // Accumulator width for INT8
   localparam int W_ACC_INT8 = 32; // safe for moderate K
+
+  // FP16 storage in A/B words (PREC_FP16ACC32 stores FP16 like PREC_FP16)
+  function automatic bit is_fp16_input(prec_e p);
+    return p == PREC_FP16 || p == PREC_FP16ACC32;
+  endfunction
+
+  // Exact FP16 -> FP32 widening (subnormals normalized, inf/NaN kept)
+  function automatic logic [31:0] fp16_to_fp32(input logic [15:0] h);
+    int p;
+    if (h[14:10] == 5'h1f) return {h[15], 8'hff, h[9:0], 13'b0};
+    if (h[14:10] != 5'h00) return {h[15], 8'(h[14:10]) + 8'd112, h[9:0], 13'b0};
+    if (h[9:0] == 10'b0)   return {h[15], 31'b0};
+    p = 0;
+    for (int b = 0; b < 10; b++) if (h[b]) p = b;
+    return {h[15], 8'(p + 103), 23'({13'b0, h[9:0]} << (23 - p))};
+  endfunction
 endpackage
@@ -1,7 +1,9 @@
 import mp_types::*;
 
 module pe_cell #(
-  parameter prec_e PREC = PREC_INT8
+  parameter prec_e PREC = PREC_INT8,
+  parameter int INT8_PACK = 1,       // INT8 values per word: 1, or 4 (int8_dot4)
+  parameter int FP16_PACK = 1        // FP16 values per word: 1, or 2 (fp16_dot2)
 )(
   input  logic clk,
   input  logic rstn,
@@ -9,31 +11,61 @@ module pe_cell #(
   input  logic [31:0] acc_in,
   input  logic [31:0] a_in,
   input  logic [31:0] b_in,
-  output logic [31:0] acc_out
+  output logic [31:0] acc_out,
+  output logic        acc_valid   // acc_out holds the result of the last valid MAC
 );
   generate
     if (PREC == PREC_INT8) begin : g_int8
-      int8_mac u_mac (
-        .clk(clk), .rstn(rstn), .valid(valid),
-        .a(a_in[7:0]), .b(b_in[7:0]),
-        .acc_in(acc_in), .acc_out(acc_out)
-      );
+      if (INT8_PACK == 4) begin : g_dot4
+        int8_dot4 u_mac (
+          .clk(clk), .rstn(rstn), .valid(valid),
+          .a(a_in), .b(b_in),
+          .acc_in(acc_in), .acc_out(acc_out)
+        );
+      end else begin : g_mac
+        int8_mac u_mac (
+          .clk(clk), .rstn(rstn), .valid(valid),
+          .a(a_in[7:0]), .b(b_in[7:0]),
+          .acc_in(acc_in), .acc_out(acc_out)
+        );
+      end
+      always_ff @(posedge clk) begin
+        if (!rstn) acc_valid <= 1'b0;
+        else       acc_valid <= valid;
+      end
     end else if (PREC == PREC_FP16) begin : g_fp16
       // FP16: acc_out = acc_in + (a*b)
       logic [15:0] prod;
       logic        mready, aready;
-      fp16_mul u_mul (.clk(clk), .rstn(rstn), .valid(valid), .a(a_in[15:0]), .b(b_in[15:0]), .y(prod), .ready(mready));
+      if (FP16_PACK == 2) begin : g_dot2
+        fp16_dot2 u_mul (.clk(clk), .rstn(rstn), .valid(valid), .a(a_in), .b(b_in), .y(prod), .ready(mready));
+      end else begin : g_mul
+        fp16_mul u_mul (.clk(clk), .rstn(rstn), .valid(valid), .a(a_in[15:0]), .b(b_in[15:0]), .y(prod), .ready(mready));
+      end
       logic [15:0] sum;
       fp16_add u_add (.clk(clk), .rstn(rstn), .valid(mready), .a(acc_in[15:0]), .b(prod), .y(sum), .ready(aready));
       always_ff @(posedge clk) begin
-        if (!rstn) acc_out <= '0;
-        else if (aready) acc_out <= {16'b0, sum};
+        if (!rstn) begin acc_out <= '0; acc_valid <= 1'b0; end
+        else begin
+          acc_valid <= aready;
+          if (aready) acc_out <= {16'b0, sum};
+        end
       end
+    end else if (PREC == PREC_FP16ACC32) begin : g_fp16acc32
+      // FP16 inputs, exact FP32 product (fp_mul widens), FP32 accumulate
+      logic [31:0] prod;
+      logic        mready, aready;
+      fp_mul #(.PREC(PREC), .FP16_PACK(FP16_PACK)) u_mul (
+        .clk(clk), .rstn(rstn), .valid(valid), .a(a_in), .b(b_in), .y(prod), .ready(mready)
+      );
+      fp32_add u_add (.clk(clk), .rstn(rstn), .valid(mready), .a(acc_in), .b(prod), .y(acc_out), .ready(aready));
+      assign acc_valid = aready;
     end else begin : g_fp32
       logic [31:0] prod;
       logic        mready, aready;
       fp32_mul u_mul (.clk(clk), .rstn(rstn), .valid(valid), .a(a_in), .b(b_in), .y(prod), .ready(mready));
       fp32_add u_add (.clk(clk), .rstn(rstn), .valid(mready), .a(acc_in), .b(prod), .y(acc_out), .ready(aready));
+      assign acc_valid = aready;
     end
   endgenerate
 endmodule
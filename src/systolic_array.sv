@@ -1,27 +1,63 @@
 import mp_types::*;
 
+// NxN output tile, one k step per valid: PE(i,j) accumulates
+// a_row[i] * b_col[j], where a_row carries A(r0+i, k) for the tile rows and
+// b_col carries B(k, c0+j) for the tile columns. first/last mark the first
+// and last k of the tile; out_valid pulses once the finished tile is on
+// acc_out (acc_out[i] lane j = C(r0+i, c0+j)).
 module systolic_array #(
   parameter int N = 4,
-  parameter prec_e PREC = PREC_INT8
+  parameter prec_e PREC = PREC_INT8,
+  parameter int INT8_PACK = 1,
+  parameter int FP16_PACK = 1
 )(
   input  logic clk,
   input  logic rstn,
   input  logic valid,
+  input  logic first,
+  input  logic last,
   input  logic [N*32-1:0] a_row,   // N lanes (each 32 bits holding the active precision)
   input  logic [N*32-1:0] b_col,   // N lanes
-  input  logic [N*32-1:0] acc_in [N],
+  output logic            out_valid,
   output logic [N*32-1:0] acc_out[N]
 );
   genvar i,j;
-  for (i=0;i<N;i++) begin: row
-    for (j=0;j<N;j++) begin: col
-      pe_cell #(.PREC(PREC)) u_pe (
-        .clk(clk), .rstn(rstn), .valid(valid),
-        .acc_in(acc_in[i][(j+1)*32-1 -: 32]),
-        .a_in(a_row[(j+1)*32-1 -: 32]),
-        .b_in(b_col[(i+1)*32-1 -: 32]),
-        .acc_out(acc_out[i][(j+1)*32-1 -: 32])
-      );
+  generate
+    if (PREC == PREC_INT8) begin : g_int8
+      // Registered MAC per cell; a new tile restarts from zero on first
+      for (i=0;i<N;i++) begin: row
+        for (j=0;j<N;j++) begin: col
+          pe_cell #(.PREC(PREC), .INT8_PACK(INT8_PACK)) u_pe (
+            .clk(clk), .rstn(rstn), .valid(valid),
+            .acc_in(first ? 32'b0 : acc_out[i][(j+1)*32-1 -: 32]),
+            .a_in(a_row[(i+1)*32-1 -: 32]),
+            .b_in(b_col[(j+1)*32-1 -: 32]),
+            .acc_out(acc_out[i][(j+1)*32-1 -: 32]),
+            .acc_valid()
+          );
+        end
+      end
+      always_ff @(posedge clk) begin
+        if (!rstn) out_valid <= 1'b0;
+        else       out_valid <= valid && last;
+      end
+    end else begin : g_fp
+      // Streaming FP cells: interleaved partial sums hide the adder latency
+      logic [N*N-1:0] cell_valid;
+      for (i=0;i<N;i++) begin: row
+        for (j=0;j<N;j++) begin: col
+          fp_mac_stream #(.PREC(PREC), .FP16_PACK(FP16_PACK)) u_mac (
+            .clk(clk), .rstn(rstn), .in_valid(valid),
+            .in_first(first), .in_last(last),
+            .a_in(a_row[(i+1)*32-1 -: 32]),
+            .b_in(b_col[(j+1)*32-1 -: 32]),
+            .out_valid(cell_valid[i*N+j]),
+            .out_sum(acc_out[i][(j+1)*32-1 -: 32])
+          );
+        end
+      end
+      // All cells see the same stream, so they finish together
+      assign out_valid = cell_valid[0];
     end
-  end
+  endgenerate
 endmodule
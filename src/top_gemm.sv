@@ -3,6 +3,21 @@ import mp_types::*;
 module top_gemm #(
   parameter int MAX_ELEMS = 65536,
   parameter prec_e PREC = PREC_INT8,
+  parameter bit PIPELINED = 1'b0,
+  // Output columns per cycle of the pipelined scalar controller
+  parameter int LANES = 1,
+  // INT8 values per A/B word: 1, or 4 packed along K (int8_dot4)
+  parameter int INT8_PACK = 1,
+  // FP16 values per A/B word: 1, or 2 packed along K (fp16_dot2)
+  parameter int FP16_PACK = 1,
+  // 0: scalar gemm_controller; >0: TILE x TILE systolic_array with banked A/B/C
+  parameter int TILE = 0,
+  // 1: ping-pong A/B/C banks; the host loads/drains one bank while a job runs
+  parameter bit DBUF = 1'b0,
+  // 1: B.mem holds B transposed (host/mem_codec.py layout 'col')
+  parameter bit B_COLMAJOR = 1'b0,
+  // 1: A.mem holds 2:4 structured-sparse A entries (scalar controller only)
+  parameter bit SPARSE = 1'b0,
   parameter string A_INIT = "mem/A.mem",
   parameter string B_INIT = "mem/B.mem"
 )(
@@ -11,38 +26,139 @@ module top_gemm #(
   input  logic start,
   input  logic [15:0] M, K, Ncols,
   output logic done,
-  // debug readback for C
+  // Host load port: writes every copy of A or B in the bank the next job uses
+  input  logic        host_we_A, host_we_B,
+  input  logic [$clog2(MAX_ELEMS)-1:0] host_addr,
+  input  logic [31:0] host_din,
+  // debug readback for C (from bank c_dbg_bank when DBUF)
   input  logic        c_dbg_en,
+  input  logic        c_dbg_bank,
   input  logic [$clog2(MAX_ELEMS)-1:0] c_dbg_addr,
   output logic [31:0] c_dbg_dout
 );
-  logic [$clog2(MAX_ELEMS)-1:0] addr_A, addr_B, addr_C;
-  logic [31:0] data_A, data_B, data_C;
-  logic we_C;
-
-  dp_bram #(.WIDTH(32), .DEPTH(MAX_ELEMS), .INIT_FILE(A_INIT), .DBG_READ_PORT(0)) u_A (
-    .clka(clk), .ena(1'b1), .wea(1'b0), .addra(addr_A), .dina('0), .douta(data_A),
-    .clkb(clk), .enb(1'b0), .web(1'b0), .addrb('0), .dinb('0), .doutb(),
-    .dbg_en(1'b0), .dbg_addr('0), .dbg_dout()
-  );
-
-  dp_bram #(.WIDTH(32), .DEPTH(MAX_ELEMS), .INIT_FILE(B_INIT), .DBG_READ_PORT(0)) u_B (
-    .clka(clk), .ena(1'b1), .wea(1'b0), .addra(addr_B), .dina('0), .douta(data_B),
-    .clkb(clk), .enb(1'b0), .web(1'b0), .addrb('0), .dinb('0), .doutb(),
-    .dbg_en(1'b0), .dbg_addr('0), .dbg_dout()
-  );
-
-  dp_bram #(.WIDTH(32), .DEPTH(MAX_ELEMS), .INIT_FILE(""), .DBG_READ_PORT(1)) u_C (
-    .clka(clk), .ena(1'b1), .wea(we_C), .addra(addr_C), .dina(data_C), .douta(),
-    .clkb(clk), .enb(1'b0), .web(1'b0), .addrb('0), .dinb('0), .doutb(),
-    .dbg_en(c_dbg_en), .dbg_addr(c_dbg_addr), .dbg_dout(c_dbg_dout)
-  );
-
-  gemm_controller #(.PREC(PREC)) u_ctrl (
-    .clk(clk), .rstn(rstn), .start(start), .M(M), .K(K), .Ncols(Ncols),
-    .done(done),
-    .addr_A(addr_A), .data_A(data_A),
-    .addr_B(addr_B), .data_B(data_B),
-    .addr_C(addr_C), .data_C(data_C), .we_C(we_C)
-  );
+  localparam int BANKS = DBUF ? 2 : 1;
+
+  // Job n after reset runs in bank n % 2 and the host port fills the other
+  // A/B bank. start must only be pulsed while the controller is idle.
+  logic run_bank;
+  always_ff @(posedge clk) begin
+    if (!rstn)      run_bank <= 1'b1;
+    else if (start) run_bank <= ~run_bank;
+  end
+
+  generate
+    if (TILE == 0) begin : g_scalar
+      // One A port; one B bank and one C bank per lane. B banks are loaded
+      // with the full matrix, C is interleaved by flat address as in g_tiled.
+      localparam int AW      = $clog2(MAX_ELEMS);
+      localparam int C_DEPTH = (MAX_ELEMS + LANES - 1) / LANES;
+      localparam int CAW     = $clog2(C_DEPTH);
+
+      logic [AW-1:0]        addr_A;
+      logic [31:0]          data_A;
+      logic [LANES*AW-1:0]  addr_B;
+      logic [LANES*32-1:0]  data_B, data_C;
+      logic [LANES*CAW-1:0] addr_C;
+      logic [LANES-1:0]     we_C;
+      logic [31:0]          c_dbg_bank_dout[LANES];
+      logic [$clog2(LANES+1)-1:0] c_dbg_sel;
+
+      dbuf_bram #(.WIDTH(32), .DEPTH(MAX_ELEMS), .INIT_FILE(A_INIT), .BANKS(BANKS)) u_A (
+        .clk(clk), .sel_a(run_bank), .sel_b(~run_bank),
+        .ena(1'b1), .wea(1'b0), .addra(addr_A), .dina('0), .douta(data_A),
+        .enb(host_we_A), .web(1'b1), .addrb(host_addr), .dinb(host_din), .doutb()
+      );
+
+      for (genvar p = 0; p < LANES; p++) begin : g_bank
+        dbuf_bram #(.WIDTH(32), .DEPTH(MAX_ELEMS), .INIT_FILE(B_INIT), .BANKS(BANKS)) u_B (
+          .clk(clk), .sel_a(run_bank), .sel_b(~run_bank),
+          .ena(1'b1), .wea(1'b0), .addra(addr_B[p*AW +: AW]), .dina('0),
+          .douta(data_B[p*32 +: 32]),
+          .enb(host_we_B), .web(1'b1), .addrb(host_addr), .dinb(host_din), .doutb()
+        );
+
+        dbuf_bram #(.WIDTH(32), .DEPTH(C_DEPTH), .INIT_FILE(""), .BANKS(BANKS)) u_C (
+          .clk(clk), .sel_a(run_bank), .sel_b(c_dbg_bank),
+          .ena(1'b1), .wea(we_C[p]), .addra(addr_C[p*CAW +: CAW]),
+          .dina(data_C[p*32 +: 32]), .douta(),
+          .enb(c_dbg_en), .web(1'b0), .addrb(CAW'(c_dbg_addr / LANES)), .dinb('0),
+          .doutb(c_dbg_bank_dout[p])
+        );
+      end
+
+      always_ff @(posedge clk) begin
+        if (c_dbg_en) c_dbg_sel <= c_dbg_addr % LANES;
+      end
+      assign c_dbg_dout = c_dbg_bank_dout[c_dbg_sel];
+
+      gemm_controller #(.MAX_ELEMS(MAX_ELEMS), .PREC(PREC), .PIPELINED(PIPELINED), .LANES(LANES),
+                        .INT8_PACK(INT8_PACK), .FP16_PACK(FP16_PACK),
+                        .B_COLMAJOR(B_COLMAJOR), .SPARSE(SPARSE)) u_ctrl (
+        .clk(clk), .rstn(rstn), .start(start), .M(M), .K(K), .Ncols(Ncols),
+        .done(done),
+        .addr_A(addr_A), .data_A(data_A),
+        .addr_B(addr_B), .data_B(data_B),
+        .addr_C(addr_C), .data_C(data_C), .we_C(we_C)
+      );
+    end else begin : g_tiled
+      if (SPARSE) begin : g_bad_sparse
+        $error("top_gemm: SPARSE needs the scalar controller (TILE = 0)");
+      end
+
+      // A/B banks: lane t reads tile row/column t. Every bank is loaded with
+      // the full matrix so the flat .mem layout is unchanged; lane t only
+      // ever touches its own rows/columns.
+      localparam int AW      = $clog2(MAX_ELEMS);
+      localparam int C_DEPTH = (MAX_ELEMS + TILE - 1) / TILE;
+      localparam int CAW     = $clog2(C_DEPTH);
+
+      logic [TILE*AW-1:0]  addr_A, addr_B;
+      logic [TILE*32-1:0]  data_A, data_B, data_C;
+      logic [TILE*CAW-1:0] addr_C;
+      logic [TILE-1:0]     we_C;
+      logic [31:0]         c_dbg_bank_dout[TILE];
+      logic [$clog2(TILE+1)-1:0] c_dbg_sel;
+
+      for (genvar t = 0; t < TILE; t++) begin : g_bank
+        dbuf_bram #(.WIDTH(32), .DEPTH(MAX_ELEMS), .INIT_FILE(A_INIT), .BANKS(BANKS)) u_A (
+          .clk(clk), .sel_a(run_bank), .sel_b(~run_bank),
+          .ena(1'b1), .wea(1'b0), .addra(addr_A[t*AW +: AW]), .dina('0),
+          .douta(data_A[t*32 +: 32]),
+          .enb(host_we_A), .web(1'b1), .addrb(host_addr), .dinb(host_din), .doutb()
+        );
+
+        dbuf_bram #(.WIDTH(32), .DEPTH(MAX_ELEMS), .INIT_FILE(B_INIT), .BANKS(BANKS)) u_B (
+          .clk(clk), .sel_a(run_bank), .sel_b(~run_bank),
+          .ena(1'b1), .wea(1'b0), .addra(addr_B[t*AW +: AW]), .dina('0),
+          .douta(data_B[t*32 +: 32]),
+          .enb(host_we_B), .web(1'b1), .addrb(host_addr), .dinb(host_din), .doutb()
+        );
+
+        // C bank t holds flat addresses with addr % TILE == t, at addr / TILE
+        dbuf_bram #(.WIDTH(32), .DEPTH(C_DEPTH), .INIT_FILE(""), .BANKS(BANKS)) u_C (
+          .clk(clk), .sel_a(run_bank), .sel_b(c_dbg_bank),
+          .ena(1'b1), .wea(we_C[t]), .addra(addr_C[t*CAW +: CAW]),
+          .dina(data_C[t*32 +: 32]), .douta(),
+          .enb(c_dbg_en), .web(1'b0), .addrb(CAW'(c_dbg_addr / TILE)), .dinb('0),
+          .doutb(c_dbg_bank_dout[t])
+        );
+      end
+
+      // Debug readback: bank select registered alongside the 1-cycle read
+      always_ff @(posedge clk) begin
+        if (c_dbg_en) c_dbg_sel <= c_dbg_addr % TILE;
+      end
+      assign c_dbg_dout = c_dbg_bank_dout[c_dbg_sel];
+
+      gemm_tile_controller #(.MAX_ELEMS(MAX_ELEMS), .PREC(PREC), .TILE(TILE),
+                            .INT8_PACK(INT8_PACK), .FP16_PACK(FP16_PACK),
+                            .B_COLMAJOR(B_COLMAJOR)) u_ctrl (
+        .clk(clk), .rstn(rstn), .start(start), .M(M), .K(K), .Ncols(Ncols),
+        .done(done),
+        .addr_A(addr_A), .data_A(data_A),
+        .addr_B(addr_B), .data_B(data_B),
+        .addr_C(addr_C), .data_C(data_C), .we_C(we_C)
+      );
+    end
+  endgenerate
 endmodule
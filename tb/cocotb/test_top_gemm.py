@@ -0,0 +1,145 @@
+"""
+cocotb testbench for top_gemm with in-memory data exchange.
+
+A/B words go straight into the dp_bram arrays (every A/B copy holds the full
+flat matrix, so the backdoor fills each one), start is pulsed, done is awaited
+and C is read back through the c_dbg port into NumPy. Every case of the sweep
+runs back to back in one simulator process, with no .mem files and no
+simulator launch per case.
+
+Driven by host/run_cocotb.py, which builds top_gemm with the structural
+parameters and passes the sweep in GEMM_* environment variables. Rows are
+appended to GEMM_RESULTS in the run_comprehensive_test.py schema.
+"""
+import csv
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import FallingEdge, RisingEdge
+
+HOST = Path(__file__).resolve().parents[2] / "host"
+sys.path.insert(0, str(HOST))
+
+from cycle_model import gemm_cycles  # noqa: E402
+from gen_cond_mems import build_case  # noqa: E402
+from mem_codec import a_words, b_words, decode_c, sparse_a_words, word_pack  # noqa: E402
+from run_comprehensive_test import compute_comprehensive_metrics, error_row, result_row  # noqa: E402
+
+
+def env_int(name, default=0):
+    return int(os.environ.get(name, default))
+
+
+def bram_banks(buf):
+    """dp_bram instances behind one dbuf_bram (two when DBUF)."""
+    if hasattr(buf, 'g_single'):
+        return [buf.g_single.u_bank]
+    return [buf.g_pingpong.g_bank[b].u_bank for b in range(2)]
+
+
+def buffer_copies(dut, name, tile, lanes):
+    """Every dbuf_bram called name ('u_A' or 'u_B') in top_gemm."""
+    if tile:
+        return [getattr(dut.g_tiled.g_bank[t], name) for t in range(tile)]
+    if name == 'u_A':
+        return [dut.g_scalar.u_A]
+    return [dut.g_scalar.g_bank[p].u_B for p in range(lanes)]
+
+
+def backdoor_load(copies, words):
+    """Write words from address 0 into every bank of every copy."""
+    for buf in copies:
+        for bank in bram_banks(buf):
+            mem = bank.mem
+            for addr, w in enumerate(words):
+                mem[addr].value = w
+
+
+async def run_job(dut, max_cycles):
+    """Pulse start and wait for done; returns rising edges from start to done
+    (the tb_top_gemm CYCLES count), or None on timeout. Starts and returns on
+    a falling edge."""
+    dut.start.value = 1
+    for cycles in range(1, max_cycles + 1):
+        await FallingEdge(dut.clk)
+        dut.start.value = 0
+        if dut.done.value == 1:
+            return cycles
+    return None
+
+
+async def read_c(dut, M, N, prec):
+    """C (M x N) through the c_dbg port, one registered read per cycle."""
+    dut.c_dbg_bank.value = int(dut.run_bank.value)
+    dut.c_dbg_en.value = 1
+    C = np.zeros((M, N))
+    for idx in range(M * N):
+        dut.c_dbg_addr.value = idx
+        await FallingEdge(dut.clk)
+        C[idx // N, idx % N] = decode_c(dut.c_dbg_dout.value.to_unsigned(), prec)
+    dut.c_dbg_en.value = 0
+    return C
+
+
+@cocotb.test()
+async def gemm_sweep(dut):
+    """Run the configured cases back to back and append one row per case."""
+    prec = os.environ['GEMM_PREC']
+    M, K, N = env_int('GEMM_M', 8), env_int('GEMM_K', 8), env_int('GEMM_N', 8)
+    cases = [int(c) for c in os.environ['GEMM_CASES'].split(',')]
+    pipelined, lanes, tile = env_int('PIPELINED'), env_int('LANES', 1), env_int('TILE')
+    pack = word_pack(prec, env_int('INT8_PACK', 1), env_int('FP16_PACK', 1))
+    sparse = env_int('SPARSE') == 1
+    layout = 'col' if env_int('B_COLMAJOR') else 'row'
+    max_cycles = 2 * gemm_cycles(M, K, N, prec, pipelined or lanes > 1, tile, lanes, pack,
+                                 sparse) + 1000
+
+    Clock(dut.clk, 10, unit='ns').start()
+    dut.rstn.value = 0
+    dut.start.value = 0
+    dut.host_we_A.value = 0
+    dut.host_we_B.value = 0
+    dut.host_addr.value = 0
+    dut.host_din.value = 0
+    dut.c_dbg_en.value = 0
+    dut.c_dbg_bank.value = 0
+    dut.c_dbg_addr.value = 0
+    dut.M.value, dut.K.value, dut.Ncols.value = M, K, N
+    for _ in range(5):
+        await RisingEdge(dut.clk)
+    dut.rstn.value = 1
+    await FallingEdge(dut.clk)
+
+    A_copies = buffer_copies(dut, 'u_A', tile, lanes)
+    B_copies = buffer_copies(dut, 'u_B', tile, lanes)
+    mode = 'tiled' if tile else 'pipelined' if pipelined or lanes > 1 else 'sequential'
+
+    with open(os.environ['GEMM_RESULTS'], 'a', newline='') as fc:
+        w = csv.writer(fc)
+        for case_id in cases:
+            start_time = time.time()
+            A, B, C_ref, metadata = build_case(M, K, N, prec, case_id, sparse)
+            backdoor_load(A_copies, sparse_a_words(A, prec) if sparse else a_words(A, prec, pack))
+            backdoor_load(B_copies, b_words(B, prec, pack, layout))
+            await FallingEdge(dut.clk)
+
+            cycles = await run_job(dut, max_cycles)
+            if cycles is None:
+                w.writerow(error_row(case_id, prec, M, K, N, time.time() - start_time, 'sim_timeout'))
+                raise AssertionError(f"case {case_id}: no done within {max_cycles} cycles")
+            C_out = await read_c(dut, M, N, prec)
+
+            sim_time = time.time() - start_time
+            metrics = compute_comprehensive_metrics(C_ref, C_out, prec=prec, sim_time=sim_time,
+                                                    M=M, K=K, N=N)
+            stats = {'mode': mode, 'cycles': cycles, 'macs': M * K * N, 'lanes': lanes}
+            w.writerow(result_row(case_id, prec, M, K, N, metadata, metrics, stats, lanes,
+                                  sim_time, 'success'))
+            fc.flush()
+            dut._log.info(f"case {case_id} {prec}: {cycles} cycles, MAE {metrics['mae']:.6g}")
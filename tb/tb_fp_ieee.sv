@@ -0,0 +1,73 @@
+`timescale 1ns/1ps
+// Bit-for-bit check of the behavioral FP cores (fp_ieee.sv) against
+// host/fp_cmodel.py. Streams one vector per cycle from mem/fp_vectors.mem
+// (a, b, expected per line) and compares results in order.
+//   +define+FP_W=16|32  +define+FP_OP_MUL=0|1
+// Rounding/flush follow FP_BEHAV_RTZ / FP_BEHAV_FLUSH like the wrappers.
+import mp_types::*;
+
+module tb_fp_ieee;
+  `ifndef FP_W
+    `define FP_W 32
+  `endif
+  `ifndef FP_OP_MUL
+    `define FP_OP_MUL 0
+  `endif
+  localparam int W     = `FP_W;
+  localparam int EW    = (W == 16) ? 5 : 8;
+  localparam int MAXV  = 1 << 17;
+
+  logic clk = 0, rstn = 0; always #5 clk = ~clk;
+  logic         valid = 0, ready;
+  logic [W-1:0] a, b, y;
+  logic [W-1:0] vec [0:3*MAXV-1];
+  int           fd, nvec, sent, checked, errors;
+
+  generate if (`FP_OP_MUL) begin : g_mul
+    fp_ieee_mul #(.EW(EW), .MW(W-1-EW), .LATENCY(FP_BEHAV_LATENCY), .ROUND_RTZ(FP_BEHAV_RTZ),
+                  .FLUSH_SUBNORMAL(FP_BEHAV_FLUSH)) u_dut (
+      .clk(clk), .rstn(rstn), .valid(valid), .a(a), .b(b), .y(y), .ready(ready));
+  end else begin : g_add
+    fp_ieee_add #(.EW(EW), .MW(W-1-EW), .LATENCY(FP_BEHAV_LATENCY), .ROUND_RTZ(FP_BEHAV_RTZ),
+                  .FLUSH_SUBNORMAL(FP_BEHAV_FLUSH)) u_dut (
+      .clk(clk), .rstn(rstn), .valid(valid), .a(a), .b(b), .y(y), .ready(ready));
+  end endgenerate
+
+  // Results come back in issue order
+  always @(posedge clk) if (rstn && ready) begin
+    if (y !== vec[3*checked + 2]) begin
+      errors++;
+      if (errors <= 10)
+        $display("MISMATCH %0d: %h %s %h = %h, expected %h", checked, vec[3*checked],
+                 `FP_OP_MUL ? "*" : "+", vec[3*checked + 1], y, vec[3*checked + 2]);
+    end
+    checked++;
+  end
+
+  initial begin
+    nvec = 0;
+    fd = $fopen("mem/fp_vectors.mem", "r");
+    if (fd != 0) begin
+      while (nvec < MAXV && $fscanf(fd, "%h %h %h", vec[3*nvec], vec[3*nvec + 1], vec[3*nvec + 2]) == 3)
+        nvec++;
+      $fclose(fd);
+    end
+    if (nvec == 0) begin
+      $display("ERROR: no vectors in mem/fp_vectors.mem (run host/fp_cmodel.py)");
+      $finish;
+    end
+
+    repeat (3) @(negedge clk);
+    rstn = 1;
+    for (sent = 0; sent < nvec; sent++) begin
+      @(negedge clk);
+      valid = 1; a = vec[3*sent]; b = vec[3*sent + 1];
+    end
+    @(negedge clk) valid = 0;
+    wait (checked == nvec);
+    $display("FP_IEEE %s W=%0d vectors=%0d errors=%0d rtz=%0d flush=%0d: %s",
+             `FP_OP_MUL ? "mul" : "add", W, nvec, errors, FP_BEHAV_RTZ, FP_BEHAV_FLUSH,
+             errors == 0 ? "PASS" : "FAIL");
+    $finish;
+  end
+endmodule
@@ -25,39 +25,121 @@ module tb_top_gemm;
   `else
     localparam int Ncols = `N;
   `endif
+  `ifndef PIPELINED
+    localparam bit PIPELINED = 1'b0;
+  `else
+    localparam bit PIPELINED = `PIPELINED;
+  `endif
+  `ifndef LANES
+    localparam int LANES = 1;
+  `else
+    localparam int LANES = `LANES;
+  `endif
+  `ifndef INT8_PACK
+    localparam int INT8_PACK = 1;
+  `else
+    localparam int INT8_PACK = `INT8_PACK;
+  `endif
+  `ifndef FP16_PACK
+    localparam int FP16_PACK = 1;
+  `else
+    localparam int FP16_PACK = `FP16_PACK;
+  `endif
+  `ifndef TILE
+    localparam int TILE = 0;
+  `else
+    localparam int TILE = `TILE;
+  `endif
+  `ifndef B_COLMAJOR
+    localparam bit B_COLMAJOR = 1'b0;
+  `else
+    localparam bit B_COLMAJOR = `B_COLMAJOR;
+  `endif
+  `ifndef SPARSE
+    localparam bit SPARSE = 1'b0;
+  `else
+    localparam bit SPARSE = `SPARSE;
+  `endif
+  `ifndef DBUF
+    localparam bit DBUF = 1'b0;
+  `else
+    localparam bit DBUF = `DBUF;
+  `endif
+  // Back-to-back jobs; job n > 0 reads mem/A_<n>.mem, mem/B_<n>.mem and
+  // writes C_out_<n>.mem
+  `ifndef JOBS
+    localparam int JOBS = 1;
+  `else
+    localparam int JOBS = `JOBS;
+  `endif
+
+  localparam int PACK = PREC == PREC_INT8 ? INT8_PACK : is_fp16_input(PREC) ? FP16_PACK : 1;
+  localparam int KW   = (K + PACK - 1) / PACK;
+  // A words per row (2 entries per group of four k when SPARSE)
+  localparam int KA   = SPARSE ? 2 * ((K + 3) / 4) : KW;
 
   logic done;
+  logic        host_we_A = 1'b0, host_we_B = 1'b0;
+  logic [$clog2(65536)-1:0] host_addr = '0;
+  logic [31:0]              host_din = '0;
   logic        c_dbg_en;
+  logic        c_dbg_bank = 1'b0;
   logic [$clog2(65536)-1:0] c_dbg_addr;
   logic [31:0]              c_dbg_dout;
 
-  top_gemm #(.PREC(PREC)) dut (
+  top_gemm #(.PREC(PREC), .PIPELINED(PIPELINED), .LANES(LANES), .TILE(TILE),
+             .INT8_PACK(INT8_PACK), .FP16_PACK(FP16_PACK), .DBUF(DBUF),
+             .B_COLMAJOR(B_COLMAJOR), .SPARSE(SPARSE)) dut (
     .clk(clk), .rstn(rstn), .start(start), .M(M), .K(K), .Ncols(Ncols), .done(done),
-    .c_dbg_en(c_dbg_en), .c_dbg_addr(c_dbg_addr), .c_dbg_dout(c_dbg_dout)
+    .host_we_A(host_we_A), .host_we_B(host_we_B), .host_addr(host_addr), .host_din(host_din),
+    .c_dbg_en(c_dbg_en), .c_dbg_bank(c_dbg_bank), .c_dbg_addr(c_dbg_addr),
+    .c_dbg_dout(c_dbg_dout)
   );
 
-  integer fhex, r, c;
+  logic [31:0] a_img[65536], b_img[65536];
+  longint cyc = 0, start_cyc = 0, done_cyc = 0;
+  int     jobs_done = 0;
+  bit     started = 1'b0;
+  longint cycles;
 
-  initial begin
-    $display("TB start");
-    c_dbg_en = 1'b0; c_dbg_addr = '0;
-    repeat (5) @(posedge clk);
-    rstn = 1;
-    repeat (5) @(posedge clk);
-    start = 1; @(posedge clk); start = 0;
-    wait(done==1);
+  // Cycle stamps of the first start and the latest done
+  always @(posedge clk) begin
+    cyc <= cyc + 1;
+    if (start && !started) begin started <= 1'b1; start_cyc <= cyc; end
+    if (done) begin done_cyc <= cyc; jobs_done <= jobs_done + 1; end
+  end
+
+  // Host port: one A then B word per cycle into the bank the next job will
+  // use. Called and returns on a falling edge.
+  task automatic load_job(input int job);
+    string sfx = job == 0 ? "" : $sformatf("_%0d", job);
+    $readmemh({"mem/A", sfx, ".mem"}, a_img);
+    $readmemh({"mem/B", sfx, ".mem"}, b_img);
+    for (int w = 0; w < M*KA + KW*Ncols; w++) begin
+      host_we_A = w < M*KA;
+      host_we_B = w >= M*KA;
+      host_addr = w < M*KA ? w : w - M*KA;
+      host_din  = w < M*KA ? a_img[w] : b_img[w - M*KA];
+      @(negedge clk);
+    end
+    host_we_A = 1'b0; host_we_B = 1'b0;
+  endtask
 
-    // Dump C to HEX (mem/C_out.mem)
+  // Dump one job's C to HEX (mem/C_out.mem, C_out_<n>.mem for job n > 0).
+  // Called and returns on a falling edge.
+  task automatic dump_c(input int job);
+    string  fname = job == 0 ? "C_out.mem" : $sformatf("C_out_%0d.mem", job);
+    integer fhex;
     $display("Attempting to open output file...");
-    fhex = $fopen("C_out.mem","w");  // Try writing to current directory first
+    fhex = $fopen(fname,"w");  // Try writing to current directory first
     if (fhex == 0) begin
-      $display("ERROR: Could not open C_out.mem in current directory!");
-      $display("Trying: ../mem/C_out.mem");
-      fhex = $fopen("../mem/C_out.mem","w");
+      $display("ERROR: Could not open %0s in current directory!", fname);
+      $display("Trying: ../mem/%0s", fname);
+      fhex = $fopen({"../mem/", fname},"w");
       if (fhex == 0) begin
-        $display("ERROR: Could not open ../mem/C_out.mem!");
-        $display("Trying: mem/C_out.mem");
-        fhex = $fopen("mem/C_out.mem","w");
+        $display("ERROR: Could not open ../mem/%0s!", fname);
+        $display("Trying: mem/%0s", fname);
+        fhex = $fopen({"mem/", fname},"w");
         if (fhex == 0) begin
           $display("ERROR: Could not open any path!");
           $finish;
@@ -65,26 +147,55 @@ module tb_top_gemm;
       end
     end
     $display("File opened successfully, writing %0d x %0d matrix...", M, Ncols);
-
-    // Wait one extra cycle before first read to account for BRAM latency
+    c_dbg_bank = job % 2;
     c_dbg_en   = 1'b1;
-    c_dbg_addr = 0;
-    @(posedge clk);
 
-    for (r=0; r<M; r=r+1) begin
-      for (c=0; c<Ncols; c=c+1) begin
-        automatic int idx = r*Ncols + c;
-        // Set address for next read
-        if (idx < M*Ncols - 1) begin
-          c_dbg_addr = idx + 1;
-        end
-        @(posedge clk);
-        // Write current data (from previous address setup)
+    // One registered read per cycle: the address changes on the falling edge
+    // and the data is taken on the next falling edge, after the BRAM has
+    // registered it, so neither side races the rising edge
+    for (int r=0; r<M; r=r+1) begin
+      for (int c=0; c<Ncols; c=c+1) begin
+        c_dbg_addr = r*Ncols + c;
+        @(negedge clk);
         $fwrite(fhex, "%08x\n", c_dbg_dout);
       end
     end
     $fflush(fhex);  // Ensure data is written
     $fclose(fhex);
+    c_dbg_en = 1'b0;
+  endtask
+
+  initial begin
+    $display("TB start");
+    c_dbg_en = 1'b0; c_dbg_addr = '0;
+    repeat (5) @(posedge clk);
+    rstn = 1;
+    repeat (5) @(posedge clk);
+
+    // A single job without DBUF uses the A/B loaded by $readmemh in top_gemm.
+    // With DBUF, job n+1 loads and job n-1 drains while job n runs; without
+    // it, every job loads, runs and drains in turn. Stimulus changes on the
+    // falling edge, away from the edge the DUT samples.
+    @(negedge clk);
+    if (DBUF) load_job(0);
+    for (int job = 0; job < JOBS; job++) begin
+      if (!DBUF && JOBS > 1) load_job(job);
+      start = 1; @(negedge clk); start = 0;
+      if (DBUF) fork
+        if (job + 1 < JOBS) load_job(job + 1);
+        if (job > 0) dump_c(job - 1);
+      join
+      while (jobs_done <= job) @(negedge clk);
+      if (!DBUF) dump_c(job);
+    end
+    if (DBUF) dump_c(JOBS - 1);
+
+    // Clock edges from the first start pulse to the last done
+    cycles = done_cyc - start_cyc;
+    $display("CYCLES mode=%0s cycles=%0d macs=%0d macs_per_cycle=%0.3f tile=%0d lanes=%0d pack=%0d jobs=%0d dbuf=%0d sparse=%0d",
+             TILE > 0 ? "tiled" : PIPELINED ? "pipelined" : "sequential",
+             cycles, JOBS*M*K*Ncols, real'(JOBS*M*K*Ncols) / real'(cycles), TILE, LANES,
+             PACK, JOBS, DBUF, SPARSE);
 
     $display("Dump complete");
     $finish;